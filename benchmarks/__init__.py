@@ -0,0 +1,12 @@
+"""
+Benchmarks for oxypy
+
+Each `bench_*` module defines a `CASES` list of `(name, func, baseline)`
+tuples, where `func` exercises oxypy and `baseline` does the same work in
+plain Python (None checks, try/except, tuples)
+
+`importtime` times the package import in fresh interpreters and
+`memory` measures the footprint of each variant
+
+Run with `python -m benchmarks --help`
+"""
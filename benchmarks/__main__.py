@@ -0,0 +1,104 @@
+import argparse
+import json
+import sys
+
+from . import memory, runner
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the oxypy benchmarks or compare two saved runs",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="run the benchmarks (default)")
+    run.add_argument("-k", "--filter", default="", help="only run cases containing this text")
+    run.add_argument("-o", "--output", help="write the JSON report to this file")
+    run.add_argument("-r", "--repeat", type=int, default=5, help="timing repeats per case")
+
+    compare = commands.add_parser("compare", help="flag regressions between two reports")
+    compare.add_argument("old", help="baseline JSON report")
+    compare.add_argument("new", help="candidate JSON report")
+    compare.add_argument(
+        "-t", "--threshold", type=float, default=0.10,
+        help="relative slowdown that counts as a regression (default: 0.10)",
+    )
+    compare.add_argument(
+        "--ratio", action="store_true",
+        help="compare the oxypy/baseline ratio instead of raw times, "
+             "which is steadier across machines",
+    )
+
+    mem = commands.add_parser("memory", help="measure memory footprint against the budget")
+    mem.add_argument("-n", "--size", type=int, default=10_000_000, help="list size for peaks")
+    mem.add_argument("--sample", type=int, default=100_000, help="values per instance sample")
+    mem.add_argument("--rss", action="store_true", help="also measure peak RSS in a subprocess")
+    mem.add_argument("-o", "--output", help="write the JSON report to this file")
+    mem.add_argument("--check", action="store_true", help="exit with status 1 over budget")
+    mem.add_argument("--tolerance", type=float, default=0.05, help="allowed overshoot")
+    mem.add_argument(
+        "--update-budget", action="store_true",
+        help=f"record this run as the new budget in {memory.BUDGET_PATH}",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "memory":
+        return memory_main(args)
+
+    if args.command == "compare":
+        key = "ratio" if args.ratio else "ns"
+        regressions = runner.compare(
+            runner.load(args.old), runner.load(args.new), args.threshold, key
+        )
+
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name:40s} {old:10.2f} -> {new:10.2f} ({change:+.1%})")
+
+        if not regressions:
+            print(f"No regressions above {args.threshold:.0%}")
+
+        return 1 if regressions else 0
+
+    report = runner.run(
+        pattern=getattr(args, "filter", ""),
+        repeat=getattr(args, "repeat", 5),
+    )
+    output = getattr(args, "output", None)
+
+    if output:
+        runner.save(report, output)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    return 0
+
+
+def memory_main(args) -> int:
+    report = memory.measure(size=args.size, sample=args.sample, rss=args.rss)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.update_budget:
+        memory.save_budget(report)
+
+    if not args.check:
+        return 0
+
+    failures = memory.check(report, memory.load_budget(), args.tolerance)
+
+    for metric, name, measured, limit in failures:
+        print(f"OVER BUDGET {metric}.{name}: {measured:.2f} > {limit:.2f}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
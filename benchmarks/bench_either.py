@@ -0,0 +1,88 @@
+from oxypy import Either
+
+LEFT = Either.left(1)
+RIGHT = Either.right("one")
+
+LEFT_TUPLE = (0, 1)
+RIGHT_TUPLE = (1, "one")
+
+VALUE = 1
+
+EITHERS = [Either.left(i) if i % 2 else Either.right(str(i)) for i in range(100)]
+TUPLES = [(0, i) if i % 2 else (1, str(i)) for i in range(100)]
+
+
+def inc(x):
+    return x + 1
+
+
+def construct_left():
+    return Either.left(VALUE)
+
+
+def construct_left_baseline():
+    return (0, VALUE)
+
+
+def is_left():
+    return LEFT.is_left()
+
+
+def is_left_baseline():
+    return LEFT_TUPLE[0] == 0
+
+
+def unwrap_left():
+    return LEFT.unwrap_left()
+
+
+def unwrap_left_baseline():
+    return LEFT_TUPLE[1]
+
+
+def either():
+    return RIGHT.either(inc, len)
+
+
+def either_baseline():
+    tag, val = RIGHT_TUPLE
+
+    return inc(val) if tag == 0 else len(val)
+
+
+def either_sum():
+    return sum(e.either(inc, len) for e in EITHERS)
+
+
+def either_sum_baseline():
+    return sum(inc(val) if tag == 0 else len(val) for tag, val in TUPLES)
+
+
+def left_and_then_chain():
+    return (
+        LEFT.left_and_then(inc).left_and_then(inc).left_and_then(inc)
+        .left_and_then(inc).left_and_then(inc).left_and_then(inc)
+        .left_and_then(inc).left_and_then(inc).left_and_then(inc)
+        .left_and_then(inc)
+        .left_or(0)
+    )
+
+
+def left_and_then_chain_baseline():
+    tag, x = LEFT_TUPLE
+
+    for _ in range(10):
+        if tag == 0:
+            x = inc(x)
+
+    return x if tag == 0 else 0
+
+
+CASES = [
+    ("construct_left", construct_left, construct_left_baseline),
+    ("is_left", is_left, is_left_baseline),
+    ("unwrap_left", unwrap_left, unwrap_left_baseline),
+    ("either", either, either_baseline),
+    ("either_sum_100", either_sum, either_sum_baseline),
+    ("left_and_then_chain", left_and_then_chain, left_and_then_chain_baseline),
+]
@@ -0,0 +1,59 @@
+"""`match` statements against the predicate and `unwrap` style, Python 3.10+ only"""
+from oxypy import Err, Nothing, Ok, Option, Result, Some
+
+OK = Result.ok(1)
+ERR = Result.err("failed")
+SOME = Option.some(1)
+NONE = Option.none()
+
+
+def match_ok():
+    match OK:
+        case Ok(v):
+            return v
+        case Err(e):
+            return e
+
+
+def match_err():
+    match ERR:
+        case Ok(v):
+            return v
+        case Err(e):
+            return e
+
+
+def unwrap_ok_baseline():
+    if OK.is_ok():
+        return OK.unwrap()
+
+    return OK.unwrap_err()
+
+
+def unwrap_err_baseline():
+    if ERR.is_ok():
+        return ERR.unwrap()
+
+    return ERR.unwrap_err()
+
+
+def match_none():
+    match NONE:
+        case Some(v):
+            return v
+        case Nothing():
+            return 0
+
+
+def unwrap_none_baseline():
+    if NONE.is_some():
+        return NONE.unwrap()
+
+    return 0
+
+
+CASES = [
+    ("match_ok", match_ok, unwrap_ok_baseline),
+    ("match_err", match_err, unwrap_err_baseline),
+    ("match_none", match_none, unwrap_none_baseline),
+]
@@ -0,0 +1,189 @@
+from oxypy import Iter, Option
+
+SOME = Option.some(1)
+NONE = Option.none()
+
+VALUE = 1
+MISSING = None
+
+OPTIONS = [Option.some(i) if i % 4 else Option.none() for i in range(100)]
+VALUES = [i if i % 4 else None for i in range(100)]
+
+
+def inc(x):
+    return x + 1
+
+
+def inc_some(x):
+    return Option.some(x + 1)
+
+
+def construct_some():
+    return Option.some(VALUE)
+
+
+def construct_some_baseline():
+    return VALUE
+
+
+def construct_none():
+    return Option.none()
+
+
+def construct_none_baseline():
+    return MISSING
+
+
+def is_some():
+    return SOME.is_some()
+
+
+def is_some_baseline():
+    return VALUE is not None
+
+
+def unwrap():
+    return SOME.unwrap()
+
+
+def unwrap_baseline():
+    if VALUE is None:
+        raise ValueError
+
+    return VALUE
+
+
+def unwrap_or_none():
+    return NONE.unwrap_or(0)
+
+
+def unwrap_or_none_baseline():
+    return MISSING if MISSING is not None else 0
+
+
+def map_chain():
+    return (
+        SOME.map(inc).map(inc).map(inc).map(inc).map(inc)
+        .map(inc).map(inc).map(inc).map(inc).map(inc)
+        .unwrap_or(0)
+    )
+
+
+def map_chain_baseline():
+    x = VALUE
+
+    for _ in range(10):
+        if x is not None:
+            x = inc(x)
+
+    return x if x is not None else 0
+
+
+def map_chain_none():
+    return (
+        NONE.map(inc).map(inc).map(inc).map(inc).map(inc)
+        .map(inc).map(inc).map(inc).map(inc).map(inc)
+        .unwrap_or(0)
+    )
+
+
+def map_chain_none_baseline():
+    x = MISSING
+
+    for _ in range(10):
+        if x is not None:
+            x = inc(x)
+
+    return x if x is not None else 0
+
+
+MAP_PIPE = Option.pipe()
+
+for _ in range(10):
+    MAP_PIPE = MAP_PIPE.map(inc)
+
+RUN_MAP_PIPE = MAP_PIPE.compile()
+
+
+def pipe_map_chain():
+    return RUN_MAP_PIPE(SOME).unwrap_or(0)
+
+
+def and_then_chain():
+    return (
+        SOME.and_then(inc_some).and_then(inc_some).and_then(inc_some)
+        .and_then(inc_some).and_then(inc_some).and_then(inc_some)
+        .and_then(inc_some).and_then(inc_some).and_then(inc_some)
+        .and_then(inc_some)
+        .unwrap_or(0)
+    )
+
+
+def and_then_chain_baseline():
+    x = VALUE
+
+    for _ in range(10):
+        if x is None:
+            break
+
+        x = inc(x)
+
+    return x if x is not None else 0
+
+
+def iter_sum():
+    return sum(x for o in OPTIONS for x in o.iter())
+
+
+def iter_sum_baseline():
+    return sum(x for x in VALUES if x is not None)
+
+
+def dunder_iter_sum():
+    return sum(x for o in OPTIONS for x in o)
+
+
+def half_if_even(x):
+    return Option.some(x // 2) if x % 2 == 0 else NONE
+
+
+def filter_map_100():
+    return Iter(range(100)).filter_map(half_if_even).collect()
+
+
+def filter_map_100_baseline():
+    return [x // 2 for x in range(100) if x % 2 == 0]
+
+
+def sort_100():
+    return sorted(OPTIONS, key=Option.sort_key)
+
+
+def sort_100_baseline():
+    return sorted(VALUES, key=lambda x: (0,) if x is None else (1, x))
+
+
+def hash_100():
+    return len(set(OPTIONS))
+
+
+def hash_100_baseline():
+    return len(set(VALUES))
+
+
+CASES = [
+    ("construct_some", construct_some, construct_some_baseline),
+    ("construct_none", construct_none, construct_none_baseline),
+    ("is_some", is_some, is_some_baseline),
+    ("unwrap", unwrap, unwrap_baseline),
+    ("unwrap_or_none", unwrap_or_none, unwrap_or_none_baseline),
+    ("map_chain", map_chain, map_chain_baseline),
+    ("map_chain_none", map_chain_none, map_chain_none_baseline),
+    ("pipe_map_chain", pipe_map_chain, map_chain_baseline),
+    ("and_then_chain", and_then_chain, and_then_chain_baseline),
+    ("iter_sum_100", iter_sum, iter_sum_baseline),
+    ("dunder_iter_sum_100", dunder_iter_sum, iter_sum_baseline),
+    ("filter_map_100", filter_map_100, filter_map_100_baseline),
+    ("sort_100", sort_100, sort_100_baseline),
+    ("hash_100", hash_100, hash_100_baseline),
+]
@@ -0,0 +1,309 @@
+from functools import lru_cache
+
+from oxypy import Err, Result, cache_result, returns_result, set_origin_sampling, try_block
+
+OK = Result.ok(1)
+ERR = Result.err("failed")
+
+OK_TUPLE = (True, 1)
+ERR_TUPLE = (False, "failed")
+
+VALUE = 1
+ERROR = "failed"
+
+RESULTS = [Result.ok(i) if i % 4 else Result.err(i) for i in range(100)]
+TUPLES = [(True, i) if i % 4 else (False, i) for i in range(100)]
+
+RESULTS_OK = [Result.ok(i) for i in range(100)]
+TUPLES_OK = [(True, i) for i in range(100)]
+
+
+def inc(x):
+    return x + 1
+
+
+def checked_div(a, b):
+    if b == 0:
+        return Result.err("division by zero")
+
+    return Result.ok(a / b)
+
+
+def raising_div(a, b):
+    return a / b
+
+
+wrapped_div = returns_result(raising_div, catch=(ZeroDivisionError,))
+wrapped_div_no_tb = returns_result(raising_div, catch=(ZeroDivisionError,), traceback=False)
+
+
+def construct_ok():
+    return Result.ok(VALUE)
+
+
+def construct_ok_baseline():
+    return (True, VALUE)
+
+
+def construct_err():
+    return Result.err(ERROR)
+
+
+def construct_err_baseline():
+    return (False, ERROR)
+
+
+def is_ok():
+    return OK.is_ok()
+
+
+def is_ok_baseline():
+    return OK_TUPLE[0]
+
+
+def unwrap():
+    return OK.unwrap()
+
+
+def unwrap_baseline():
+    return OK_TUPLE[1]
+
+
+def unwrap_or_err():
+    return ERR.unwrap_or(0)
+
+
+def unwrap_or_err_baseline():
+    return ERR_TUPLE[1] if ERR_TUPLE[0] else 0
+
+
+def fallible_ok():
+    return checked_div(1, 2).unwrap_or(0.0)
+
+
+def fallible_ok_baseline():
+    try:
+        return raising_div(1, 2)
+    except ZeroDivisionError:
+        return 0.0
+
+
+def fallible_err():
+    return checked_div(1, 0).unwrap_or(0.0)
+
+
+def fallible_err_baseline():
+    try:
+        return raising_div(1, 0)
+    except ZeroDivisionError:
+        return 0.0
+
+
+def map_chain():
+    return (
+        OK.map(inc).map(inc).map(inc).map(inc).map(inc)
+        .map(inc).map(inc).map(inc).map(inc).map(inc)
+        .unwrap_or(0)
+    )
+
+
+def map_chain_baseline():
+    ok, x = OK_TUPLE
+
+    for _ in range(10):
+        if ok:
+            x = inc(x)
+
+    return x if ok else 0
+
+
+def map_chain_err():
+    return (
+        ERR.map(inc).map(inc).map(inc).map(inc).map(inc)
+        .map(inc).map(inc).map(inc).map(inc).map(inc)
+        .unwrap_or(0)
+    )
+
+
+def map_chain_err_baseline():
+    ok, x = ERR_TUPLE
+
+    for _ in range(10):
+        if ok:
+            x = inc(x)
+
+    return x if ok else 0
+
+
+def iter_sum():
+    return sum(x for r in RESULTS for x in r.iter())
+
+
+def iter_sum_baseline():
+    return sum(x for ok, x in TUPLES if ok)
+
+
+def collect_100():
+    return Result.collect(RESULTS_OK)
+
+
+def collect_100_baseline():
+    out = []
+
+    for ok, value in TUPLES_OK:
+        if not ok:
+            return ok, value
+
+        out.append(value)
+
+    return True, out
+
+
+def from_call_ok():
+    return Result.from_call(raising_div, 1, 2, catch=(ZeroDivisionError,))
+
+
+def from_call_err():
+    return Result.from_call(raising_div, 1, 0, catch=(ZeroDivisionError,))
+
+
+def decorated_ok():
+    return wrapped_div(1, 2)
+
+
+def decorated_err():
+    return wrapped_div(1, 0)
+
+
+def decorated_err_no_tb():
+    return wrapped_div_no_tb(1, 0)
+
+
+def try_except_ok_baseline():
+    try:
+        return (True, raising_div(1, 2))
+    except ZeroDivisionError as e:
+        return (False, e)
+
+
+def try_except_err_baseline():
+    try:
+        return (True, raising_div(1, 0))
+    except ZeroDivisionError as e:
+        return (False, e)
+
+
+# `try_block` is compared with the nested `and_then` chain it replaces
+@try_block
+def divide_thrice(a, b):
+    x = checked_div(a, b).unwrap_or_return()
+    y = checked_div(x, b).unwrap_or_return()
+
+    return checked_div(y, b)
+
+
+@try_block
+def divide_thrice_gen(a, b):
+    x = yield checked_div(a, b)
+    y = yield checked_div(x, b)
+
+    return checked_div(y, b)
+
+
+def divide_thrice_and_then(a, b):
+    return checked_div(a, b).and_then(
+        lambda x: checked_div(x, b).and_then(lambda y: checked_div(y, b))
+    )
+
+
+def try_block_ok():
+    return divide_thrice(8, 2)
+
+
+def try_block_err():
+    return divide_thrice(8, 0)
+
+
+def try_block_gen_ok():
+    return divide_thrice_gen(8, 2)
+
+
+def try_block_gen_err():
+    return divide_thrice_gen(8, 0)
+
+
+def and_then_ok_baseline():
+    return divide_thrice_and_then(8, 2)
+
+
+def and_then_err_baseline():
+    return divide_thrice_and_then(8, 0)
+
+
+cached_div = cache_result(checked_div)
+lru_div = lru_cache(maxsize=128)(checked_div)
+cached_div(1, 2)
+lru_div(1, 2)
+
+
+def cache_hit():
+    return cached_div(1, 2)
+
+
+def lru_cache_hit_baseline():
+    return lru_div(1, 2)
+
+
+# Origin sampling, each case builds 100 `Err` values at the given rate
+def errs_100(every, depth=1):
+    previous = set_origin_sampling(every, depth)
+
+    try:
+        for _ in range(100):
+            Err(ERROR)
+    finally:
+        set_origin_sampling(*previous)
+
+
+def errs_100_unsampled_baseline():
+    return errs_100(0)
+
+
+def errs_100_sample_1_in_100():
+    return errs_100(100)
+
+
+def errs_100_sample_all():
+    return errs_100(1)
+
+
+def errs_100_sample_all_depth_8():
+    return errs_100(1, 8)
+
+
+CASES = [
+    ("construct_ok", construct_ok, construct_ok_baseline),
+    ("construct_err", construct_err, construct_err_baseline),
+    ("is_ok", is_ok, is_ok_baseline),
+    ("unwrap", unwrap, unwrap_baseline),
+    ("unwrap_or_err", unwrap_or_err, unwrap_or_err_baseline),
+    ("fallible_ok", fallible_ok, fallible_ok_baseline),
+    ("fallible_err", fallible_err, fallible_err_baseline),
+    ("map_chain", map_chain, map_chain_baseline),
+    ("map_chain_err", map_chain_err, map_chain_err_baseline),
+    ("iter_sum_100", iter_sum, iter_sum_baseline),
+    ("collect_100", collect_100, collect_100_baseline),
+    ("from_call_ok", from_call_ok, try_except_ok_baseline),
+    ("from_call_err", from_call_err, try_except_err_baseline),
+    ("decorated_ok", decorated_ok, try_except_ok_baseline),
+    ("decorated_err", decorated_err, try_except_err_baseline),
+    ("decorated_err_no_tb", decorated_err_no_tb, try_except_err_baseline),
+    ("try_block_ok", try_block_ok, and_then_ok_baseline),
+    ("try_block_err", try_block_err, and_then_err_baseline),
+    ("try_block_gen_ok", try_block_gen_ok, and_then_ok_baseline),
+    ("try_block_gen_err", try_block_gen_err, and_then_err_baseline),
+    ("cache_hit", cache_hit, lru_cache_hit_baseline),
+    ("errs_100_sample_1_in_100", errs_100_sample_1_in_100, errs_100_unsampled_baseline),
+    ("errs_100_sample_all", errs_100_sample_all, errs_100_unsampled_baseline),
+    ("errs_100_sample_all_depth_8", errs_100_sample_all_depth_8, errs_100_unsampled_baseline),
+]
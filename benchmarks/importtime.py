@@ -0,0 +1,66 @@
+"""
+Import-time measurements, taken from `python -X importtime` in a fresh
+interpreter per run
+
+Each case reports the cumulative time of every top-level import made by
+its statement, so lazily loaded submodules are counted when the
+statement touches them
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+__all__ = ["CASES", "measure", "parse"]
+
+CASES = [
+    ("package", "import oxypy"),
+    ("option", "from oxypy import Option"),
+    ("result", "from oxypy import Result"),
+    ("either", "from oxypy import Either"),
+    ("all", "from oxypy import *"),
+]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse(stderr: str) -> float:
+    """
+    Returns the cumulative microseconds of the top-level imports from the
+    first `oxypy` import onwards, skipping interpreter startup
+    """
+    total = 0.0
+    started = False
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+
+        # Nested imports are indented below their importer
+        if name.startswith("  "):
+            continue
+
+        started = started or name.strip().startswith("oxypy")
+
+        if started:
+            total += int(cumulative)
+
+    return total
+
+
+def measure(statement: str, repeat: int = 5) -> float:
+    """Returns the best import time of `statement` in nanoseconds"""
+    best = float("inf")
+
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stderr
+
+        best = min(best, parse(stderr))
+
+    return best * 1000
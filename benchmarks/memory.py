@@ -0,0 +1,192 @@
+"""
+Memory footprint measurements for oxypy values
+
+Reports, per variant:
+
+- `bytes_per_instance`: traced bytes allocated per value
+- `gc_tracked_per_instance`: objects added to the GC's tracked set per value
+- `peak_bytes_per_element`: tracemalloc peak while building a list of
+  `size` values, divided by `size`
+- `peak_rss_bytes_per_element` (optional): growth of the peak RSS of a
+  fresh interpreter building the same list, divided by `size`
+
+`check` compares a report against `memory_budget.json` and returns every
+number that went past its budget
+"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from oxypy import Either, Nothing, Option, Result
+
+__all__ = ["BUDGET_PATH", "VARIANTS", "check", "load_budget", "measure", "save_budget"]
+
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "memory_budget.json")
+
+# A single shared payload, so only the wrappers themselves are measured
+PAYLOAD = object()
+
+VARIANTS: dict[str, Callable[[], object]] = {
+    "some": lambda: Option.some(PAYLOAD),
+    "none": lambda: Option.none(),
+    "none_owned": lambda: Nothing(),
+    "ok": lambda: Result.ok(PAYLOAD),
+    "err": lambda: Result.err(PAYLOAD),
+    "left": lambda: Either.left(PAYLOAD),
+    "right": lambda: Either.right(PAYLOAD),
+}
+
+
+def bytes_per_instance(make: Callable[[], object], n: int) -> float:
+    slots = [None] * n
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        for i in range(n):
+            slots[i] = make()
+
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return current / n
+
+
+def gc_tracked_per_instance(make: Callable[[], object], n: int) -> float:
+    slots = [None] * n
+    gc.collect()
+    gc.disable()
+    try:
+        before = len(gc.get_objects())
+
+        for i in range(n):
+            slots[i] = make()
+
+        after = len(gc.get_objects())
+    finally:
+        gc.enable()
+
+    return (after - before) / n
+
+
+def peak_bytes_per_element(make: Callable[[], object], size: int) -> float:
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        values = [make() for _ in range(size)]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del values
+
+    return peak / size
+
+
+_RSS_SCRIPT = """
+import resource, sys
+from benchmarks.memory import VARIANTS
+make = VARIANTS[sys.argv[1]]
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+values = [make() for _ in range(int(sys.argv[2]))]
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+"""
+
+
+def peak_rss_per_element(name: str, size: int) -> Optional[float]:
+    """Returns `None` where the `resource` module is unavailable (Windows)"""
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        return None
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", _RSS_SCRIPT, name, str(size)],
+        cwd=root, check=True, capture_output=True, text=True,
+    ).stdout
+
+    # ru_maxrss is in bytes on macOS and kilobytes everywhere else
+    scale = 1 if sys.platform == "darwin" else 1024
+
+    return int(output) * scale / size
+
+
+def measure(
+    size: int = 10_000_000,
+    sample: int = 100_000,
+    rss: bool = False,
+) -> dict[str, Any]:
+    """
+    Measures every variant, sampling `sample` values for the per-instance
+    numbers and building lists of `size` values for the peaks
+    """
+    report: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "size": size,
+        "bytes_per_instance": {},
+        "gc_tracked_per_instance": {},
+        "peak_bytes_per_element": {},
+    }
+
+    # Linux carries a process's peak RSS over into the children it spawns,
+    # so the subprocesses have to run before this process grows
+    if rss:
+        report["peak_rss_bytes_per_element"] = {
+            name: peak_rss_per_element(name, size) for name in VARIANTS
+        }
+
+    for name, make in VARIANTS.items():
+        report["bytes_per_instance"][name] = bytes_per_instance(make, sample)
+        report["gc_tracked_per_instance"][name] = gc_tracked_per_instance(make, sample)
+        report["peak_bytes_per_element"][name] = peak_bytes_per_element(make, size)
+
+    return report
+
+
+def load_budget(path: str = BUDGET_PATH) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_budget(report: dict[str, Any], path: str = BUDGET_PATH) -> None:
+    budget = {
+        metric: {name: round(value, 2) for name, value in report[metric].items()}
+        for metric in ("bytes_per_instance", "gc_tracked_per_instance", "peak_bytes_per_element")
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(budget, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def check(
+    report: dict[str, Any],
+    budget: dict[str, Any],
+    tolerance: float = 0.05,
+) -> list[tuple[str, str, float, float]]:
+    """
+    Returns `(metric, variant, measured, budget)` for every number that
+    exceeds its budget by more than `tolerance` (0.05 == 5%)
+
+    A fixed slack of 0.5 absorbs measurement noise on zero budgets, such
+    as the shared `None`, while still catching a single extra slot
+    """
+    failures = []
+
+    for metric, limits in budget.items():
+        for name, limit in limits.items():
+            measured = report.get(metric, {}).get(name)
+
+            if measured is not None and measured > limit * (1 + tolerance) + 0.5:
+                failures.append((metric, name, measured, limit))
+
+    return failures
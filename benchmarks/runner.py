@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import importlib
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Callable, Iterable, Optional
+
+import oxypy
+
+from . import importtime
+
+__all__ = ["MODULES", "compare", "load", "measure", "run", "save"]
+
+MODULES = (
+    "bench_option",
+    "bench_result",
+    "bench_either",
+) + (
+    # `match` statements are a syntax error before Python 3.10
+    ("bench_match",) if sys.version_info >= (3, 10) else ()
+)
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the best time of `repeat` runs of `func` in nanoseconds per call"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def cases(modules: Iterable[str] = MODULES) -> Iterable[tuple[str, Any, Any]]:
+    """Yields `(key, func, baseline)` for every case in the given modules"""
+    for module_name in modules:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        group = module_name.removeprefix("bench_")
+
+        for name, func, baseline in module.CASES:
+            yield f"{group}.{name}", func, baseline
+
+
+def run(
+    pattern: str = "",
+    repeat: int = 5,
+    modules: Iterable[str] = MODULES,
+    out=sys.stderr,
+) -> dict[str, Any]:
+    """Runs every case whose key contains `pattern` and returns a report"""
+    results: dict[str, dict[str, Optional[float]]] = {}
+
+    for key, func, baseline in cases(modules):
+        if pattern not in key:
+            continue
+
+        ns = measure(func, repeat)
+        baseline_ns = measure(baseline, repeat) if baseline is not None else None
+
+        results[key] = {
+            "ns": ns,
+            "baseline_ns": baseline_ns,
+            "ratio": ns / baseline_ns if baseline_ns else None,
+        }
+
+        print(format_row(key, results[key]), file=out)
+
+    for name, statement in importtime.CASES:
+        key = f"import.{name}"
+
+        if pattern not in key:
+            continue
+
+        results[key] = {
+            "ns": importtime.measure(statement, repeat),
+            "baseline_ns": None,
+            "ratio": None,
+        }
+
+        print(format_row(key, results[key]), file=out)
+
+    return {
+        "meta": {
+            "oxypy": oxypy.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def format_row(key: str, result: dict[str, Optional[float]]) -> str:
+    baseline_ns = result["baseline_ns"]
+    ratio = result["ratio"]
+
+    if baseline_ns is None or ratio is None:
+        return f"{key:40s} {result['ns']:10.1f} ns"
+
+    return f"{key:40s} {result['ns']:10.1f} ns {baseline_ns:10.1f} ns {ratio:6.2f}x"
+
+
+def save(report: dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    threshold: float = 0.10,
+    key: str = "ns",
+) -> list[tuple[str, float, float, float]]:
+    """
+    Returns `(name, old, new, change)` for every result present in both
+    reports whose value grew by more than `threshold` (0.10 == 10%)
+    """
+    regressions = []
+
+    for name, new_result in new["results"].items():
+        old_result = old["results"].get(name)
+
+        if old_result is None or old_result.get(key) is None or new_result.get(key) is None:
+            continue
+
+        change = new_result[key] / old_result[key] - 1
+
+        if change > threshold:
+            regressions.append((name, old_result[key], new_result[key], change))
+
+    return regressions
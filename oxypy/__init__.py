@@ -3,9 +3,15 @@
 """
 
 __all__ = [
-    "Either", "Option", "Result",
+    "Either", "Option", "Result", "NONE", "Iter",
+    "AsyncOption", "AsyncResult",
+    "Left", "Right", "Some", "Nothing", "Ok", "Err",
     "dbg", "Debug", "Default",
-    "panic", "PartialEq", "PartialOrd",
+    "panic", "Panic", "catch_panic", "set_panic_strategy", "set_origin_sampling",
+    "PartialEq", "PartialOrd",
+    "partition_results", "traverse", "par_map", "returns_result", "try_block",
+    "cache_result", "disk_cache", "DiskCache",
+    "first_ok", "join_all_settled", "try_join_all", "try_select",
 ]
 
 __version_info__ = (1, 1, 0)
@@ -13,11 +19,65 @@ __version__ = "1.1.0"
 __author__ = "Ross Morgan"
 __email__ = "rmorgan512@protonmail.ch"
 
-from .debug import Debug, dbg
-from .default import Default
-from .ops import PartialEq, PartialOrd
-from .panic import panic
+# Submodules are imported on first attribute access, so `import oxypy`
+# only pays for the types that are actually used
+_LAZY = {
+    "AsyncOption": "aio", "AsyncResult": "aio",
+    "first_ok": "aio", "join_all_settled": "aio", "try_join_all": "aio", "try_select": "aio",
+    "par_map": "parallel", "returns_result": "decorators", "try_block": "decorators",
+    "cache_result": "cache", "disk_cache": "diskcache", "DiskCache": "diskcache",
+    "partition_results": "collect", "traverse": "collect",
+    "Debug": "debug", "dbg": "debug",
+    "Default": "default",
+    "PartialEq": "ops", "PartialOrd": "ops",
+    "panic": "panic", "Panic": "panic",
+    "catch_panic": "panic", "set_panic_strategy": "panic",
+    "set_origin_sampling": "origin",
+    "Iter": "iter",
+    "Either": "either", "Left": "either", "Right": "either",
+    "NONE": "option", "Nothing": "option", "Option": "option", "Some": "option",
+    "Err": "result", "Ok": "result", "Result": "result",
+    # Not in `__all__`, since they need the optional NumPy dependency
+    "OptionArray": "array", "ResultArray": "array",
+    "SharedOptionArray": "shared", "SharedResultArray": "shared",
+}
 
-from .either import Either
-from .option import Option
-from .result import Result
+# Avoids importing `typing` just for `typing.TYPE_CHECKING`
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .aio import (
+        AsyncOption, AsyncResult, first_ok, join_all_settled, try_join_all, try_select,
+    )
+    from .array import OptionArray, ResultArray  # noqa: F401
+    from .cache import cache_result
+    from .collect import partition_results, traverse
+    from .debug import Debug, dbg
+    from .decorators import returns_result, try_block
+    from .default import Default
+    from .diskcache import DiskCache, disk_cache
+    from .either import Either, Left, Right
+    from .iter import Iter
+    from .ops import PartialEq, PartialOrd
+    from .option import NONE, Nothing, Option, Some
+    from .origin import set_origin_sampling
+    from .panic import Panic, catch_panic, panic, set_panic_strategy
+    from .parallel import par_map
+    from .result import Err, Ok, Result
+    from .shared import SharedOptionArray, SharedResultArray  # noqa: F401
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=(name,)), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
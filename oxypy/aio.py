@@ -0,0 +1,395 @@
+"""
+Awaitable `Result` and `Option` chains for asyncio code
+
+`AsyncResult` and `AsyncOption` wrap an awaitable of a `Result` or
+`Option` and record combinator steps, each of which may be a plain
+function or an `async def` function. Awaiting the wrapper runs every
+step inside one coroutine, so there is no task or extra coroutine per
+step, and a sync step costs about as much as the scalar combinator
+
+A step's return value is awaited whenever it is awaitable, so a lambda
+calling an `async def`, a `functools.partial` of one or an object with an
+async `__call__` work too. A bind step such as `and_then` must give a
+`Result` for `AsyncResult` or an `Option` for `AsyncOption`, otherwise
+`TypeError` is raised
+
+Like a coroutine, a wrapper can only be awaited once
+
+`try_join_all`, `join_all_settled`, `try_select` and `first_ok` run many
+`Result` awaitables concurrently, with an optional limit on how many are
+in flight. Awaitables are started lazily from the iterable, and anything
+still running is cancelled and awaited before the function returns
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from inspect import isawaitable
+from typing import (
+    Any, Awaitable, Callable, Generator, Generic, Iterable, Optional, TypeVar, Union,
+)
+
+from .option import NONE, Nothing, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = [
+    "AsyncOption", "AsyncResult",
+    "first_ok", "join_all_settled", "try_join_all", "try_select",
+]
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+# Step actions, besides wrapping the return value in a variant class
+_BIND = 0
+_INSPECT = 1
+_FILTER = 2
+
+
+_RESULT = (Ok, Err)
+_OPTION = (Some, Nothing)
+
+
+async def _run(
+    source: Any,
+    is_value: bool,
+    steps: tuple[tuple[Any, ...], ...],
+    variants: tuple[type, ...],
+) -> Any:
+    r = source if is_value else await source
+
+    for on, action, f in steps:
+        if r.__class__ is not on:
+            continue
+
+        v = f(r._value) if on is not Nothing else f()
+
+        # `hasattr` rules out plain values far quicker than `isawaitable`
+        if hasattr(v, "__await__") and isawaitable(v):
+            v = await v
+
+        if action is _BIND:
+            if v.__class__ not in variants:
+                kind = "a Result" if variants is _RESULT else "an Option"
+                raise TypeError(f"Expected {kind} from {f!r}, got {v.__class__.__name__!r}")
+
+            r = v
+        elif action is _INSPECT:
+            pass
+        elif action is _FILTER:
+            if not v:
+                r = NONE
+        else:
+            r = action(v)
+
+    return r
+
+
+async def _catch(aw: Awaitable[T], catch: tuple[type[BaseException], ...]) -> Result[T, Any]:
+    try:
+        return Ok(await aw)
+    except catch as e:
+        return Err(e)
+
+
+class AsyncResult(Generic[T, E]):
+    """
+    An awaitable `Result` with async-aware combinators
+
+    Wraps an awaitable resolving to a `Result`, or a `Result` itself
+    """
+
+    __slots__ = ("_source", "_is_value", "_steps")
+
+    _source: Any
+    _is_value: bool
+    _steps: tuple[tuple[Any, ...], ...]
+
+    def __init__(
+        self,
+        source: Union[Awaitable[Result[T, E]], Result[T, E]],
+    ) -> None:
+        self._source = source
+        # Cheaper than `isinstance`, which goes through the `Debug` protocol
+        self._is_value = source.__class__ in _RESULT
+        self._steps = ()
+
+    def __repr__(self) -> str:
+        return f"AsyncResult({self._source!r})"
+
+    def __await__(self) -> Generator[Any, None, Result[T, E]]:
+        return _run(self._source, self._is_value, self._steps, _RESULT).__await__()
+
+    def _then(self, on: type, action: Any, f: Callable[..., Any]) -> AsyncResult[Any, Any]:
+        new = AsyncResult.__new__(AsyncResult)
+        new._source = self._source
+        new._is_value = self._is_value
+        new._steps = self._steps + ((on, action, f),)
+
+        return new
+
+    @classmethod
+    def from_awaitable(
+        cls,
+        aw: Awaitable[T],
+        catch: tuple[type[BaseException], ...] = (Exception,),
+    ) -> AsyncResult[T, Any]:
+        """
+        Awaits a plain awaitable, its value becomes `Ok` and an exception
+        of one of the `catch` types becomes `Err`
+        """
+        return cls(_catch(aw, catch))
+
+    def map(self, f: Callable[[T], Any]) -> AsyncResult[Any, E]:
+        """If the result is `Ok`, transforms the contained value, `f` may be async"""
+        return self._then(Ok, Ok, f)
+
+    def map_err(self, f: Callable[[E], Any]) -> AsyncResult[T, Any]:
+        """If the result is `Err`, transforms the contained value, `f` may be async"""
+        return self._then(Err, Err, f)
+
+    def and_then(self, f: Callable[[T], Any]) -> AsyncResult[Any, E]:
+        """If the result is `Ok`, replaces it with the `Result` from `f`, which may be async"""
+        return self._then(Ok, _BIND, f)
+
+    def or_else(self, f: Callable[[E], Any]) -> AsyncResult[T, Any]:
+        """If the result is `Err`, replaces it with the `Result` from `f`, which may be async"""
+        return self._then(Err, _BIND, f)
+
+    def inspect(self, f: Callable[[T], Any]) -> AsyncResult[T, E]:
+        """If the result is `Ok`, calls `f` with the contained value, `f` may be async"""
+        return self._then(Ok, _INSPECT, f)
+
+    def inspect_err(self, f: Callable[[E], Any]) -> AsyncResult[T, E]:
+        """If the result is `Err`, calls `f` with the contained value, `f` may be async"""
+        return self._then(Err, _INSPECT, f)
+
+
+class AsyncOption(Generic[T]):
+    """
+    An awaitable `Option` with async-aware combinators
+
+    Wraps an awaitable resolving to an `Option`, or an `Option` itself
+    """
+
+    __slots__ = ("_source", "_is_value", "_steps")
+
+    _source: Any
+    _is_value: bool
+    _steps: tuple[tuple[Any, ...], ...]
+
+    def __init__(
+        self,
+        source: Union[Awaitable[Option[T]], Option[T]],
+    ) -> None:
+        self._source = source
+        # Cheaper than `isinstance`, which goes through the `Debug` protocol
+        self._is_value = source.__class__ in _OPTION
+        self._steps = ()
+
+    def __repr__(self) -> str:
+        return f"AsyncOption({self._source!r})"
+
+    def __await__(self) -> Generator[Any, None, Option[T]]:
+        return _run(self._source, self._is_value, self._steps, _OPTION).__await__()
+
+    def _then(self, on: type, action: Any, f: Callable[..., Any]) -> AsyncOption[Any]:
+        new = AsyncOption.__new__(AsyncOption)
+        new._source = self._source
+        new._is_value = self._is_value
+        new._steps = self._steps + ((on, action, f),)
+
+        return new
+
+    def map(self, f: Callable[[T], Any]) -> AsyncOption[Any]:
+        """If the option is `Some`, transforms the contained value, `f` may be async"""
+        return self._then(Some, Some, f)
+
+    def and_then(self, f: Callable[[T], Any]) -> AsyncOption[Any]:
+        """If the option is `Some`, replaces it with the `Option` from `f`, which may be async"""
+        return self._then(Some, _BIND, f)
+
+    def filter(self, f: Callable[[T], Any]) -> AsyncOption[T]:
+        """If the option is `Some` and `f` returns false, replaces it with `None`"""
+        return self._then(Some, _FILTER, f)
+
+    def or_else(self, f: Callable[[], Any]) -> AsyncOption[T]:
+        """If the option is `None`, replaces it with the `Option` from `f`, which may be async"""
+        return self._then(Nothing, _BIND, f)
+
+    def inspect(self, f: Callable[[T], Any]) -> AsyncOption[T]:
+        """If the option is `Some`, calls `f` with the contained value, `f` may be async"""
+        return self._then(Some, _INSPECT, f)
+
+
+async def _drive(
+    aws: Iterable[Awaitable[Any]],
+    limit: Optional[int],
+    on_done: Callable[[int, Any], bool],
+) -> bool:
+    """
+    Runs the awaitables with at most `limit` in flight, calling `on_done`
+    with the index and task of each as it finishes
+
+    Returns `True` as soon as `on_done` does, after cancelling the rest
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+    loop = asyncio.get_running_loop()
+    pending: dict[Any, int] = {}
+    finished: deque[Any] = deque()
+    waiter: Any = None
+    source = enumerate(aws)
+
+    def wake(task: Any) -> None:
+        finished.append(task)
+
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def fill() -> None:
+        while limit is None or len(pending) < limit:
+            for i, aw in source:
+                task = asyncio.ensure_future(aw)
+                task.add_done_callback(wake)
+                pending[task] = i
+                break
+            else:
+                return
+
+    try:
+        fill()
+
+        while pending:
+            if not finished:
+                waiter = loop.create_future()
+                await waiter
+                waiter = None
+
+            while finished:
+                task = finished.popleft()
+
+                if on_done(pending.pop(task), task):
+                    return True
+
+            fill()
+
+        return False
+    finally:
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            await asyncio.wait(pending)
+
+
+def _result(task: Any) -> Result[Any, Any]:
+    r = task.result()
+
+    if r.__class__ is not Ok and r.__class__ is not Err:
+        raise TypeError(f"Expected a Result, got {r.__class__.__name__!r}")
+
+    return r
+
+
+async def try_join_all(
+    aws: Iterable[Awaitable[Result[T, E]]],
+    limit: Optional[int] = None,
+) -> Result[list[T], E]:
+    """
+    If every awaitable gives `Ok`, returns `Ok` of the values in input order
+
+    Otherwise returns the first `Err` to finish and cancels the rest.
+    Exceptions also cancel the rest and are raised
+    """
+    values: dict[int, T] = {}
+    failed: list[Result[Any, E]] = []
+
+    def on_done(i: int, task: Any) -> bool:
+        r = _result(task)
+
+        if r.__class__ is Ok:
+            values[i] = r._value
+            return False
+
+        failed.append(r)
+        return True
+
+    if await _drive(aws, limit, on_done):
+        return failed[0]
+
+    return Ok([values[i] for i in range(len(values))])
+
+
+async def join_all_settled(
+    aws: Iterable[Awaitable[Any]],
+    limit: Optional[int] = None,
+) -> list[Result[Any, Any]]:
+    """
+    Waits for every awaitable and returns a `Result` for each in input order
+
+    A returned `Result` is kept as it is, any other value becomes `Ok`
+    and an exception becomes `Err`
+    """
+    results: dict[int, Result[Any, Any]] = {}
+
+    def on_done(i: int, task: Any) -> bool:
+        if task.cancelled():
+            results[i] = Err(asyncio.CancelledError())
+        elif task.exception() is not None:
+            results[i] = Err(task.exception())
+        else:
+            r = task.result()
+            results[i] = r if r.__class__ is Ok or r.__class__ is Err else Ok(r)
+
+        return False
+
+    await _drive(aws, limit, on_done)
+
+    return [results[i] for i in range(len(results))]
+
+
+async def try_select(
+    aws: Iterable[Awaitable[Result[T, E]]],
+    limit: Optional[int] = None,
+) -> Result[T, E]:
+    """Returns the first `Result` to finish, `Ok` or `Err`, and cancels the rest"""
+    first: list[Result[T, E]] = []
+
+    def on_done(i: int, task: Any) -> bool:
+        first.append(_result(task))
+        return True
+
+    if not await _drive(aws, limit, on_done):
+        raise ValueError("try_select() got no awaitables")
+
+    return first[0]
+
+
+async def first_ok(
+    aws: Iterable[Awaitable[Result[T, E]]],
+    limit: Optional[int] = None,
+) -> Result[T, list[E]]:
+    """
+    Returns the first `Ok` to finish and cancels the rest
+
+    If every awaitable gives `Err`, returns `Err` of the errors in input order
+    """
+    found: list[Result[T, Any]] = []
+    errors: dict[int, E] = {}
+
+    def on_done(i: int, task: Any) -> bool:
+        r = _result(task)
+
+        if r.__class__ is Ok:
+            found.append(r)
+            return True
+
+        errors[i] = r._value
+        return False
+
+    if await _drive(aws, limit, on_done):
+        return found[0]
+
+    return Err([errors[i] for i in range(len(errors))])
@@ -0,0 +1,385 @@
+"""
+Columnar `Option` and `Result` arrays backed by NumPy
+
+`OptionArray` stores a values buffer and a validity mask, `ResultArray`
+stores an `Ok` column, an `Err` column and a tag mask, so batches of
+millions of elements cost a few bytes each instead of an object each
+
+The methods mirror the scalar API but take vectorized callables, which
+are called once with whole columns. Slots without a value (`None`
+slots, or the other column of a `Result`) hold unspecified data
+
+Requires NumPy, installed with the `numpy` extra
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "oxypy.array requires NumPy, install it with `pip install oxypy[numpy]`"
+    ) from e
+
+from .option import NONE, Option, Some
+from .panic import panic
+from .result import Err, Ok, Result
+
+__all__ = ["OptionArray", "ResultArray"]
+
+Column = Callable[..., Any]
+
+
+def _as_mask(mask: Any, shape: tuple[int, ...]) -> np.ndarray:
+    mask = np.asarray(mask, dtype=np.bool_)
+
+    if mask.shape != shape:
+        raise ValueError(f"Mask shape {mask.shape} does not match values shape {shape}")
+
+    return mask
+
+
+def _as_column(values: Any, dtype: Any = None) -> np.ndarray:
+    values = np.asarray(values, dtype=dtype)
+
+    if values.ndim != 1:
+        raise ValueError(f"Expected a 1-D array, got {values.ndim}-D")
+
+    return values
+
+
+def _fill(values: list[Any], present: list[bool], dtype: Any) -> np.ndarray:
+    # Empty slots borrow a present value so NumPy infers the column dtype
+    fill = next((v for v, p in zip(values, present) if p), 0)
+
+    return _as_column([v if p else fill for v, p in zip(values, present)], dtype)
+
+
+def _apply(f: Column, values: np.ndarray, where: np.ndarray) -> np.ndarray:
+    # Ufuncs skip empty slots, so they never see fill values such as 0 in `log`
+    if isinstance(f, np.ufunc) and f.nout == 1:
+        out = f(values, out=None, where=where)
+    else:
+        out = np.asarray(f(values))
+
+    if out.shape != values.shape:
+        raise ValueError(f"Function returned shape {out.shape}, expected {values.shape}")
+
+    return out
+
+
+class OptionArray:
+    """
+    A 1-D array of `Option` values stored as a values buffer and a mask
+    which is `True` where the element is `Some`
+
+    Arrays passed in are used without copying, so writes to them are
+    visible through the `OptionArray`
+    """
+
+    __slots__ = ("_values", "_mask")
+
+    _values: np.ndarray
+    _mask: np.ndarray
+
+    def __init__(self, values: Any, mask: Any = None) -> None:
+        self._values = _as_column(values)
+
+        if mask is None:
+            mask = np.ones(self._values.shape, dtype=np.bool_)
+
+        self._mask = _as_mask(mask, self._values.shape)
+
+    def __repr__(self) -> str:
+        return f"OptionArray({self.to_options()!r})"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Option[Any]]:
+        return iter(self.to_options())
+
+    def __getitem__(self, index: Any) -> Union[Option[Any], OptionArray]:
+        if isinstance(index, (int, np.integer)):
+            return Some(self._values[index].item()) if self._mask[index] else NONE
+
+        return OptionArray(self._values[index], self._mask[index])
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values buffer, unspecified where the element is `None`"""
+        return self._values
+
+    @property
+    def mask(self) -> np.ndarray:
+        """The validity mask, `True` where the element is `Some`"""
+        return self._mask
+
+    # conversion
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option[Any]], dtype: Any = None) -> OptionArray:
+        """Creates an array from scalar `Option`s"""
+        options = list(options)
+        present = [o.__class__ is Some for o in options]
+        values = [o._value if p else None for o, p in zip(options, present)]
+
+        return cls(_fill(values, present, dtype), present)
+
+    @classmethod
+    def from_masked(cls, array: np.ma.MaskedArray) -> OptionArray:
+        """
+        Creates an array from a NumPy masked array, masked elements become `None`
+
+        The values buffer is shared with the masked array
+        """
+        return cls(np.ma.getdata(array), ~np.ma.getmaskarray(array))
+
+    def to_options(self) -> list[Option[Any]]:
+        """Converts to a list of scalar `Option`s holding Python scalars"""
+        return [
+            Some(v) if p else NONE
+            for v, p in zip(self._values.tolist(), self._mask.tolist())
+        ]
+
+    def to_masked(self) -> np.ma.MaskedArray:
+        """
+        Converts to a NumPy masked array with `None` elements masked
+
+        The values buffer is shared with the masked array
+        """
+        return np.ma.MaskedArray(self._values, mask=~self._mask, copy=False)
+
+    # some or none
+
+    def is_some(self) -> np.ndarray:
+        """Returns a boolean array, `True` where the element is `Some`"""
+        return self._mask.copy()
+
+    def is_none(self) -> np.ndarray:
+        """Returns a boolean array, `True` where the element is `None`"""
+        return ~self._mask
+
+    # unwrap
+
+    def unwrap(self) -> np.ndarray:
+        """
+        If every element is `Some`, returns the values
+
+        If any element is `None`, panics
+        """
+        if not self._mask.all():
+            panic(msg="Called `OptionArray.unwrap` on an array containing `None`")
+
+        return self._values
+
+    def unwrap_or(self, val: Any) -> np.ndarray:
+        """Returns the values, with `None` elements replaced by the value"""
+        return np.where(self._mask, self._values, val)
+
+    # map
+
+    def map(self, f: Column) -> OptionArray:
+        """
+        Transforms the `Some` elements with a vectorized function
+
+        Ufuncs are only evaluated on `Some` elements, other functions are
+        called once with the whole values buffer
+        """
+        return OptionArray(_apply(f, self._values, self._mask), self._mask)
+
+    def filter(self, f: Column) -> OptionArray:
+        """Replaces `Some` elements with `None` where the vectorized predicate fails"""
+        return OptionArray(self._values, self._mask & np.asarray(f(self._values), dtype=np.bool_))
+
+    def zip_with(self, other: OptionArray, f: Column) -> OptionArray:
+        """
+        Combines two arrays element-wise with a vectorized function
+
+        The result is `Some` where both elements are `Some`
+        """
+        mask = self._mask & other._mask
+
+        if isinstance(f, np.ufunc) and f.nin == 2 and f.nout == 1:
+            values = f(self._values, other._values, out=None, where=mask)
+        else:
+            values = np.asarray(f(self._values, other._values))
+
+        return OptionArray(values, mask)
+
+    # result
+
+    def ok_or(self, err: Any) -> ResultArray:
+        """
+        Transforms into a `ResultArray`, `Some` elements become `Ok` and
+        `None` elements become `Err` with the value, which may be an array
+        """
+        return ResultArray(
+            self._values,
+            np.broadcast_to(np.asarray(err), self._values.shape),
+            self._mask,
+        )
+
+
+class ResultArray:
+    """
+    A 1-D array of `Result` values stored as an `Ok` column, an `Err`
+    column and a tag mask which is `True` where the element is `Ok`
+
+    Arrays passed in are used without copying, so writes to them are
+    visible through the `ResultArray`
+    """
+
+    __slots__ = ("_ok", "_err", "_is_ok")
+
+    _ok: np.ndarray
+    _err: np.ndarray
+    _is_ok: np.ndarray
+
+    def __init__(self, ok: Any, err: Any, is_ok: Any) -> None:
+        self._ok = _as_column(ok)
+        self._err = _as_column(err)
+
+        if self._err.shape != self._ok.shape:
+            raise ValueError(
+                f"Err shape {self._err.shape} does not match ok shape {self._ok.shape}"
+            )
+
+        self._is_ok = _as_mask(is_ok, self._ok.shape)
+
+    def __repr__(self) -> str:
+        return f"ResultArray({self.to_results()!r})"
+
+    def __len__(self) -> int:
+        return len(self._ok)
+
+    def __iter__(self) -> Iterator[Result[Any, Any]]:
+        return iter(self.to_results())
+
+    def __getitem__(self, index: Any) -> Union[Result[Any, Any], ResultArray]:
+        if isinstance(index, (int, np.integer)):
+            if self._is_ok[index]:
+                return Ok(self._ok[index].item())
+
+            return Err(self._err[index].item())
+
+        return ResultArray(self._ok[index], self._err[index], self._is_ok[index])
+
+    @property
+    def ok_values(self) -> np.ndarray:
+        """The `Ok` column, unspecified where the element is `Err`"""
+        return self._ok
+
+    @property
+    def err_values(self) -> np.ndarray:
+        """The `Err` column, unspecified where the element is `Ok`"""
+        return self._err
+
+    @property
+    def mask(self) -> np.ndarray:
+        """The tag mask, `True` where the element is `Ok`"""
+        return self._is_ok
+
+    # conversion
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[Result[Any, Any]],
+        ok_dtype: Any = None,
+        err_dtype: Any = None,
+    ) -> ResultArray:
+        """Creates an array from scalar `Result`s"""
+        results = list(results)
+        is_ok = [r.__class__ is Ok for r in results]
+        is_err = [not p for p in is_ok]
+        values = [r._value for r in results]
+
+        return cls(
+            _fill(values, is_ok, ok_dtype),
+            _fill(values, is_err, err_dtype),
+            is_ok,
+        )
+
+    @classmethod
+    def from_masked(cls, array: np.ma.MaskedArray, err: Any) -> ResultArray:
+        """
+        Creates an array from a NumPy masked array, masked elements become
+        `Err` with the value, which may be an array
+
+        The `Ok` column is shared with the masked array
+        """
+        ok = np.ma.getdata(array)
+
+        return cls(ok, np.broadcast_to(np.asarray(err), ok.shape), ~np.ma.getmaskarray(array))
+
+    def to_results(self) -> list[Result[Any, Any]]:
+        """Converts to a list of scalar `Result`s holding Python scalars"""
+        return [
+            Ok(o) if p else Err(e)
+            for o, e, p in zip(self._ok.tolist(), self._err.tolist(), self._is_ok.tolist())
+        ]
+
+    def to_masked(self) -> np.ma.MaskedArray:
+        """
+        Converts the `Ok` column to a NumPy masked array with `Err` elements masked
+
+        The `Ok` column is shared with the masked array
+        """
+        return np.ma.MaskedArray(self._ok, mask=~self._is_ok, copy=False)
+
+    # ok or err
+
+    def is_ok(self) -> np.ndarray:
+        """Returns a boolean array, `True` where the element is `Ok`"""
+        return self._is_ok.copy()
+
+    def is_err(self) -> np.ndarray:
+        """Returns a boolean array, `True` where the element is `Err`"""
+        return ~self._is_ok
+
+    def ok(self) -> OptionArray:
+        """Transforms into an `OptionArray` of the `Ok` elements"""
+        return OptionArray(self._ok, self._is_ok)
+
+    def err(self) -> OptionArray:
+        """Transforms into an `OptionArray` of the `Err` elements"""
+        return OptionArray(self._err, ~self._is_ok)
+
+    # unwrap
+
+    def unwrap(self) -> np.ndarray:
+        """
+        If every element is `Ok`, returns the `Ok` column
+
+        If any element is `Err`, panics
+        """
+        if not self._is_ok.all():
+            panic(msg="Called `ResultArray.unwrap` on an array containing `Err`")
+
+        return self._ok
+
+    def unwrap_or(self, val: Any) -> np.ndarray:
+        """Returns the `Ok` column, with `Err` elements replaced by the value"""
+        return np.where(self._is_ok, self._ok, val)
+
+    # map
+
+    def map(self, f: Column) -> ResultArray:
+        """
+        Transforms the `Ok` elements with a vectorized function, like
+        `OptionArray.map`
+        """
+        return ResultArray(_apply(f, self._ok, self._is_ok), self._err, self._is_ok)
+
+    def map_err(self, f: Column) -> ResultArray:
+        """
+        Transforms the `Err` elements with a vectorized function, like
+        `OptionArray.map`
+        """
+        return ResultArray(self._ok, _apply(f, self._err, ~self._is_ok), self._is_ok)
+
+    def partition(self) -> tuple[np.ndarray, np.ndarray]:
+        """Splits into an array of the `Ok` values and an array of the `Err` values"""
+        return self._ok[self._is_ok], self._err[~self._is_ok]
@@ -0,0 +1,277 @@
+"""
+Memoizing functions that return `Result` or `Option`
+
+`cache_result` keeps successes (`Ok`, `Some` and plain values) and
+failures (`Err`, and `None` unless `cache_none=False`) in two separate
+LRU caches, each with its own size and time to live. A short `err_ttl`
+gives cheap negative caching in front of a slow backing store without
+pinning failures forever
+
+Concurrent misses on the same arguments are de-duplicated, one thread
+calls the function and the others wait for its value. If the call
+raises, the exception propagates in that thread and the waiting threads
+try again themselves
+
+Hits don't take the lock, so the hit count can come out slightly low
+when many threads hit at once
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import update_wrapper
+from inspect import iscoroutinefunction
+from time import monotonic
+from types import MethodType
+from typing import Any, Callable, NamedTuple, Optional
+
+from .option import Nothing
+from .result import Err
+from .utils import NULL
+
+__all__ = ["CacheInfo", "CachedFunction", "cache_result"]
+
+# Separates positional from keyword arguments in cache keys
+_KWD_MARK = (object(),)
+# Default of `err_maxsize`, so an explicit `None` can mean unbounded
+_MAXSIZE: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `cache_result` function"""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    ok_size: int
+    err_size: int
+
+
+class _Flight:
+    # A call in progress, shared with the threads waiting on its value
+    __slots__ = ("done", "value", "failed", "owner")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.failed = False
+        self.owner = threading.get_ident()
+
+
+class CachedFunction:
+    """A function wrapped by `cache_result`"""
+
+    def __init__(
+        self,
+        f: Callable[..., Any],
+        maxsize: Optional[int],
+        err_maxsize: Optional[int],
+        ok_ttl: Optional[float],
+        err_ttl: Optional[float],
+        cache_none: bool,
+    ) -> None:
+        self.__wrapped__ = f
+        self._maxsize = maxsize
+        self._err_maxsize = err_maxsize
+        self._ok_ttl = ok_ttl
+        self._err_ttl = err_ttl
+        self._cache_none = cache_none
+        # Values are `(value, expiry)`, with `expiry` `None` if it never expires
+        self._ok: OrderedDict[Any, tuple[Any, Optional[float]]] = OrderedDict()
+        self._err: OrderedDict[Any, tuple[Any, Optional[float]]] = OrderedDict()
+        self._flights: dict[Any, _Flight] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+        update_wrapper(self, f)
+
+    def __repr__(self) -> str:
+        return f"<cache_result {self.__wrapped__!r}>"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # Caches methods like a plain function, with `self` part of the key
+        if instance is None:
+            return self
+
+        return MethodType(self, instance)
+
+    def _lookup(self, key: Any, now: float) -> Any:
+        for store in (self._ok, self._err):
+            entry = store.get(key)
+
+            if entry is None:
+                continue
+
+            if entry[1] is not None and entry[1] <= now:
+                del store[key]
+                self._expirations += 1
+                return NULL
+
+            store.move_to_end(key)
+            return entry[0]
+
+        return NULL
+
+    def _store(self, key: Any, value: Any) -> None:
+        cls = value.__class__
+
+        if cls is Err or cls is Nothing:
+            if cls is Nothing and not self._cache_none:
+                return
+
+            store, maxsize, ttl = self._err, self._err_maxsize, self._err_ttl
+        else:
+            store, maxsize, ttl = self._ok, self._maxsize, self._ok_ttl
+
+        if maxsize == 0:
+            return
+
+        store[key] = (value, None if ttl is None else monotonic() + ttl)
+
+        if maxsize is not None and len(store) > maxsize:
+            store.popitem(last=False)
+            self._evictions += 1
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = args + _KWD_MARK + tuple(kwargs.items()) if kwargs else args
+
+        # Hits skip the lock, each step is a single atomic dict operation
+        store = self._ok
+        entry = store.get(key)
+
+        if entry is None:
+            store = self._err
+            entry = store.get(key)
+
+        if entry is not None and (entry[1] is None or entry[1] > monotonic()):
+            try:
+                store.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since the `get`
+                pass
+
+            self._hits += 1
+            return entry[0]
+
+        return self._miss(key, args, kwargs)
+
+    def _miss(self, key: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        while True:
+            with self._lock:
+                value = self._lookup(key, monotonic())
+
+                if value is not NULL:
+                    self._hits += 1
+                    return value
+
+                flight = self._flights.get(key)
+                leader = flight is None
+
+                if flight is None:
+                    self._misses += 1
+                    flight = self._flights[key] = _Flight()
+
+            if leader:
+                break
+
+            if flight.owner == threading.get_ident():
+                # A recursive call with the same arguments, waiting would deadlock
+                return self.__wrapped__(*args, **kwargs)
+
+            flight.done.wait()
+
+            if not flight.failed:
+                with self._lock:
+                    self._hits += 1
+
+                return flight.value
+
+        try:
+            value = self.__wrapped__(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                del self._flights[key]
+
+            flight.failed = True
+            flight.done.set()
+            raise
+
+        with self._lock:
+            del self._flights[key]
+            self._store(key, value)
+
+        flight.value = value
+        flight.done.set()
+
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hit, miss, eviction and expiration counts and the cache sizes"""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, self._expirations,
+                len(self._ok), len(self._err),
+            )
+
+    def cache_clear(self) -> None:
+        """Empties both caches and resets the statistics"""
+        with self._lock:
+            self._ok.clear()
+            self._err.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+def _check_size(name: str, size: Optional[int]) -> None:
+    if size is not None and size < 0:
+        raise ValueError(f"{name} must be at least 0, got {size}")
+
+
+def _check_ttl(name: str, ttl: Optional[float]) -> None:
+    if ttl is not None and ttl <= 0:
+        raise ValueError(f"{name} must be positive, got {ttl}")
+
+
+def cache_result(
+    f: Optional[Callable[..., Any]] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    err_maxsize: Optional[int] = _MAXSIZE,
+    ok_ttl: Optional[float] = None,
+    err_ttl: Optional[float] = None,
+    cache_none: bool = True,
+) -> Any:
+    """
+    Memoizes a function returning `Result` or `Option`, thread-safely
+
+    `Ok`, `Some` and plain values are kept in an LRU cache of `maxsize`
+    entries for `ok_ttl` seconds. `Err` and `None` are kept in a separate
+    LRU cache of `err_maxsize` entries, by default `maxsize`, for
+    `err_ttl` seconds. A size of `None` is unbounded, a TTL of `None`
+    never expires, and a size of 0 disables that cache
+
+    With `cache_none=False`, `None` is never cached. Exceptions are never
+    cached. Arguments must be hashable, keyword order matters like in
+    `functools.lru_cache`
+
+    Works with or without arguments, as `@cache_result` or
+    `@cache_result(err_ttl=5)`. The wrapper has `cache_info()` and
+    `cache_clear()`
+    """
+    if err_maxsize is _MAXSIZE:
+        err_maxsize = maxsize
+
+    _check_size("maxsize", maxsize)
+    _check_size("err_maxsize", err_maxsize)
+    _check_ttl("ok_ttl", ok_ttl)
+    _check_ttl("err_ttl", err_ttl)
+
+    def decorate(f: Callable[..., Any]) -> CachedFunction:
+        if iscoroutinefunction(f):
+            raise TypeError("cache_result doesn't support async functions")
+
+        return CachedFunction(f, maxsize, err_maxsize, ok_ttl, err_ttl, cache_none)
+
+    if f is None:
+        return decorate
+
+    return decorate(f)
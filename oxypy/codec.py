@@ -0,0 +1,148 @@
+"""
+Compact binary encoding for `Option`, `Result` and `Either`
+
+A single value is encoded as one tag byte followed by its serialized
+payload. `dumps_many` encodes a whole list with one tag byte per value
+and a single serializer call for every payload, so large batches avoid
+per-object pickle overhead
+
+Any object with `dumps(obj) -> bytes` and `loads(data) -> obj` can be
+used as the serializer, such as the `pickle` and `marshal` modules
+"""
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, Iterable, Protocol, Union
+
+from .either import Either, Left, Right
+from .option import NONE, Nothing, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = ["Serializer", "dumps", "dumps_many", "loads", "loads_many"]
+
+Value = Union[Option[Any], Result[Any, Any], Either[Any, Any]]
+
+TAG_NONE = 0
+TAG_SOME = 1
+TAG_OK = 2
+TAG_ERR = 3
+TAG_LEFT = 4
+TAG_RIGHT = 5
+
+_TAGS = {
+    Nothing: TAG_NONE,
+    Some: TAG_SOME,
+    Ok: TAG_OK,
+    Err: TAG_ERR,
+    Left: TAG_LEFT,
+    Right: TAG_RIGHT,
+}
+
+# Indexed by tag, `None` marks the payload-less `None` variant
+_CLASSES: tuple[Any, ...] = (None, Some, Ok, Err, Left, Right)
+
+_VERSION = 1
+_HEADER = struct.Struct("<BQ")
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+class Serializer(Protocol):
+    def dumps(self, obj: Any) -> bytes:
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        ...
+
+
+def _tag(value: Any) -> int:
+    try:
+        return _TAGS[value.__class__]
+    except KeyError:
+        raise TypeError(f"Cannot encode {value.__class__.__name__!r}") from None
+
+
+def _class(tag: int) -> Any:
+    if not 0 <= tag < len(_CLASSES):
+        raise ValueError(f"Unknown tag {tag}")
+
+    return _CLASSES[tag]
+
+
+def _build(cls: Any, payload: Any) -> Any:
+    # Skips `__init__`, so a decoded `Err` isn't sampled again by
+    # `set_origin_sampling` at the decoder's call site
+    value = _new(cls)
+    _set(value, "_value", payload)
+
+    return value
+
+
+def dumps(value: Value, serializer: Serializer = pickle) -> bytes:
+    """Encodes a single value as a tag byte followed by its payload"""
+    tag = _tag(value)
+
+    if tag == TAG_NONE:
+        return bytes((tag,))
+
+    return bytes((tag,)) + serializer.dumps(value._value)
+
+
+def loads(data: bytes, serializer: Serializer = pickle) -> Value:
+    """
+    Decodes a value encoded by `dumps`
+
+    `None` always decodes to the shared `NONE`
+    """
+    cls = _class(data[0])
+
+    if cls is None:
+        return NONE
+
+    return _build(cls, serializer.loads(data[1:]))
+
+
+def dumps_many(values: Iterable[Value], serializer: Serializer = pickle) -> bytes:
+    """
+    Encodes many values as a header, one tag byte per value, and the
+    payloads serialized together in one call
+    """
+    tags = bytearray()
+    payloads = []
+
+    for value in values:
+        tag = _tag(value)
+        tags.append(tag)
+
+        if tag != TAG_NONE:
+            payloads.append(value._value)
+
+    return _HEADER.pack(_VERSION, len(tags)) + tags + serializer.dumps(payloads)
+
+
+def loads_many(data: bytes, serializer: Serializer = pickle) -> list[Value]:
+    """
+    Decodes values encoded by `dumps_many`
+
+    `None` values always decode to the shared `NONE`
+    """
+    version, count = _HEADER.unpack_from(data)
+
+    if version != _VERSION:
+        raise ValueError(f"Unsupported encoding version {version}")
+
+    start = _HEADER.size
+    tags = data[start:start + count]
+
+    if max(tags, default=0) >= len(_CLASSES):
+        raise ValueError(f"Unknown tag {max(tags)}")
+
+    next_payload = iter(serializer.loads(data[start + count:])).__next__
+    classes = _CLASSES
+
+    return [
+        NONE if tag == TAG_NONE else _build(classes[tag], next_payload())
+        for tag in tags
+    ]
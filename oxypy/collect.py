@@ -0,0 +1,183 @@
+"""
+Collecting iterables of `Result` or `Option` into a single value
+
+Every function consumes its input lazily and stops at the first `Err`
+or `None`, so the rest of a generator is never evaluated
+
+`into` is any callable taking an iterable, such as `list`, `dict`,
+`set`, `"".join` or `functools.partial(functools.reduce, operator.add)`.
+It receives the contained values and its return value is wrapped in
+`Ok` or `Some`. On a short-circuit `into` is stopped, and the failure is
+returned instead of its output
+"""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from .option import NONE, Nothing, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = [
+    "collect_options", "collect_results", "partition_results",
+    "traverse", "traverse_options", "traverse_results",
+]
+
+T = TypeVar("T")
+E = TypeVar("E")
+Into = Callable[[Iterator[Any]], Any]
+
+
+class _ShortCircuit(BaseException):
+    # Raised through `into` at the first failure so it never sees a
+    # truncated input. Derives from `BaseException` so `except Exception`
+    # in `into` doesn't swallow it
+    pass
+
+
+def _not_a(kind: str, value: Any) -> TypeError:
+    return TypeError(f"Expected a {kind}, got {value.__class__.__name__!r}")
+
+
+def _collect_into(
+    values: Iterator[Any],
+    into: Into,
+    wrap: Callable[[Any], Any],
+    stops: list[_ShortCircuit],
+) -> Any:
+    # Returns `into`'s output wrapped, or the failure carried by this call's
+    # own short-circuit, any other one comes from a nested collect and propagates
+    try:
+        return wrap(into(values))
+    except _ShortCircuit as e:
+        if not stops or e is not stops[0]:
+            raise
+
+        return e.args[0]
+
+
+def collect_results(results: Iterable[Result[T, E]], into: Into = list) -> Result[Any, E]:
+    """
+    If every element is `Ok`, returns `Ok` of the contained values passed to `into`
+
+    Otherwise returns the first `Err`
+    """
+    if into is list:
+        out: list[T] = []
+        append = out.append
+
+        for r in results:
+            if r.__class__ is Ok:
+                append(r._value)
+            elif r.__class__ is Err:
+                return r
+            else:
+                raise _not_a("Result", r)
+
+        return Ok(out)
+
+    stops: list[_ShortCircuit] = []
+
+    def values() -> Iterator[T]:
+        for r in results:
+            if r.__class__ is Ok:
+                yield r._value
+            elif r.__class__ is Err:
+                stops.append(_ShortCircuit(r))
+                raise stops[0]
+            else:
+                raise _not_a("Result", r)
+
+    return _collect_into(values(), into, Ok, stops)
+
+
+def collect_options(options: Iterable[Option[T]], into: Into = list) -> Option[Any]:
+    """
+    If every element is `Some`, returns `Some` of the contained values passed to `into`
+
+    Otherwise returns `None`
+    """
+    if into is list:
+        out: list[T] = []
+        append = out.append
+
+        for o in options:
+            if o.__class__ is Some:
+                append(o._value)
+            elif o.__class__ is Nothing:
+                return NONE
+            else:
+                raise _not_a("Option", o)
+
+        return Some(out)
+
+    stops: list[_ShortCircuit] = []
+
+    def values() -> Iterator[T]:
+        for o in options:
+            if o.__class__ is Some:
+                yield o._value
+            elif o.__class__ is Nothing:
+                stops.append(_ShortCircuit(o))
+                raise stops[0]
+            else:
+                raise _not_a("Option", o)
+
+    return _collect_into(values(), into, Some, stops)
+
+
+def traverse_results(
+    f: Callable[[Any], Result[T, E]],
+    iterable: Iterable[Any],
+    into: Into = list,
+) -> Result[Any, E]:
+    """Maps `f` over the iterable and collects with `collect_results`"""
+    return collect_results(map(f, iterable), into)
+
+
+def traverse_options(
+    f: Callable[[Any], Option[T]],
+    iterable: Iterable[Any],
+    into: Into = list,
+) -> Option[Any]:
+    """Maps `f` over the iterable and collects with `collect_options`"""
+    return collect_options(map(f, iterable), into)
+
+
+def traverse(f: Callable[[Any], Any], iterable: Iterable[Any], into: Into = list) -> Any:
+    """
+    Maps `f` over the iterable and collects the `Result`s or `Option`s it returns
+
+    The kind is taken from the first value `f` returns, an empty iterable
+    gives `Ok`. Use `Option.traverse` or `Result.traverse` to be explicit
+    """
+    it = iter(iterable)
+
+    for x in it:
+        first = f(x)
+        rest = chain((first,), map(f, it))
+
+        if isinstance(first, Option):
+            return collect_options(rest, into)
+
+        return collect_results(rest, into)
+
+    return collect_results(iter(()), into)
+
+
+def partition_results(results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+    """Splits into a list of the `Ok` values and a list of the `Err` values in one pass"""
+    oks: list[T] = []
+    errs: list[E] = []
+    ok_append = oks.append
+    err_append = errs.append
+
+    for r in results:
+        if r.__class__ is Ok:
+            ok_append(r._value)
+        elif r.__class__ is Err:
+            err_append(r._value)
+        else:
+            raise _not_a("Result", r)
+
+    return oks, errs
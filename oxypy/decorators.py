@@ -0,0 +1,146 @@
+"""
+Decorators bridging exception-raising code and `Result`, and emulating
+Rust's `?` operator with `try_block`
+"""
+from __future__ import annotations
+
+from functools import wraps
+from inspect import iscoroutinefunction, isgeneratorfunction
+from typing import Any, Callable, Optional, TypeVar
+
+from .option import Nothing, Some
+from .result import Err, Ok, _new_err, _new_ok
+from .utils import EarlyReturn
+
+__all__ = ["returns_result", "try_block"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def returns_result(
+    f: Optional[F] = None,
+    *,
+    catch: tuple[type[BaseException], ...] = (Exception,),
+    traceback: bool = True,
+) -> Any:
+    """
+    Makes a function return `Ok` of its return value, or `Err` of an
+    exception of one of the `catch` types, like `Result.from_call`
+
+    Works on `async def` functions, and with or without arguments,
+    as `@returns_result` or `@returns_result(catch=(OSError,))`
+
+    With `traceback=False` caught exceptions have their traceback
+    dropped, so long-lived errors don't keep the failing frames alive
+    """
+    def decorate(f: F) -> F:
+        # Separate wrappers keep the `traceback` check out of the call
+        if iscoroutinefunction(f):
+            @wraps(f)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return _new_ok(await f(*args, **kwargs))
+                except catch as e:
+                    if not traceback:
+                        e.__traceback__ = None
+
+                    return _new_err(e)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        if traceback:
+            @wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return _new_ok(f(*args, **kwargs))
+                except catch as e:
+                    return _new_err(e)
+        else:
+            @wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return _new_ok(f(*args, **kwargs))
+                except catch as e:
+                    e.__traceback__ = None
+
+                    return _new_err(e)
+
+        return wrapper  # type: ignore[return-value]
+
+    if f is None:
+        return decorate
+
+    return decorate(f)
+
+
+def _wrap(value: Any) -> Any:
+    cls = value.__class__
+
+    if cls is Ok or cls is Err or cls is Some or cls is Nothing:
+        return value
+
+    return _new_ok(value)
+
+
+def try_block(f: F) -> F:
+    """
+    Lets a function return early on an `Err` or `None`, like Rust's `?`
+
+    Inside the function, `r.unwrap_or_return()` gives the value of an `Ok`
+    or `Some`, and on an `Err` or `None` the call returns it immediately.
+    This is plain code with no per-step callbacks, so it is the fast form
+
+    A generator function can instead write `x = yield r`, which sends back
+    the value of an `Ok` or `Some` and returns an `Err` or `None` after
+    closing the generator
+
+    A returned `Result` or `Option` is kept as it is, any other value
+    becomes `Ok`. Works on `async def` functions with `unwrap_or_return`
+    """
+    if isgeneratorfunction(f):
+        @wraps(f)
+        def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+            gen = f(*args, **kwargs)
+            send = gen.send
+            value = None
+
+            try:
+                while True:
+                    r = send(value)
+                    cls = r.__class__
+
+                    if cls is Ok or cls is Some:
+                        value = r._value
+                    elif cls is Err or cls is Nothing:
+                        gen.close()
+                        return r
+                    else:
+                        gen.close()
+                        raise TypeError(
+                            f"try_block expected a Result or Option, got {cls.__name__!r}"
+                        )
+            except StopIteration as e:
+                return _wrap(e.value)
+            except EarlyReturn as e:
+                return e.args[0]
+
+        return gen_wrapper  # type: ignore[return-value]
+
+    if iscoroutinefunction(f):
+        @wraps(f)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return _wrap(await f(*args, **kwargs))
+            except EarlyReturn as e:
+                return e.args[0]
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return _wrap(f(*args, **kwargs))
+        except EarlyReturn as e:
+            return e.args[0]
+
+    return wrapper  # type: ignore[return-value]
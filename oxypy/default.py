@@ -7,6 +7,8 @@ class Default(Protocol, Generic[T_co]):
     """
     A protocol that gives a type the ability to have a default value
     """
+    __slots__ = ()
+
     @classmethod
     def __default__(cls: Type[T_co]) -> T_co:
         ...
@@ -0,0 +1,430 @@
+"""
+A persistent on-disk cache of `Result` values, backed by sqlite
+
+`DiskCache` stores `Ok` and `Err` values under byte keys, with separate
+TTLs for each variant and an optional bound on the number of entries.
+Values are encoded with `oxypy.codec`, so a cache written by one process
+can be read by any other. The database runs in WAL mode, so many
+processes can read and write the same file at once, each through its own
+`DiskCache`
+
+`disk_cache` is a decorator on top of it, keying each call on a stable
+hash of the function name and its arguments. Unlike `hash()`, the key is
+the same in every process and across restarts
+
+`get_many` and `put_many` read or write whole batches in one query and
+one transaction, so a warm restart can load thousands of entries without
+a round trip per entry
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+from functools import update_wrapper
+from itertools import islice
+from types import MethodType
+from typing import Any, Callable, Iterable, Optional, Union
+
+from . import codec
+from .option import NONE, Nothing, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = ["DiskCache", "DiskCachedFunction", "disk_cache", "stable_key"]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Oldest entries are trimmed after every `put_many` and every this many `put`s
+_TRIM_EVERY = 64
+# Stays under the parameter limit of older sqlite builds
+_BATCH = 500
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS oxypy_results "
+    "(key BLOB PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+)
+_PUT = "INSERT OR REPLACE INTO oxypy_results (key, value, expires) VALUES (?, ?, ?)"
+_EXPIRE = "DELETE FROM oxypy_results WHERE expires <= ?"
+# `INSERT OR REPLACE` gives a replaced row a new rowid, so rowid order is write order
+_TRIM = (
+    "DELETE FROM oxypy_results WHERE rowid IN (SELECT rowid FROM oxypy_results "
+    "ORDER BY rowid LIMIT max(0, (SELECT count(*) FROM oxypy_results) - ?))"
+)
+
+_FLOAT = struct.Struct(">d")
+_VARIANT_TAGS = {cls: bytes((tag,)) for cls, tag in codec._TAGS.items()}
+
+
+class DiskCache:
+    """
+    A sqlite file of `Result` values keyed by bytes
+
+    `Ok` values expire after `ok_ttl` seconds and `Err` values after
+    `err_ttl` seconds, a TTL of `None` never expires. With `max_entries`,
+    the oldest written entries are removed once there are more, checked
+    after every `put_many` and every few `put`s
+
+    Safe to share between threads. Each process should open its own, a
+    `DiskCache` inherited through `fork` reconnects on first use
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        max_entries: Optional[int] = None,
+        ok_ttl: Optional[float] = None,
+        err_ttl: Optional[float] = None,
+        serializer: codec.Serializer = pickle,
+        timeout: float = 30.0,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        for name, ttl in (("ok_ttl", ok_ttl), ("err_ttl", err_ttl)):
+            if ttl is not None and ttl <= 0:
+                raise ValueError(f"{name} must be positive, got {ttl}")
+
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.ok_ttl = ok_ttl
+        self.err_ttl = err_ttl
+        self._serializer = serializer
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._writes = 0
+
+        self._connect()
+
+    def __repr__(self) -> str:
+        return f"DiskCache({self.path!r})"
+
+    def __enter__(self) -> DiskCache:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT count(*) FROM oxypy_results WHERE expires IS NULL OR expires > ?",
+                (time.time(),),
+            ).fetchone()
+
+        return row[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with the lock held, or from `__init__`
+        conn = self._conn
+
+        if conn is not None and self._pid == os.getpid():
+            return conn
+
+        # Autocommit mode, writes open their own transactions
+        conn = sqlite3.connect(
+            self.path, timeout=self._timeout, isolation_level=None, check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+
+        self._conn = conn
+        self._pid = os.getpid()
+
+        return conn
+
+    def _row(self, key: bytes, result: Result[Any, Any], now: float) -> tuple[Any, ...]:
+        cls = result.__class__
+
+        if cls is Ok:
+            ttl = self.ok_ttl
+        elif cls is Err:
+            ttl = self.err_ttl
+        else:
+            raise TypeError(f"Expected a Result, got {cls.__name__!r}")
+
+        return (key, codec.dumps(result, self._serializer), None if ttl is None else now + ttl)
+
+    def _load(self, data: bytes) -> Any:
+        # Only `put` writes, so every stored value decodes to a `Result`
+        return codec.loads(data, self._serializer)
+
+    def _write(self, rows: list[tuple[Any, ...]], now: float, trim: bool) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+
+            try:
+                conn.executemany(_PUT, rows)
+                self._writes += len(rows)
+
+                if trim or self._writes >= _TRIM_EVERY:
+                    self._writes = 0
+                    conn.execute(_EXPIRE, (now,))
+
+                    if self.max_entries is not None:
+                        conn.execute(_TRIM, (self.max_entries,))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+            conn.execute("COMMIT")
+
+    def get(self, key: bytes) -> Option[Result[Any, Any]]:
+        """Returns `Some` of the stored `Result`, or `None` if it is missing or expired"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM oxypy_results WHERE key = ? "
+                "AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+
+        if row is None:
+            return NONE
+
+        return Some(self._load(row[0]))
+
+    def get_many(self, keys: Iterable[bytes]) -> list[Option[Result[Any, Any]]]:
+        """Like `get` for every key, in input order, with one query per few hundred keys"""
+        keys = list(keys)
+        found: dict[bytes, bytes] = {}
+        now = time.time()
+        it = iter(set(keys))
+
+        with self._lock:
+            conn = self._connect()
+
+            while True:
+                batch = list(islice(it, _BATCH))
+
+                if not batch:
+                    break
+
+                found.update(conn.execute(
+                    "SELECT key, value FROM oxypy_results "
+                    f"WHERE key IN ({', '.join('?' * len(batch))}) "
+                    "AND (expires IS NULL OR expires > ?)",
+                    (*batch, now),
+                ).fetchall())
+
+        load = self._load
+
+        return [
+            Some(load(found[key])) if key in found else NONE
+            for key in keys
+        ]
+
+    def put(self, key: bytes, result: Result[Any, Any]) -> None:
+        """Stores the `Result` under the key, replacing any previous value"""
+        now = time.time()
+        self._write([self._row(key, result, now)], now, False)
+
+    def put_many(self, items: Iterable[tuple[bytes, Result[Any, Any]]]) -> None:
+        """Like `put` for every key and `Result` pair, in one transaction"""
+        now = time.time()
+        self._write([self._row(key, result, now) for key, result in items], now, True)
+
+    def delete(self, key: bytes) -> None:
+        """Removes the key, if it is stored"""
+        with self._lock:
+            self._connect().execute("DELETE FROM oxypy_results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Removes every entry"""
+        with self._lock:
+            self._connect().execute("DELETE FROM oxypy_results")
+
+    def close(self) -> None:
+        """Closes this process's connection, the cache reconnects if used again"""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+
+            self._conn = None
+
+
+def _encode(obj: Any, out: list[bytes]) -> None:
+    cls = obj.__class__
+
+    if obj is None:
+        out.append(b"N")
+    elif cls is bool:
+        out.append(b"T" if obj else b"F")
+    elif cls is int:
+        out.append(b"i%d;" % obj)
+    elif cls is float:
+        out.append(b"f" + _FLOAT.pack(obj))
+    elif cls is str:
+        data = obj.encode("utf-8", "surrogatepass")
+        out.append(b"s%d:" % len(data) + data)
+    elif cls is bytes:
+        out.append(b"b%d:" % len(obj) + obj)
+    elif cls is tuple or cls is list:
+        out.append(b"(" if cls is tuple else b"[")
+
+        for item in obj:
+            _encode(item, out)
+
+        out.append(b")")
+    elif cls is dict:
+        # Sorted by encoding, so insertion order doesn't change the key
+        out.append(b"{")
+        out.extend(sorted(_encoded(k) + _encoded(v) for k, v in obj.items()))
+        out.append(b"}")
+    elif cls is set or cls is frozenset:
+        out.append(b"<")
+        out.extend(sorted(_encoded(item) for item in obj))
+        out.append(b">")
+    elif cls in _VARIANT_TAGS:
+        out.append(b"V" + _VARIANT_TAGS[cls])
+
+        if cls is not Nothing:
+            _encode(obj._value, out)
+    else:
+        raise TypeError(
+            f"Cannot make a stable key from {cls.__name__!r}, pass `key` to `disk_cache`"
+        )
+
+
+def _encoded(obj: Any) -> bytes:
+    out: list[bytes] = []
+    _encode(obj, out)
+
+    return b"".join(out)
+
+
+def stable_key(*args: Any, **kwargs: Any) -> bytes:
+    """
+    Returns a 16 byte hash of the arguments that is the same in every process
+
+    Supports `None`, `bool`, `int`, `float`, `str`, `bytes`, tuples, lists,
+    dicts, sets, and `Option`, `Result` and `Either` values of those. Dicts
+    and sets hash the same whatever their order, keyword arguments too
+    """
+    out: list[bytes] = []
+    _encode(args, out)
+    _encode(kwargs, out)
+
+    return hashlib.blake2b(b"".join(out), digest_size=16).digest()
+
+
+class DiskCachedFunction:
+    """A function wrapped by `disk_cache`"""
+
+    def __init__(
+        self,
+        f: Callable[..., Any],
+        cache: DiskCache,
+        namespace: str,
+        key: Optional[Callable[..., Any]],
+    ) -> None:
+        self.__wrapped__ = f
+        self.cache = cache
+        self._namespace = namespace
+        self._key = key
+
+        update_wrapper(self, f)
+
+    def __repr__(self) -> str:
+        return f"<disk_cache {self.__wrapped__!r} in {self.cache.path!r}>"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # Caches methods like a plain function, with `self` part of the key
+        if instance is None:
+            return self
+
+        return MethodType(self, instance)
+
+    def key(self, *args: Any, **kwargs: Any) -> bytes:
+        """Returns the cache key of a call with these arguments"""
+        if self._key is not None:
+            args, kwargs = (self._key(*args, **kwargs),), {}
+
+        return stable_key(self._namespace, *args, **kwargs)
+
+    def _call(self, *args: Any, **kwargs: Any) -> Result[Any, Any]:
+        result = self.__wrapped__(*args, **kwargs)
+
+        if result.__class__ is not Ok and result.__class__ is not Err:
+            raise TypeError(f"Expected a Result, got {result.__class__.__name__!r}")
+
+        return result
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Result[Any, Any]:
+        key = self.key(*args, **kwargs)
+        cached = self.cache.get(key)
+
+        if cached.__class__ is Some:
+            return cached._value
+
+        result = self._call(*args, **kwargs)
+        self.cache.put(key, result)
+
+        return result
+
+    def map(self, items: Iterable[Any]) -> list[Result[Any, Any]]:
+        """
+        Calls the function with each item, reading every cached result in
+        one `get_many` and storing the new ones in one `put_many`
+        """
+        items = list(items)
+        keys = [self.key(item) for item in items]
+        results = self.cache.get_many(keys)
+        computed = []
+
+        for i, cached in enumerate(results):
+            if cached.__class__ is Nothing:
+                result = self._call(items[i])
+                computed.append((keys[i], result))
+                results[i] = Some(result)
+
+        if computed:
+            self.cache.put_many(computed)
+
+        return [cached._value for cached in results]
+
+
+def disk_cache(
+    path: Union[PathLike, DiskCache],
+    *,
+    max_entries: Optional[int] = None,
+    ok_ttl: Optional[float] = None,
+    err_ttl: Optional[float] = None,
+    namespace: Optional[str] = None,
+    key: Optional[Callable[..., Any]] = None,
+) -> Callable[[Callable[..., Any]], DiskCachedFunction]:
+    """
+    Caches a function returning `Result` in a `DiskCache` at `path`,
+    or in an existing `DiskCache`
+
+    Calls are keyed on `namespace`, by default the function's module and
+    qualified name, and the arguments, see `stable_key`. `key` can map
+    arguments that `stable_key` doesn't support to ones it does. On a
+    method `self` is passed too, so `key` must map it to something stable,
+    such as `key=lambda self, x: (self.name, x)`. `map` is never bound,
+    so it only suits plain functions
+
+    The wrapper has `map(items)` for batches, and `key(...)` and `cache`
+    for using `get_many` and `put_many` directly
+    """
+    if isinstance(path, DiskCache):
+        if max_entries is not None or ok_ttl is not None or err_ttl is not None:
+            raise ValueError("Set max_entries, ok_ttl and err_ttl on the DiskCache itself")
+
+        cache = path
+    else:
+        cache = DiskCache(path, max_entries=max_entries, ok_ttl=ok_ttl, err_ttl=err_ttl)
+
+    def decorate(f: Callable[..., Any]) -> DiskCachedFunction:
+        name = namespace or f"{f.__module__}.{f.__qualname__}"
+
+        return DiskCachedFunction(f, cache, name, key)
+
+    return decorate
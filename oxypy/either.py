@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import os
-from typing import Callable, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar
 
-from .debug import Debug
+from .debug import Debug, _PlainMeta
 from .default import Default
+from .ops import par_ord
 from .panic import panic
-from .utils import NULL
 
-__all__ = ["Either"]
+if TYPE_CHECKING:
+    from .pipe import EitherPipe
+
+__all__ = ["Either", "Left", "Right"]
 
 L = TypeVar("L")
 R = TypeVar("R")
@@ -20,35 +22,23 @@ K = TypeVar("K")
 S = TypeVar("S")
 
 
-class Either(Debug, Generic[L, R]):
+class Either(Debug, Generic[L, R], metaclass=_PlainMeta):
     """
     Class containing either an `Left(L)` or `Right(R)` variant
 
     Used for expressing where a value may be one of two types
+
+    Every instance is either a `Left` or a `Right`, which implement
+    each method for their variant
+
+    Eithers are immutable, so a combinator that leaves the value
+    unchanged returns the receiver itself instead of a copy
     """
 
-    vars()["__RAND_LEN"] = 64
-    vars()["__IS_LEFT"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
-    vars()["__INNER_LEFT_VAL"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
-    vars()["__INNER_RIGHT_VAL"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
+    __slots__ = ("_value",)
 
-    def __repr__(self) -> str:
-        if self.is_left():
-            return f"Left({self.unwrap_left()!r})"
-        else:
-            return f"Right({self.unwrap_right()!r})"
+    _value: Any
+    _rank: int
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -59,43 +49,109 @@ class Either(Debug, Generic[L, R]):
     def __debug_str__(self) -> str:
         return self.__repr__()
 
+    def debug_string(self) -> str:
+        return self.__repr__()
+
+    def __reduce__(self):
+        return (self.__class__, (self._value,))
+
+    # comparison
+
+    def __lt__(self, other: object) -> bool:
+        """`Left` orders before `Right`, then contained values are compared"""
+        if not isinstance(other, Either):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._value < other._value
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Either):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._value <= other._value
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Either):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._value > other._value
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Either):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._value >= other._value
+
+    def __par_eq__(self, other: object) -> bool:
+        """Implements `PartialEq`, equivalent to `==`"""
+        return self == other
+
+    def __par_ord__(self, other: object) -> Optional[int]:
+        """
+        Implements `PartialOrd`, contained values are ordered with `par_ord`
+        so they may implement `PartialOrd` themselves
+        """
+        if not isinstance(other, Either):
+            return None
+
+        if self._rank != other._rank:
+            return -1 if self._rank < other._rank else 1
+
+        return par_ord(self._value, other._value)
+
+    @staticmethod
+    def sort_key(value: Either[Any, Any]) -> tuple[Any, ...]:
+        """
+        Key function ordering values the same way as `<`
+
+        Keys are plain tuples, so `sorted(eithers, key=Either.sort_key)` compares them in C
+        instead of calling `__lt__` for every pair
+        """
+        return (1 if value.__class__ is Right else 0, value._value)
+
     # defaults
 
     @classmethod
     def left(cls, val: L) -> Either[L, R]:
         """Creates a new `Left` variant of `Either`"""
-        r = cls()
-
-        object.__setattr__(r, object.__getattribute__(cls, "__IS_LEFT"), True)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_LEFT_VAL"), val)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_RIGHT_VAL"), NULL)
-
-        return r
+        return Left(val)
 
     @classmethod
     def right(cls, val: R) -> Either[L, R]:
         """Creates a new `Right` variant of `Either`"""
-        r = cls()
+        return Right(val)
 
-        object.__setattr__(r, object.__getattribute__(cls, "__IS_LEFT"), False)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_LEFT_VAL"), NULL)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_RIGHT_VAL"), val)
+    @classmethod
+    def pipe(cls) -> EitherPipe:
+        """
+        Returns an empty pipeline, steps added to it are compiled into a
+        single function that can be applied to many values
+        """
+        from .pipe import EitherPipe
 
-        return r
+        return EitherPipe()
 
     # ok or err
 
     def is_left(self) -> bool:
         """Returns `True` if self is `Left` variant"""
-        return not not object.__getattribute__(
-            self, object.__getattribute__(self, "__IS_LEFT")
-        )
+        raise NotImplementedError
 
     def is_right(self) -> bool:
         """Returns `True` if self is `Right` variant"""
-        return not object.__getattribute__(
-            self, object.__getattribute__(self, "__IS_LEFT")
-        )
+        raise NotImplementedError
 
     # unwrap
 
@@ -105,12 +161,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, panics
         """
-        if self.is_right():
-            panic(msg="Called `Either.unwrap_left` on a `Right` variant")
-        else:
-            return object.__getattribute__(
-                self, object.__getattribute__(self, "__INNER_LEFT_VAL")
-            )
+        raise NotImplementedError
 
     def unwrap_right(self) -> R:
         """
@@ -118,12 +169,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns contained value
         """
-        if self.is_left():
-            panic(msg="Called `Either.unwrap_right` on a `Left` variant")
-        else:
-            return object.__getattribute__(
-                self, object.__getattribute__(self, "__INNER_RIGHT_VAL")
-            )
+        raise NotImplementedError
 
     # expect
 
@@ -133,10 +179,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, panics with the specified error message
         """
-        if self.is_right():
-            panic(msg=msg)
-        else:
-            return self.unwrap_left()
+        raise NotImplementedError
 
     def expect_right(self, msg: str) -> R:
         """
@@ -144,10 +187,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns the contained value
         """
-        if self.is_left():
-            panic(msg=msg)
-        else:
-            return self.unwrap_right()
+        raise NotImplementedError
 
     # either
 
@@ -157,10 +197,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns the contained value wrapped in `g`
         """
-        if self.is_left():
-            return f(self.unwrap_left())
-        else:
-            return g(self.unwrap_right())
+        raise NotImplementedError
 
     def either_with(self, ctx: C, f: Callable[[C, L], T], g: Callable[[C, R], T]) -> T:
         """
@@ -171,10 +208,7 @@ class Either(Debug, Generic[L, R]):
         Like `Either.either` but supplies extra context to which function
         ends up being called
         """
-        if self.is_left():
-            return f(ctx, self.unwrap_left())
-        else:
-            return g(ctx, self.unwrap_right())
+        raise NotImplementedError
 
     # and then
 
@@ -182,31 +216,17 @@ class Either(Debug, Generic[L, R]):
         """
         If self is `Left` variant, wraps the value in `f`
 
-        If self is `Right` variant, returns a copy of self
+        If self is `Right` variant, returns self
         """
-        inner: Either[K, R]
-
-        if self.is_left():
-            inner = Either.left(f(self.unwrap_left()))
-        else:
-            inner = Either.right(self.unwrap_right())
-
-        return inner
+        raise NotImplementedError
 
     def right_and_then(self, g: Callable[[R], S]) -> Either[L, S]:
         """
-        If self is `Left` variant, returns a copy of self
+        If self is `Left` variant, returns self
 
         If self is `Right` variant, wraps the value in `f`
         """
-        inner: Either[L, S]
-
-        if self.is_left():
-            inner = Either.left(self.unwrap_left())
-        else:
-            inner = Either.right(g(self.unwrap_right()))
-
-        return inner
+        raise NotImplementedError
 
     # or
 
@@ -216,10 +236,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns given value
         """
-        if self.is_left():
-            return self.unwrap_left()
-        else:
-            return other
+        raise NotImplementedError
 
     def left_or_default(self, default: Default[L]) -> L:
         """
@@ -227,10 +244,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns type's default value
         """
-        if self.is_left():
-            return self.unwrap_left()
-        else:
-            return default.__default__()
+        raise NotImplementedError
 
     def left_or_else(self, g: Callable[[R], L]) -> L:
         """
@@ -238,10 +252,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns result of given function `f`
         """
-        if self.is_left():
-            return self.unwrap_left()
-        else:
-            return g(self.unwrap_right())
+        raise NotImplementedError
 
     def right_or(self, other: R) -> R:
         """
@@ -249,10 +260,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns contained value
         """
-        if self.is_right():
-            return self.unwrap_right()
-        else:
-            return other
+        raise NotImplementedError
 
     def right_or_default(self, default: Default[R]) -> R:
         """
@@ -260,10 +268,7 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns contained value
         """
-        if self.is_right():
-            return self.unwrap_right()
-        else:
-            return default.__default__()
+        raise NotImplementedError
 
     def right_or_else(self, f: Callable[[L], R]) -> R:
         """
@@ -271,7 +276,148 @@ class Either(Debug, Generic[L, R]):
 
         If self is `Right` variant, returns contained value
         """
-        if self.is_right():
-            return self.unwrap_right()
-        else:
-            return f(self.unwrap_left())
+        raise NotImplementedError
+
+
+class Left(Either[L, R]):
+    """The `Left(L)` variant of `Either`"""
+
+    __slots__ = ()
+    __match_args__ = ("_value",)
+
+    _rank = 0
+
+    def __init__(self, val: L) -> None:
+        object.__setattr__(self, "_value", val)
+
+    def __repr__(self) -> str:
+        return f"Left({self._value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Left:
+            return self._value == other._value  # type: ignore[attr-defined]
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Left, self._value))
+
+    def is_left(self) -> bool:
+        return True
+
+    def is_right(self) -> bool:
+        return False
+
+    def unwrap_left(self) -> L:
+        return self._value
+
+    def unwrap_right(self) -> R:
+        panic(msg="Called `Either.unwrap_right` on a `Left` variant")
+
+    def expect_left(self, msg: str) -> L:
+        return self._value
+
+    def expect_right(self, msg: str) -> R:
+        panic(msg=msg)
+
+    def either(self, f: Callable[[L], T], g: Callable[[R], T]) -> T:
+        return f(self._value)
+
+    def either_with(self, ctx: C, f: Callable[[C, L], T], g: Callable[[C, R], T]) -> T:
+        return f(ctx, self._value)
+
+    def left_and_then(self, f: Callable[[L], K]) -> Either[K, R]:
+        return Left(f(self._value))
+
+    def right_and_then(self, g: Callable[[R], S]) -> Either[L, S]:
+        return self  # type: ignore[return-value]
+
+    def left_or(self, other: L) -> L:
+        return self._value
+
+    def left_or_default(self, default: Default[L]) -> L:
+        return self._value
+
+    def left_or_else(self, g: Callable[[R], L]) -> L:
+        return self._value
+
+    def right_or(self, other: R) -> R:
+        return other
+
+    def right_or_default(self, default: Default[R]) -> R:
+        return default.__default__()
+
+    def right_or_else(self, f: Callable[[L], R]) -> R:
+        return f(self._value)
+
+
+class Right(Either[L, R]):
+    """The `Right(R)` variant of `Either`"""
+
+    __slots__ = ()
+    __match_args__ = ("_value",)
+
+    _rank = 1
+
+    def __init__(self, val: R) -> None:
+        object.__setattr__(self, "_value", val)
+
+    def __repr__(self) -> str:
+        return f"Right({self._value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Right:
+            return self._value == other._value  # type: ignore[attr-defined]
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Right, self._value))
+
+    def is_left(self) -> bool:
+        return False
+
+    def is_right(self) -> bool:
+        return True
+
+    def unwrap_left(self) -> L:
+        panic(msg="Called `Either.unwrap_left` on a `Right` variant")
+
+    def unwrap_right(self) -> R:
+        return self._value
+
+    def expect_left(self, msg: str) -> L:
+        panic(msg=msg)
+
+    def expect_right(self, msg: str) -> R:
+        return self._value
+
+    def either(self, f: Callable[[L], T], g: Callable[[R], T]) -> T:
+        return g(self._value)
+
+    def either_with(self, ctx: C, f: Callable[[C, L], T], g: Callable[[C, R], T]) -> T:
+        return g(ctx, self._value)
+
+    def left_and_then(self, f: Callable[[L], K]) -> Either[K, R]:
+        return self  # type: ignore[return-value]
+
+    def right_and_then(self, g: Callable[[R], S]) -> Either[L, S]:
+        return Right(g(self._value))
+
+    def left_or(self, other: L) -> L:
+        return other
+
+    def left_or_default(self, default: Default[L]) -> L:
+        return default.__default__()
+
+    def left_or_else(self, g: Callable[[R], L]) -> L:
+        return g(self._value)
+
+    def right_or(self, other: R) -> R:
+        return self._value
+
+    def right_or_default(self, default: Default[R]) -> R:
+        return self._value
+
+    def right_or_else(self, f: Callable[[L], R]) -> R:
+        return self._value
@@ -0,0 +1,229 @@
+"""
+Opt-in counters of how `Option`, `Result` and `Either` values are used
+
+`enable()` replaces the constructors and unwrapping methods of every
+variant class with counting wrappers, and `disable()` puts the originals
+back. While disabled nothing is wrapped, so normal code pays nothing
+
+Each event is counted per type, variant and caller location, which is
+the first frame outside of oxypy, so a `map` building an `Ok` is counted
+where `map` was called. The events are
+
+- `"construct"`, a new variant instance, or the shared `NONE` or an
+  interned `Result` returned by `Option.none()`, `Result.ok`,
+  `Result.err`, or a failing `filter`, `zip_` or `zip_with` on `Some`
+- `"unwrap"`, taking the value out with `unwrap`, `expect` and the like,
+  or with an `unwrap_or*` method on `Some` or `Ok`
+- `"fallback"`, an `unwrap_or*` method on `None` or `Err`
+- `"panic"`, any panic raised by a method
+
+Other functions returning the shared `NONE`, such as the `Iter`
+consumers, `collect_options` and `take` on a `None`, are not counted
+
+Counting walks the stack on every event, so instrumented code that does
+little besides creating and unwrapping values runs about ten times slower
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable
+
+from . import either, option, result
+from .either import Left, Right
+from .option import Nothing, Some
+from .result import Err, Ok
+
+__all__ = ["disable", "enable", "is_enabled", "reset", "snapshot", "to_json"]
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+_TYPES = {
+    Some: "Option", Nothing: "Option",
+    Ok: "Result", Err: "Result",
+    Left: "Either", Right: "Either",
+}
+
+_UNWRAPS = (
+    "unwrap", "expect", "unwrap_err", "expect_err", "unwrap_or_raise", "unwrap_or_return",
+    "unwrap_left", "unwrap_right", "expect_left", "expect_right",
+)
+_FALLBACKS = ("unwrap_or", "unwrap_or_else", "unwrap_or_default")
+_FAILURES = (Nothing, Err)
+
+_counts: Counter[tuple[str, str, str, str]] = Counter()
+_lock = threading.Lock()
+# `(owner, name, original)`, `original` is `None` if `owner` didn't define it
+_patched: list[tuple[Any, str, Any]] = []
+
+
+def _location() -> str:
+    frame: Any = sys._getframe(1)
+
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+
+    if frame is None:
+        return "<unknown>"
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+def _count(key: tuple[str, str, str]) -> None:
+    location = _location()
+
+    with _lock:
+        _counts[key + (location,)] += 1
+
+
+def _counting(f: Callable[..., Any], key: tuple[str, str, str]) -> Callable[..., Any]:
+    @wraps(f)
+    def counted(*args: Any, **kwargs: Any) -> Any:
+        _count(key)
+        return f(*args, **kwargs)
+
+    return counted
+
+
+def _counting_shared(
+    f: Callable[..., Any],
+    key: tuple[str, str, str],
+    shared: Callable[[Any, tuple[Any, ...]], bool],
+) -> Callable[..., Any]:
+    # Counts the calls returning a shared instance, new ones are counted by `__init__`
+    @wraps(f)
+    def counted(*args: Any, **kwargs: Any) -> Any:
+        r = f(*args, **kwargs)
+
+        if shared(r, args):
+            _count(key)
+
+        return r
+
+    return counted
+
+
+def _is_none(r: Any, args: tuple[Any, ...]) -> bool:
+    return r is option.NONE
+
+
+def _is_interned_ok(r: Any, args: tuple[Any, ...]) -> bool:
+    return r is result._OK_INTERNED.get(id(args[-1]))
+
+
+def _is_interned_err(r: Any, args: tuple[Any, ...]) -> bool:
+    return r is result._ERR_INTERNED.get(id(args[-1]))
+
+
+def _counting_panic(f: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(f)
+    def counted(*, msg: str) -> Any:
+        # The panicking method's `self` tells which variant panicked
+        cls: Any = sys._getframe(1).f_locals.get("self").__class__
+        _count((_TYPES.get(cls, ""), cls.__name__ if cls in _TYPES else "", "panic"))
+
+        return f(msg=msg)
+
+    return counted
+
+
+def _patch(owner: Any, name: str, wrapper: Any) -> None:
+    original = owner.__dict__.get(name) if isinstance(owner, type) else getattr(owner, name)
+
+    _patched.append((owner, name, original))
+    setattr(owner, name, wrapper)
+
+
+def is_enabled() -> bool:
+    """Returns if counting is on"""
+    return bool(_patched)
+
+
+def enable() -> None:
+    """Starts counting, does nothing if already counting"""
+    from . import decorators
+
+    if _patched:
+        return
+
+    for cls, type_name in _TYPES.items():
+        variant = cls.__name__
+        # Every variant defines its own `__init__`, which `disable` restores.
+        # One inherited from a base would be deleted instead
+        init = getattr(cls, "__init__")
+        _patch(cls, "__init__", _counting(init, (type_name, variant, "construct")))
+
+        for name in _UNWRAPS:
+            if name in cls.__dict__:
+                _patch(cls, name, _counting(cls.__dict__[name], (type_name, variant, "unwrap")))
+
+        event = "fallback" if cls in _FAILURES else "unwrap"
+
+        for name in _FALLBACKS:
+            if name in cls.__dict__:
+                _patch(cls, name, _counting(cls.__dict__[name], (type_name, variant, event)))
+
+    # Factories and combinators returning shared instances
+    shared = (
+        (option.Option, "none", ("Option", "Nothing", "construct"), _is_none),
+        (result.Result, "ok", ("Result", "Ok", "construct"), _is_interned_ok),
+        (result.Result, "err", ("Result", "Err", "construct"), _is_interned_err),
+    )
+
+    for owner, name, key, check in shared:
+        f = owner.__dict__[name].__func__
+        _patch(owner, name, classmethod(_counting_shared(f, key, check)))
+
+    for name in ("filter", "zip_", "zip_with"):
+        f = Some.__dict__[name]
+        _patch(Some, name, _counting_shared(f, ("Option", "Nothing", "construct"), _is_none))
+
+    # Fast constructors that skip `__init__`
+    for module in (result, decorators):
+        _patch(module, "_new_ok", _counting(module._new_ok, ("Result", "Ok", "construct")))
+        _patch(module, "_new_err", _counting(module._new_err, ("Result", "Err", "construct")))
+
+    for module in (option, result, either):
+        _patch(module, "panic", _counting_panic(module.panic))
+
+
+def disable() -> None:
+    """Stops counting and restores the original methods, keeping the counts"""
+    while _patched:
+        owner, name, original = _patched.pop()
+
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def reset() -> None:
+    """Clears every count"""
+    with _lock:
+        _counts.clear()
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """
+    Returns the counts as `{"Type.Variant.event": {"file:line": count}}`,
+    with the busiest locations first
+    """
+    with _lock:
+        items = list(_counts.items())
+
+    out: dict[str, dict[str, int]] = {}
+
+    for (type_name, variant, event, location), count in sorted(items, key=lambda i: -i[1]):
+        out.setdefault(f"{type_name}.{variant}.{event}", {})[location] = count
+
+    return out
+
+
+def to_json(**kwargs: Any) -> str:
+    """Returns `snapshot()` as JSON, keyword arguments are passed to `json.dumps`"""
+    return json.dumps(snapshot(), **kwargs)
@@ -0,0 +1,262 @@
+"""
+Lazy iterator adapters returning `Option` and `Result`, like Rust's `Iterator`
+
+`Iter` wraps any iterable. Adapters such as `map`, `filter_map` and
+`chunks` return a new `Iter` built on `itertools` and pull one item at a
+time, so they work on streams larger than memory. Consuming methods such
+as `find`, `nth` and `try_fold` return `Option` or `Result` instead of
+raising or returning a sentinel
+
+An `Iter` is an iterator, so it can only be consumed once
+"""
+from __future__ import annotations
+
+from collections import deque
+from itertools import chain, dropwhile, islice, starmap, takewhile
+from operator import attrgetter
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from .option import NONE, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = ["Iter"]
+
+T = TypeVar("T")
+U = TypeVar("U")
+E = TypeVar("E")
+A = TypeVar("A")
+
+_value = attrgetter("_value")
+
+
+def _is_some(o: Any) -> bool:
+    return o.__class__ is Some
+
+
+def _windows(it: Iterator[T], n: int) -> Iterator[tuple[T, ...]]:
+    window = deque(islice(it, n - 1), maxlen=n)
+
+    for item in it:
+        window.append(item)
+        yield tuple(window)
+
+
+class Iter(Generic[T]):
+    """A lazy iterator with Rust-style adapters"""
+
+    __slots__ = ("_it",)
+
+    _it: Iterator[T]
+
+    def __init__(self, iterable: Iterable[T]) -> None:
+        self._it = iter(iterable)
+
+    def __repr__(self) -> str:
+        return f"Iter({self._it!r})"
+
+    def __iter__(self) -> Iterator[T]:
+        return self._it
+
+    def __next__(self) -> T:
+        return next(self._it)
+
+    # adapters
+
+    def map(self, f: Callable[[T], U]) -> Iter[U]:
+        """Transforms every item with `f`"""
+        return Iter(map(f, self._it))
+
+    def starmap(self, f: Callable[..., U]) -> Iter[U]:
+        """Transforms every item with `f`, unpacking the item into arguments"""
+        return Iter(starmap(f, self._it))  # type: ignore[arg-type]
+
+    def filter(self, f: Callable[[T], bool]) -> Iter[T]:
+        """Keeps the items for which `f` returns true"""
+        return Iter(filter(f, self._it))
+
+    def filter_map(self, f: Callable[[T], Option[U]]) -> Iter[U]:
+        """Transforms every item with `f`, keeping the values of the `Some` results"""
+        return Iter(map(_value, filter(_is_some, map(f, self._it))))
+
+    def flat_map(self, f: Callable[[T], Iterable[U]]) -> Iter[U]:
+        """
+        Transforms every item with `f` and flattens the iterables it returns
+
+        `Option` and `Result` iterate over their `Some` or `Ok` value, so
+        `f` may also return those
+        """
+        return Iter(chain.from_iterable(map(f, self._it)))
+
+    def flatten(self) -> Iter[Any]:
+        """Flattens one level of nesting"""
+        return Iter(chain.from_iterable(self._it))  # type: ignore[arg-type]
+
+    def take_while(self, f: Callable[[T], bool]) -> Iter[T]:
+        """Yields items while `f` returns true"""
+        return Iter(takewhile(f, self._it))
+
+    def skip_while(self, f: Callable[[T], bool]) -> Iter[T]:
+        """Skips items while `f` returns true, then yields the rest"""
+        return Iter(dropwhile(f, self._it))
+
+    def take(self, n: int) -> Iter[T]:
+        """Yields at most the first `n` items"""
+        return Iter(islice(self._it, n))
+
+    def skip(self, n: int) -> Iter[T]:
+        """Skips the first `n` items"""
+        return Iter(islice(self._it, n, None))
+
+    def step_by(self, step: int) -> Iter[T]:
+        """Yields the first item and then every `step`th item"""
+        if step < 1:
+            raise ValueError(f"step must be at least 1, got {step}")
+
+        return Iter(islice(self._it, 0, None, step))
+
+    def chunks(self, n: int) -> Iter[tuple[T, ...]]:
+        """Yields tuples of `n` items, the last one may be shorter"""
+        if n < 1:
+            raise ValueError(f"chunk size must be at least 1, got {n}")
+
+        it = self._it
+
+        return Iter(iter(lambda: tuple(islice(it, n)), ()))
+
+    def windows(self, n: int) -> Iter[tuple[T, ...]]:
+        """Yields every overlapping tuple of `n` consecutive items"""
+        if n < 1:
+            raise ValueError(f"window size must be at least 1, got {n}")
+
+        return Iter(_windows(self._it, n))
+
+    def enumerate(self, start: int = 0) -> Iter[tuple[int, T]]:
+        """Pairs every item with its index"""
+        return Iter(enumerate(self._it, start))
+
+    def zip(self, *others: Iterable[Any]) -> Iter[tuple[Any, ...]]:
+        """Pairs items with those of other iterables, stopping at the shortest"""
+        return Iter(zip(self._it, *others))
+
+    def chain(self, *others: Iterable[T]) -> Iter[T]:
+        """Yields the items of other iterables after these"""
+        return Iter(chain(self._it, *others))
+
+    def inspect(self, f: Callable[[T], Any]) -> Iter[T]:
+        """Calls `f` with every item as it passes through"""
+        def call(item: T) -> T:
+            f(item)
+            return item
+
+        return Iter(map(call, self._it))
+
+    # consumers
+
+    def next(self) -> Option[T]:
+        """Returns `Some` of the next item, or `None` if there are none left"""
+        for item in self._it:
+            return Some(item)
+
+        return NONE
+
+    def nth(self, n: int) -> Option[T]:
+        """Returns `Some` of the item at index `n`, consuming the items before it"""
+        for item in islice(self._it, n, None):
+            return Some(item)
+
+        return NONE
+
+    def last(self) -> Option[T]:
+        """Returns `Some` of the last item, consuming every item"""
+        tail = deque(self._it, maxlen=1)
+
+        return Some(tail[0]) if tail else NONE
+
+    def find(self, f: Callable[[T], bool]) -> Option[T]:
+        """Returns `Some` of the first item for which `f` returns true"""
+        for item in filter(f, self._it):
+            return Some(item)
+
+        return NONE
+
+    def find_map(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        """Returns the first `Some` that `f` returns"""
+        for o in filter(_is_some, map(f, self._it)):
+            return o
+
+        return NONE
+
+    def position(self, f: Callable[[T], bool]) -> Option[int]:
+        """Returns `Some` of the index of the first item for which `f` returns true"""
+        for i, matched in enumerate(map(f, self._it)):
+            if matched:
+                return Some(i)
+
+        return NONE
+
+    def fold(self, init: A, f: Callable[[A, T], A]) -> A:
+        """Combines every item into an accumulator with `f`"""
+        acc = init
+
+        for item in self._it:
+            acc = f(acc, item)
+
+        return acc
+
+    def try_fold(self, init: A, f: Callable[[A, T], Result[A, E]]) -> Result[A, E]:
+        """
+        Like `fold`, but `f` returns a `Result`, stops at the first `Err` and
+        returns it, otherwise returns `Ok` of the accumulator
+        """
+        acc = init
+
+        for item in self._it:
+            r = f(acc, item)
+
+            if r.__class__ is not Ok:
+                return r
+
+            acc = r._value
+
+        return Ok(acc)
+
+    def try_for_each(self, f: Callable[[T], Result[Any, E]]) -> Result[None, E]:
+        """Calls `f` with every item, stops at the first `Err` and returns it"""
+        for r in map(f, self._it):
+            if r.__class__ is Err:
+                return r
+
+        return Ok(None)
+
+    def for_each(self, f: Callable[[T], Any]) -> None:
+        """Calls `f` with every item"""
+        deque(map(f, self._it), maxlen=0)
+
+    def count(self) -> int:
+        """Consumes every item and returns how many there were"""
+        # Keeps only the last index, so counting runs in C without a list
+        tail = deque(enumerate(self._it, 1), maxlen=1)
+
+        return tail[0][0] if tail else 0
+
+    def any(self, f: Callable[[T], bool]) -> bool:
+        """Returns if `f` returns true for any item, stopping at the first"""
+        return any(map(f, self._it))
+
+    def all(self, f: Callable[[T], bool]) -> bool:
+        """Returns if `f` returns true for every item, stopping at the first false"""
+        return all(map(f, self._it))
+
+    def partition(self, f: Callable[[T], bool]) -> tuple[list[T], list[T]]:
+        """Returns the items for which `f` returns true, and the rest, as lists"""
+        matched: list[T] = []
+        rest: list[T] = []
+
+        for item in self._it:
+            (matched if f(item) else rest).append(item)
+
+        return matched, rest
+
+    def collect(self, into: Callable[[Iterator[T]], Any] = list) -> Any:
+        """Passes the remaining items to `into`, by default making a list"""
+        return into(self._it)
@@ -1,15 +1,54 @@
-from typing import Generic, Protocol, TypeVar
+from typing import Any, Generic, Optional, Protocol, TypeVar
 
+__all__ = ["PartialEq", "PartialOrd", "par_eq", "par_ord"]
 
 L_co = TypeVar("L_co", covariant=True)
 R_co = TypeVar("R_co", contravariant=True)
 
 
 class PartialEq(Protocol, Generic[L_co, R_co]):
-    def __par_eq__(lhs: L_co, rhs: R_co):
+    def __par_eq__(lhs: L_co, rhs: R_co) -> bool:
         ...
 
 
 class PartialOrd(Protocol, Generic[L_co, R_co]):
-    def __par_ord__(lhs: L_co, rhs: R_co):
+    def __par_ord__(lhs: L_co, rhs: R_co) -> Optional[int]:
+        """
+        Returns -1, 0 or 1 as lhs is less than, equal to or greater than rhs,
+        or `None` if the two cannot be compared
+        """
         ...
+
+
+def par_eq(lhs: Any, rhs: Any) -> bool:
+    """Compares with `__par_eq__` if lhs implements it, otherwise with `==`"""
+    eq = getattr(type(lhs), "__par_eq__", None)
+
+    if eq is None:
+        return lhs == rhs
+
+    return eq(lhs, rhs)
+
+
+def par_ord(lhs: Any, rhs: Any) -> Optional[int]:
+    """
+    Orders with `__par_ord__` if lhs implements it, otherwise with `<` and `==`
+
+    Returns `None` if the two cannot be compared
+    """
+    ord_ = getattr(type(lhs), "__par_ord__", None)
+
+    if ord_ is not None:
+        return ord_(lhs, rhs)
+
+    try:
+        if lhs < rhs:
+            return -1
+        if rhs < lhs:
+            return 1
+        if lhs == rhs:
+            return 0
+    except TypeError:
+        pass
+
+    return None
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import os
-from typing import Callable, Generic, Iterator, TypeVar
+from copyreg import __newobj__  # type: ignore[attr-defined]
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
 
-from .debug import Debug
+from . import origin as _sampling
+from .debug import Debug, _PlainMeta
 from .default import Default
+from .ops import par_ord
 from .panic import panic
-from .result import Result
-from .utils import NULL
+from .utils import EarlyReturn
+
+if TYPE_CHECKING:
+    from .origin import Frame
+    from .pipe import OptionPipe
+    from .result import Result
+
+__all__ = ["NONE", "Nothing", "Option", "Some"]
 
 E = TypeVar("E")
 
@@ -16,29 +24,52 @@ U = TypeVar("U")
 R = TypeVar("R")
 
 
-class Option(Debug, Default, Generic[T]):
+def _ok(val: Any) -> Result[Any, Any]:
+    # Replaced by `Ok` itself on first use, so `result` is only imported
+    # when an `Option` is first converted to a `Result`
+    _import_result()
+
+    return _ok(val)
+
+
+def _err(val: Any) -> Result[Any, Any]:
+    _import_result()
+
+    return _err(val)
+
+
+def _import_result() -> None:
+    global _ok, _err
+
+    from .result import Err, Ok
+
+    _ok, _err = Ok, Err
+
+
+class Option(Debug, Default, Generic[T], metaclass=_PlainMeta):
     """
     Class containing a `Some(T)` or `None` variant
 
     Used where a value may not exist
+
+    Every instance is either a `Some` or a `Nothing`, which implement
+    each method for their variant
+
+    Options are treated as immutable values, so a combinator that leaves
+    the value unchanged (`Nothing.map`, `Some.or_`, `inspect`, a passing
+    `filter`, ...) returns the receiver itself instead of a copy
+
+    `take`, `replace` and the `get_or_insert` family are the exception:
+    they mutate the instance in place, which is visible through every
+    reference to it, including ones returned by earlier combinators.
+    Only call them on an `Option` you own, the shared `NONE` raises
+    `TypeError` instead of being mutated
     """
 
-    vars()["__RAND_LEN"] = 64
-    vars()["__IS_SOME"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
-    vars()["__INNER_SOME_VAL"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
+    __slots__ = ("_value",)
 
-    def __repr__(self) -> str:
-        if self.is_some():
-            return f"Some({self.unwrap()!r})"
-        return "None"
+    _value: Any
+    _rank: int
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -46,6 +77,81 @@ class Option(Debug, Default, Generic[T]):
     def __debug_str__(self) -> str:
         return self.__repr__()
 
+    def debug_string(self) -> str:
+        return self.__repr__()
+
+    def __reduce__(self):
+        return (self.__class__, (self._value,))
+
+    # comparison
+
+    def __lt__(self, other: object) -> bool:
+        """`None` orders before `Some`, then contained values are compared"""
+        if not isinstance(other, Option):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._rank == 1 and self._value < other._value
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Option):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._rank == 0 or self._value <= other._value
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Option):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._rank == 1 and self._value > other._value
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Option):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._rank == 0 or self._value >= other._value
+
+    def __par_eq__(self, other: object) -> bool:
+        """Implements `PartialEq`, equivalent to `==`"""
+        return self == other
+
+    def __par_ord__(self, other: object) -> Optional[int]:
+        """
+        Implements `PartialOrd`, contained values are ordered with `par_ord`
+        so they may implement `PartialOrd` themselves
+        """
+        if not isinstance(other, Option):
+            return None
+
+        if self._rank != other._rank:
+            return -1 if self._rank < other._rank else 1
+
+        if self._rank == 0:
+            return 0
+
+        return par_ord(self._value, other._value)
+
+    @staticmethod
+    def sort_key(value: Option[Any]) -> tuple[Any, ...]:
+        """
+        Key function ordering values the same way as `<`
+
+        Keys are plain tuples, so `sorted(options, key=Option.sort_key)` compares them in C
+        instead of calling `__lt__` for every pair
+        """
+        return (1, value._value) if value.__class__ is Some else (0,)
+
     def __setattr__(self, _name, _val):
         return NotImplemented
 
@@ -53,28 +159,69 @@ class Option(Debug, Default, Generic[T]):
 
     @classmethod
     def __default__(cls) -> Option[T]:
-        """Specifies default variant for `Option`"""
-        return cls.none()
+        """
+        Specifies default variant for `Option`, a new `None` that can be
+        filled with `get_or_insert` or `replace`
+        """
+        return Nothing()
 
     @classmethod
     def some(cls, val: T) -> Option[T]:
         """Creates new `Some` variant of `Option`"""
-        o = cls()
+        return Some(val)
 
-        object.__setattr__(o, object.__getattribute__(cls, "__IS_SOME"), True)
-        object.__setattr__(o, object.__getattribute__(cls, "__INNER_SOME_VAL"), val)
+    @classmethod
+    def none(cls) -> Option[T]:
+        """
+        Returns the shared `None` variant of `Option`
 
-        return o
+        The shared instance cannot be mutated, `get_or_insert` and `replace`
+        raise `TypeError` on it. Use `Nothing()` or `Option.__default__()`
+        to create a `None` that can be filled in
+
+        The shared instance is never sampled by `set_origin_sampling`
+        """
+        return NONE
 
     @classmethod
-    def none(cls) -> Option[T]:
-        """Creates new `None` variant of `Option`"""
-        o = cls()
+    def pipe(cls) -> OptionPipe:
+        """
+        Returns an empty pipeline, steps added to it are compiled into a
+        single function that can be applied to many values
+        """
+        from .pipe import OptionPipe
+
+        return OptionPipe()
+
+    # collect
 
-        object.__setattr__(o, object.__getattribute__(cls, "__IS_SOME"), False)
-        object.__setattr__(o, object.__getattribute__(cls, "__INNER_SOME_VAL"), NULL)
+    @classmethod
+    def collect(
+        cls,
+        options: Iterable[Option[T]],
+        into: Callable[[Iterator[T]], Any] = list,
+    ) -> Option[Any]:
+        """
+        If every element is `Some`, returns `Some` of the contained values
+        passed to `into`, otherwise returns `None`
+
+        Stops at the first `None` without consuming the rest of the iterable
+        """
+        from .collect import collect_options
 
-        return o
+        return collect_options(options, into)
+
+    @classmethod
+    def traverse(
+        cls,
+        f: Callable[[U], Option[T]],
+        iterable: Iterable[U],
+        into: Callable[[Iterator[T]], Any] = list,
+    ) -> Option[Any]:
+        """Maps `f` over the iterable and collects the results like `Option.collect`"""
+        from .collect import traverse_options
+
+        return traverse_options(f, iterable, into)
 
     # some or none
 
@@ -84,7 +231,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `True`
         """
-        return not self.is_some()
+        raise NotImplementedError
 
     def is_some(self) -> bool:
         """
@@ -92,7 +239,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `False`
         """
-        return object.__getattribute__(self, object.__getattribute__(self, "__IS_SOME"))
+        raise NotImplementedError
 
     def is_some_and(self, f: Callable[[T], bool]) -> bool:
         """
@@ -100,10 +247,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `False`
         """
-        if self.is_none():
-            return False
-        else:
-            return f(self.unwrap())
+        raise NotImplementedError
 
     # ok
 
@@ -113,10 +257,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns specified value wrapped in `Err`
         """
-        if self.is_some():
-            return Result.ok(self.unwrap())
-
-        return Result.err(err)
+        raise NotImplementedError
 
     def ok_or_else(self, err: Callable[[], E]) -> Result[T, E]:
         """
@@ -125,10 +266,7 @@ class Option(Debug, Default, Generic[T]):
         If self is `None` variant, returns result of specified predicate
         wrapped in `Err`
         """
-        if self.is_some():
-            return Result.ok(self.unwrap())
-
-        return Result.err(err())
+        raise NotImplementedError
 
     # unwrap
 
@@ -138,12 +276,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, panics
         """
-        if self.is_none():
-            panic(msg="Called `Option.unwrap` on a `None` value")
-        else:
-            return object.__getattribute__(
-                self, object.__getattribute__(self, "__INNER_SOME_VAL")
-            )
+        raise NotImplementedError
 
     def unwrap_or(self, val: T) -> T:
         """
@@ -151,10 +284,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns specified value
         """
-        if self.is_none():
-            return val
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def unwrap_or_default(self, default: Default[T]) -> T:
         """
@@ -162,7 +292,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns default value for type
         """
-        return self.unwrap_or(default.__default__())
+        raise NotImplementedError
 
     def unwrap_or_else(self, f: Callable[[], T]) -> T:
         """
@@ -170,10 +300,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns result of specified predicate
         """
-        if self.is_none():
-            return f()
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def expect(self, msg: str) -> T:
         """
@@ -181,22 +308,28 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, panics with specified error message
         """
-        if self.is_none():
-            panic(msg=msg)
-        else:
-            return self.unwrap()
+        raise NotImplementedError
+
+    def unwrap_or_return(self) -> T:
+        """
+        If self is `Some` variant, returns contained value
+
+        If self is `None` variant, makes the enclosing `try_block` return self
+        """
+        raise NotImplementedError
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        """
+        If self is a `None` sampled by `set_origin_sampling`, returns `Some`
+        of the frames where it was created, innermost first, otherwise `None`
+        """
+        raise NotImplementedError
 
     # inspect
 
     def inspect(self, f: Callable[[T], U]) -> Option[T]:
         """Calls predicate on `Some` variant without modifying it"""
-        if self.is_none():
-            return Option.none()
-
-        inner_val = self.unwrap()
-        f(inner_val)
-
-        return Option.some(inner_val)
+        raise NotImplementedError
 
     # filter
 
@@ -206,10 +339,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `None` variant
         """
-        if self.is_some() and f(self.unwrap()):
-            return Option.some(self.unwrap())
-
-        return Option.none()
+        raise NotImplementedError
 
     # contains
 
@@ -220,7 +350,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `False`
         """
-        return self.map(lambda x: x == val).unwrap_or(False)
+        raise NotImplementedError
 
     # and
 
@@ -230,10 +360,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `None` variant
         """
-        if self.is_none():
-            return Option.none()
-
-        return optb
+        raise NotImplementedError
 
     def and_then(self, f: Callable[[T], Option[U]]) -> Option[U]:
         """
@@ -241,10 +368,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `None` variant
         """
-        if self.is_none():
-            return Option.none()
-
-        return f(self.unwrap())
+        raise NotImplementedError
 
     # or
 
@@ -254,18 +378,15 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns specified option
         """
-        return self.map(lambda x: Option.some(x)).unwrap_or(optb)
+        raise NotImplementedError
 
-    def or_else(self, f: Callable[[], Option[T]]):
+    def or_else(self, f: Callable[[], Option[T]]) -> Option[T]:
         """
         If self is `Some` variant, returns contained value wrapped in `Some`
 
         If self is `None` variant, returns result of specified predicate
         """
-        if self.is_some():
-            return Option.some(self.unwrap())
-
-        return f()
+        raise NotImplementedError
 
     # map
 
@@ -275,12 +396,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `None` variant
         """
-        if self.is_none():
-            return Option.none()
-
-        modified_inner = f(self.unwrap())
-
-        return Option.some(modified_inner)
+        raise NotImplementedError
 
     def map_or(self, default: U, f: Callable[[T], U]) -> U:
         """
@@ -288,10 +404,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns `None` variant
         """
-        if self.is_none():
-            return default
-
-        return f(self.unwrap())
+        raise NotImplementedError
 
     def map_or_else(self, default: Callable[[], U], f: Callable[[T], U]) -> U:
         """
@@ -299,10 +412,7 @@ class Option(Debug, Default, Generic[T]):
 
         If self is `None` variant, returns result of specified predicate
         """
-        if self.is_none():
-            return default()
-
-        return f(self.unwrap())
+        raise NotImplementedError
 
     # get
 
@@ -311,87 +421,368 @@ class Option(Debug, Default, Generic[T]):
         If self is `Some` variant, returns contained value
 
         If self is `None` variant, sets to and returns specified value
-        """
-        if self.is_some():
-            return self.unwrap()
 
-        object.__setattr__(self, object.__getattribute__(self, "__IS_SOME"), True)
-        object.__setattr__(self, object.__getattribute__(self, "__INNER_SOME_VAL"), val)
-
-        return val
+        Mutates self in place
+        """
+        raise NotImplementedError
 
     def get_or_insert_default(self, default: Default) -> T:
         """
         If self is `Some` variant, returns contained value
 
         If self is `None` variant, sets to and returns default for type
+
+        Mutates self in place
         """
-        return self.get_or_insert(default.__default__())
+        raise NotImplementedError
 
     def get_or_insert_with(self, f: Callable[[], T]) -> T:
         """
         If self is `Some` variant, returns contained value
 
         If self is `None` variant, sets to and returns predicate result
+
+        Mutates self in place
         """
-        return self.get_or_insert(f())
+        raise NotImplementedError
 
     # replace
 
     def replace(self, val: T) -> Option[T]:
-        """Returns contained value then sets inner value to specified value"""
-        if self.is_some():
-            inner = Option.some(self.unwrap())
-        else:
-            inner = Option.none()
-
-        object.__setattr__(self, object.__getattribute__(self, "__IS_SOME"), True)
-        object.__setattr__(self, object.__getattribute__(self, "__INNER_SOME_VAL"), val)
+        """
+        Returns contained value then sets inner value to specified value
 
-        return inner
+        Mutates self in place
+        """
+        raise NotImplementedError
 
     # take
 
     def take(self) -> Option[T]:
-        """Returns copy of self, and makes self `None`"""
-        if self.is_some():
-            inner = Option.some(self.unwrap())
-        else:
-            inner = Option.none()
-
-        object.__setattr__(self, object.__getattribute__(self, "__IS_SOME"), False)
-        object.__setattr__(
-            self, object.__getattribute__(self, "__INNER_SOME_VAL"), NULL
-        )
+        """
+        Returns copy of self, and makes self `None`
 
-        return inner
+        Mutates self in place
+        """
+        raise NotImplementedError
 
     # iter
 
     def iter(self) -> Iterator[T]:
         """Transforms self into an iterator containing the `Some` variant"""
-        if self.is_some():
-            yield self.unwrap()
+        raise NotImplementedError
 
-        return
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the contained value if self is `Some`, like `iter`"""
+        raise NotImplementedError
 
     # zip
 
     def zip_(self, other: Option[U]) -> Option[tuple[T, U]]:
         """Zips `self` with `other`"""
-        if not (self.is_some() and other.is_some()):
-            return Option.none()
-
-        return Option.some(
-            (
-                self.unwrap(),
-                other.unwrap(),
-            )
-        )
+        raise NotImplementedError
 
     def zip_with(self, other: Option[U], f: Callable[[T, U], R]) -> Option[R]:
         """Zips `self` and `other` with the specified predicate"""
-        if not (self.is_some() and other.is_some()):
-            return Option.none()
+        raise NotImplementedError
+
+
+class Some(Option[T]):
+    """The `Some(T)` variant of `Option`"""
+
+    __slots__ = ()
+    __match_args__ = ("_value",)
+
+    _rank = 1
+
+    def __init__(self, val: T) -> None:
+        object.__setattr__(self, "_value", val)
+
+    def __repr__(self) -> str:
+        return f"Some({self._value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Some:
+            return self._value == other._value  # type: ignore[attr-defined]
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Some, self._value))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter((self._value,))
+
+    def is_none(self) -> bool:
+        return False
+
+    def is_some(self) -> bool:
+        return True
+
+    def is_some_and(self, f: Callable[[T], bool]) -> bool:
+        return f(self._value)
+
+    def ok_or(self, err: E) -> Result[T, E]:
+        return _ok(self._value)
+
+    def ok_or_else(self, err: Callable[[], E]) -> Result[T, E]:
+        return _ok(self._value)
+
+    def unwrap(self) -> T:
+        return self._value
+
+    def unwrap_or(self, val: T) -> T:
+        return self._value
+
+    def unwrap_or_default(self, default: Default[T]) -> T:
+        return self._value
+
+    def unwrap_or_else(self, f: Callable[[], T]) -> T:
+        return self._value
+
+    def expect(self, msg: str) -> T:
+        return self._value
+
+    def unwrap_or_return(self) -> T:
+        return self._value
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        return NONE
+
+    def inspect(self, f: Callable[[T], U]) -> Option[T]:
+        f(self._value)
+
+        return self
+
+    def filter(self, f: Callable[[T], bool]) -> Option[T]:
+        if f(self._value):
+            return self
+
+        return NONE
+
+    def contains(self, val: U) -> bool:
+        return self._value == val
+
+    def and_(self, optb: Option[U]) -> Option[U]:
+        return optb
+
+    def and_then(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        return f(self._value)
+
+    def or_(self, optb: Option[T]) -> Option[T]:
+        return self
+
+    def or_else(self, f: Callable[[], Option[T]]) -> Option[T]:
+        return self
+
+    def map(self, f: Callable[[T], U]) -> Option[U]:
+        return Some(f(self._value))
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return f(self._value)
+
+    def map_or_else(self, default: Callable[[], U], f: Callable[[T], U]) -> U:
+        return f(self._value)
+
+    def get_or_insert(self, val: T) -> T:
+        return self._value
+
+    def get_or_insert_default(self, default: Default) -> T:
+        return self._value
+
+    def get_or_insert_with(self, f: Callable[[], T]) -> T:
+        return self._value
+
+    def replace(self, val: T) -> Option[T]:
+        inner = Some(self._value)
+
+        object.__setattr__(self, "_value", val)
+
+        return inner
+
+    def take(self) -> Option[T]:
+        inner = Some(self._value)
+
+        object.__setattr__(self, "__class__", Nothing)
+        object.__delattr__(self, "_value")
+
+        return inner
+
+    def iter(self) -> Iterator[T]:
+        return iter((self._value,))
+
+    def zip_(self, other: Option[U]) -> Option[tuple[T, U]]:
+        if isinstance(other, Some):
+            return Some((self._value, other._value))
+
+        return NONE
+
+    def zip_with(self, other: Option[U], f: Callable[[T, U], R]) -> Option[R]:
+        if isinstance(other, Some):
+            return Some(f(self._value, other._value))
+
+        return NONE
+
+
+def _shared_none(method: str) -> TypeError:
+    return TypeError(
+        f"Cannot call `Option.{method}` on the shared `None` value, "
+        "use `Nothing()` for a `None` that can be filled in"
+    )
+
+
+class Nothing(Option[T]):
+    """The `None` variant of `Option`"""
+
+    __slots__ = ()
+    __match_args__ = ()
+
+    _rank = 0
+
+    def __init__(self) -> None:
+        # The unused `_value` slot holds the origin of a sampled `None`
+        if _sampling._every and _sampling._due():
+            object.__setattr__(self, "_value", _sampling._capture())
+
+    def __repr__(self) -> str:
+        origin = getattr(self, "_value", None)
+
+        if origin.__class__ is _sampling._Origin:
+            return f"None{_sampling._format(origin)}"
+
+        return "None"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Nothing:
+            return True
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(Nothing)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(())
+
+    def __reduce__(self):
+        if self is NONE:
+            return "NONE"
+
+        # Rebuilt without `__init__`, so a copy keeps the original origin
+        # instead of being sampled again
+        origin = getattr(self, "_value", None)
+
+        return (__newobj__, (Nothing,), origin if origin.__class__ is _sampling._Origin else None)
+
+    def __setstate__(self, origin: tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_value", origin)
+
+    def is_none(self) -> bool:
+        return True
+
+    def is_some(self) -> bool:
+        return False
+
+    def is_some_and(self, f: Callable[[T], bool]) -> bool:
+        return False
+
+    def ok_or(self, err: E) -> Result[T, E]:
+        return _err(err)
+
+    def ok_or_else(self, err: Callable[[], E]) -> Result[T, E]:
+        return _err(err())
+
+    def unwrap(self) -> T:
+        panic(msg="Called `Option.unwrap` on a `None` value")
+
+    def unwrap_or(self, val: T) -> T:
+        return val
+
+    def unwrap_or_default(self, default: Default[T]) -> T:
+        return default.__default__()
+
+    def unwrap_or_else(self, f: Callable[[], T]) -> T:
+        return f()
+
+    def expect(self, msg: str) -> T:
+        panic(msg=msg)
+
+    def unwrap_or_return(self) -> T:
+        raise EarlyReturn(self)
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        origin = getattr(self, "_value", None)
+
+        if origin.__class__ is _sampling._Origin:
+            return Some(tuple(origin))
+
+        return NONE
+
+    def inspect(self, f: Callable[[T], U]) -> Option[T]:
+        return self
+
+    def filter(self, f: Callable[[T], bool]) -> Option[T]:
+        return self
+
+    def contains(self, val: U) -> bool:
+        return False
+
+    def and_(self, optb: Option[U]) -> Option[U]:
+        return self  # type: ignore[return-value]
+
+    def and_then(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        return self  # type: ignore[return-value]
+
+    def or_(self, optb: Option[T]) -> Option[T]:
+        return optb
+
+    def or_else(self, f: Callable[[], Option[T]]) -> Option[T]:
+        return f()
+
+    def map(self, f: Callable[[T], U]) -> Option[U]:
+        return self  # type: ignore[return-value]
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else(self, default: Callable[[], U], f: Callable[[T], U]) -> U:
+        return default()
+
+    def get_or_insert(self, val: T) -> T:
+        if self is NONE:
+            raise _shared_none("get_or_insert")
+
+        object.__setattr__(self, "__class__", Some)
+        object.__setattr__(self, "_value", val)
+
+        return val
+
+    def get_or_insert_default(self, default: Default) -> T:
+        return self.get_or_insert(default.__default__())
+
+    def get_or_insert_with(self, f: Callable[[], T]) -> T:
+        return self.get_or_insert(f())
+
+    def replace(self, val: T) -> Option[T]:
+        if self is NONE:
+            raise _shared_none("replace")
+
+        object.__setattr__(self, "__class__", Some)
+        object.__setattr__(self, "_value", val)
+
+        return NONE
+
+    def take(self) -> Option[T]:
+        return NONE
+
+    def iter(self) -> Iterator[T]:
+        return iter(())
+
+    def zip_(self, other: Option[U]) -> Option[tuple[T, U]]:
+        return self  # type: ignore[return-value]
+
+    def zip_with(self, other: Option[U], f: Callable[[T, U], R]) -> Option[R]:
+        return self  # type: ignore[return-value]
+
 
-        return Option.some(f(self.unwrap(), other.unwrap()))
+NONE: Option[Any] = Nothing()
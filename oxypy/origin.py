@@ -0,0 +1,176 @@
+"""
+Sampled capture of where `Err` and `None` values are created
+
+Capturing a traceback for every error is far too slow at high error
+rates, so `set_origin_sampling(n)` records a short frame summary for 1
+in `n` of the `Err` values built by `Err(...)`, `Result.err` and
+`Result.from_call`, and of the `None` values built by `Nothing()`. The
+frames are the last `depth` outside of oxypy, innermost first. `origin()`
+returns them and `repr` shows them
+
+While sampling is off each construction pays a single check. Sampling
+never changes which object is returned, so the shared `NONE` from
+`Option.none()` and interned `Err` values never carry an origin
+
+`Err` has no room for an origin, so sampled `Err` values are kept alive
+in a side table with their frames, along with whatever they hold, such
+as an exception and its traceback. Only the last `keep` are kept, by
+default 1024, and older ones silently lose their origin. When sampling
+1 in `every` of `rate` errors a second, an origin lasts about
+`keep * every / rate` seconds, so raise `keep` if errors take longer to
+reach the code that reports them. `keep=None` never drops one, until
+sampling is turned off
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any, NamedTuple, Optional
+
+__all__ = ["Frame", "get_origin_sampling", "set_origin_sampling"]
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+# Checked by the constructors, 0 while sampling is off
+_every = 0
+_depth = 1
+_keep: Optional[int] = 1024
+# Constructions left until the next sample
+_countdown = 0
+
+
+class Frame(NamedTuple):
+    """A frame where a value was created"""
+    filename: str
+    lineno: int
+    function: str
+
+    def __str__(self) -> str:
+        return f"{self.filename}:{self.lineno} in {self.function}"
+
+
+def set_origin_sampling(
+    every: int,
+    depth: int = 1,
+    keep: Optional[int] = 1024,
+) -> tuple[int, int, Optional[int]]:
+    """
+    Records the origin of 1 in `every` `Err` and `None` values, keeping
+    `depth` frames, and returns the previous `(every, depth, keep)`
+
+    `every=1` records every value, `every=0` turns sampling off and
+    forgets every recorded `Err` origin. Only the origins of the last
+    `keep` sampled `Err` values are kept, `None` keeps them all
+    """
+    global _every, _depth, _keep, _countdown
+
+    if every < 0:
+        raise ValueError(f"every must be at least 0, got {every}")
+
+    if depth < 1:
+        raise ValueError(f"depth must be at least 1, got {depth}")
+
+    if keep is not None and keep < 1:
+        raise ValueError(f"keep must be at least 1, got {keep}")
+
+    previous = (_every, _depth, _keep)
+    _every, _depth, _keep = every, depth, keep
+    # The next value is always sampled
+    _countdown = 1
+
+    if _lock is None:
+        _create_table()
+
+    with _lock:
+        if not every:
+            _table.clear()
+
+        while keep is not None and len(_table) > keep:
+            _table.popitem(last=False)
+
+    return previous
+
+
+def get_origin_sampling() -> tuple[int, int, Optional[int]]:
+    """Returns the current `(every, depth, keep)`"""
+    return _every, _depth, _keep
+
+
+def _due() -> bool:
+    # Only called while sampling is on. Unsynchronised, so threads may
+    # sample slightly more or less often than 1 in `every`
+    global _countdown
+
+    _countdown -= 1
+
+    if _countdown > 0:
+        return False
+
+    _countdown = _every
+
+    return True
+
+
+class _Origin(tuple):
+    # Marks captured frames, `Nothing` keeps them in its unused `_value`
+    # slot, where a value left over from `take` can never be an `_Origin`
+    __slots__ = ()
+
+
+# Sampled values without a slot for their origin, by id. Holding the
+# value keeps its id from being reused while its entry exists. Created on
+# first use, so importing oxypy doesn't load `threading`
+_table: Any = None
+_lock: Any = None
+
+
+def _create_table() -> None:
+    global _table, _lock
+
+    import threading
+    from collections import OrderedDict
+
+    # Normally called by `set_origin_sampling` before any value is
+    # sampled. Unpickling a sampled `Err` can get here first, racing
+    # threads then only lose an origin
+    _table = OrderedDict()
+    _lock = threading.Lock()
+
+
+def _capture() -> _Origin:
+    frames: list[Frame] = []
+    frame: Any = sys._getframe(1)
+
+    while frame is not None and len(frames) < _depth:
+        code = frame.f_code
+
+        if not code.co_filename.startswith(_PACKAGE_DIR):
+            frames.append(Frame(code.co_filename, frame.f_lineno, code.co_name))
+
+        frame = frame.f_back
+
+    return _Origin(frames)
+
+
+def _record(value: Any, origin: _Origin) -> None:
+    if _lock is None:
+        _create_table()
+
+    with _lock:
+        _table[id(value)] = (value, origin)
+
+        if _keep is not None and len(_table) > _keep:
+            _table.popitem(last=False)
+
+
+def _lookup(value: Any) -> _Origin | None:
+    if not _table:
+        return None
+
+    entry = _table.get(id(value))
+
+    return entry[1] if entry is not None and entry[0] is value else None
+
+
+def _format(frames: tuple[Frame, ...]) -> str:
+    return f" (created at {' <- '.join(map(str, frames))})"
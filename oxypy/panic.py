@@ -1,7 +1,121 @@
+"""
+Panicking, with a configurable strategy
+
+By default `panic` prints the message and exits, like a Rust panic. A
+long-running process can instead pick one of the strategies
+
+- `"exit"`, prints to stderr and raises `SystemExit(1)` (the default)
+- `"raise"`, raises `Panic`, which can be caught like any exception
+- `"abort"`, prints to stderr and aborts the process without cleanup
+- `"log"`, logs to the `oxypy` logger and raises `Panic`
+- a callable, called with the message, then raises `Panic` if it returns
+
+A panicking method never returns, so the `"log"` and callable strategies
+keep the process running but still stop the code that panicked
+
+`catch_panic` always uses `"raise"` for its call, whatever the strategy,
+and turns a panic into an `Err`
+"""
+import os
 import sys
 import typing
+from contextvars import ContextVar
+
+if typing.TYPE_CHECKING:
+    from .result import Result
+
+__all__ = ["Panic", "catch_panic", "get_panic_strategy", "panic", "set_panic_strategy"]
+
+T = typing.TypeVar("T")
+
+Strategy = typing.Union[str, typing.Callable[[str], typing.Any]]
+
+_STRATEGIES = ("exit", "raise", "abort", "log")
+
+_strategy: Strategy = "exit"
+_traceback = True
+
+# Set by `catch_panic`, so the strategy only changes for its own context
+_FORCE_RAISE: ContextVar[bool] = ContextVar("oxypy_force_raise", default=False)
+
+
+class Panic(Exception):
+    """Raised by `panic` under the `"raise"` strategy and inside `catch_panic`"""
+
+    def __init__(self, msg: str) -> None:
+        super().__init__(msg)
+        self.msg = msg
+
+
+def set_panic_strategy(strategy: Strategy, *, traceback: bool = True) -> Strategy:
+    """
+    Sets how `panic` behaves for the whole process, returns the previous strategy
+
+    With `traceback=False`, a `Panic` caught by `catch_panic` has its
+    traceback dropped, so the `Err` doesn't keep the panicking frames alive
+    """
+    global _strategy, _traceback
+
+    if not callable(strategy) and strategy not in _STRATEGIES:
+        raise ValueError(f"Unknown panic strategy {strategy!r}, expected one of {_STRATEGIES}")
+
+    previous = _strategy
+    _strategy = strategy
+    _traceback = traceback
+
+    return previous
+
+
+def get_panic_strategy() -> Strategy:
+    """Returns the current panic strategy"""
+    return _strategy
 
 
 def panic(*, msg: str) -> typing.NoReturn:
-    print("Panicked:", msg, file=sys.stderr)
-    sys.exit(1)
+    """Panics with the message, according to the current strategy"""
+    if _FORCE_RAISE.get():
+        raise Panic(msg)
+
+    strategy = _strategy
+
+    if strategy == "exit":
+        print("Panicked:", msg, file=sys.stderr)
+        sys.exit(1)
+
+    if strategy == "raise":
+        raise Panic(msg)
+
+    if strategy == "abort":
+        print("Panicked:", msg, file=sys.stderr)
+        sys.stderr.flush()
+        os.abort()
+
+    if strategy == "log":
+        import logging
+
+        logging.getLogger("oxypy").error("Panicked: %s", msg)
+    elif callable(strategy):
+        strategy(msg)
+
+    raise Panic(msg)
+
+
+def catch_panic(
+    f: typing.Callable[..., T], *args: typing.Any, **kwargs: typing.Any,
+) -> "Result[T, Panic]":
+    """
+    Calls `f` with the arguments, returns `Ok` of its return value or `Err`
+    of the `Panic` if it panicked
+
+    Other exceptions propagate
+    """
+    from .result import Err, Ok
+
+    token = _FORCE_RAISE.set(True)
+
+    try:
+        return Ok(f(*args, **kwargs))
+    except Panic as e:
+        return Err(e if _traceback else e.with_traceback(None))
+    finally:
+        _FORCE_RAISE.reset(token)
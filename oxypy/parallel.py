@@ -0,0 +1,155 @@
+"""
+Mapping `Result`-returning functions over thread and process pools
+
+`par_map` sends the input to an executor in chunks and yields one
+`Result` per item. A worker exception or `panic` becomes an `Err` for
+that item, so one bad input doesn't stop the map or kill a pool process.
+Panics in `f` always raise `Panic`, like inside `catch_panic`
+
+Only a bounded number of chunks is in flight at once and items are
+pulled from the input as chunks are handed out, so memory stays flat on
+unbounded iterators. Unless `chunksize` is given, chunk sizes adapt so
+each chunk takes about `_TARGET_SECONDS` of worker time
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .panic import _FORCE_RAISE
+from .result import Err, Ok, Result
+
+__all__ = ["par_map"]
+
+_TARGET_SECONDS = 0.02
+_MAX_CHUNK = 4096
+
+
+def _run_chunk(f: Callable[[Any], Any], chunk: list[Any]) -> tuple[float, list[Result[Any, Any]]]:
+    # Runs in the worker, so it has to be a picklable module-level function
+    start = perf_counter()
+    out = []
+    token = _FORCE_RAISE.set(True)
+
+    try:
+        for item in chunk:
+            try:
+                r = f(item)
+            except (Exception, SystemExit) as e:
+                r = Err(e)
+            else:
+                if r.__class__ is not Ok and r.__class__ is not Err:
+                    r = Ok(r)
+
+            out.append(r)
+    finally:
+        _FORCE_RAISE.reset(token)
+
+    return perf_counter() - start, out
+
+
+def _next_size(size: int, elapsed: float, count: int) -> int:
+    # Moves towards the size that takes `_TARGET_SECONDS`, at most
+    # doubling or halving per chunk so one outlier can't swing it far
+    ideal = _TARGET_SECONDS * count / max(elapsed, 1e-9)
+
+    return int(max(1, min(ideal, size * 2, _MAX_CHUNK), size // 2))
+
+
+def _outcome(future: Future, count: int) -> list[Result[Any, Any]]:
+    try:
+        return future.result()[1]
+    except BaseException as e:
+        # The chunk itself failed, e.g. a broken pool or unpicklable result
+        return [Err(e)] * count
+
+
+def par_map(
+    f: Callable[[Any], Any],
+    items: Iterable[Any],
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Result[Any, Any]]:
+    """
+    Maps `f` over the items on an executor, yielding a `Result` per item
+
+    A `Result` returned by `f` is kept as it is, any other value becomes
+    `Ok`, and an exception or `panic` becomes `Err`
+
+    `executor` defaults to a thread pool that is shut down when the
+    iterator finishes. With a process pool, `f`, the items and the
+    results must be picklable
+
+    `ordered=False` yields chunks as they finish instead of in input
+    order. `max_pending` bounds the chunks in flight, by default twice
+    the CPU count
+    """
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1)
+
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+
+    return _par_map(f, iter(items), executor, chunksize, ordered, max_pending)
+
+
+def _par_map(
+    f: Callable[[Any], Any],
+    items: Iterator[Any],
+    executor: Optional[Executor],
+    chunksize: Optional[int],
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[Result[Any, Any]]:
+    owned = executor is None
+    pool = ThreadPoolExecutor() if executor is None else executor
+    size = chunksize or 1
+    # Futures in submission order, mapped to their chunk length
+    pending: dict[Future, int] = {}
+    exhausted = False
+
+    def submit() -> None:
+        nonlocal exhausted
+
+        while not exhausted and len(pending) < max_pending:
+            chunk = list(islice(items, size))
+
+            if not chunk:
+                exhausted = True
+                return
+
+            pending[pool.submit(_run_chunk, f, chunk)] = len(chunk)
+
+    try:
+        submit()
+
+        while pending:
+            if ordered:
+                done = [next(iter(pending))]
+            else:
+                done = list(wait(pending, return_when=FIRST_COMPLETED).done)
+
+            for future in done:
+                count = pending.pop(future)
+
+                if chunksize is None and not future.exception():
+                    size = _next_size(size, future.result()[0], count)
+
+                results = _outcome(future, count)
+                submit()
+
+                yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if owned:
+            pool.shutdown(wait=True)
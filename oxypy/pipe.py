@@ -0,0 +1,201 @@
+"""
+Lazy pipelines of `Option`, `Result` and `Either` combinators
+
+A pipe records steps such as `Option.pipe().map(a).filter(b).and_then(c)`
+and compiles them once into a single function. The function keeps the
+contained value in a local and only wraps it at the end, so applying a
+pipe allocates at most one new value instead of one per step
+
+Pipes are immutable, so they can be built once at import time and shared
+between threads. Each step returns a new pipe
+
+Applying a pipe gives the same value as calling the combinators in turn,
+including returning the input itself when no step changes it
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, ClassVar, Generic, Iterable, TypeVar
+
+from .either import Either, Left, Right
+from .option import NONE, Option, Some
+from .result import Err, Ok, Result
+
+__all__ = ["EitherPipe", "OptionPipe", "Pipe", "ResultPipe"]
+
+V = TypeVar("V")
+
+# Each step is one `if` on the `ok` flag, so a failed step skips the rest
+# until a step that handles the failure. `cur` holds the current wrapped
+# value, or `None` if it has to be built from `v` at the end
+_MAP = "if {state}:\n    v = {f}(v)\n    cur = None"
+_INSPECT = "if {state}:\n    {f}(v)"
+
+
+class Pipe(Generic[V]):
+    """Base class for pipes, holding the recorded steps and the compiled function"""
+
+    __slots__ = ("_steps", "_compiled")
+
+    _steps: tuple[tuple[str, Callable[..., Any]], ...]
+    _compiled: Any
+
+    _HEAD: ClassVar[str]
+    _TAIL: ClassVar[str]
+    _STEPS: ClassVar[dict[str, str]]
+    _GLOBALS: ClassVar[dict[str, Any]]
+
+    def __init__(self, steps: tuple[tuple[str, Callable[..., Any]], ...] = ()) -> None:
+        self._steps = steps
+        self._compiled = None
+
+    def __repr__(self) -> str:
+        steps = "".join(f".{name}({getattr(f, '__name__', f)!s})" for name, f in self._steps)
+
+        return f"{self.__class__.__name__}(){steps}"
+
+    def __call__(self, value: V) -> V:
+        """Applies the pipe to a single value"""
+        return self.compile()(value)
+
+    def _then(self, name: str, f: Callable[..., Any]) -> Any:
+        return self.__class__(self._steps + ((name, f),))
+
+    def compile(self) -> Callable[[V], V]:
+        """
+        Returns the compiled function, calling it directly skips one call
+        per value in hot loops
+        """
+        compiled = self._compiled
+
+        if compiled is None:
+            # Compiling twice from two threads is harmless, both results are equal
+            compiled = self._compiled = _compile(self)
+
+        return compiled
+
+    def batch(self, values: Iterable[V]) -> list[V]:
+        """Applies the pipe to every value"""
+        return list(map(self.compile(), values))
+
+
+def _compile(pipe: Pipe[Any]) -> Callable[[Any], Any]:
+    namespace = dict(pipe._GLOBALS)
+    lines = [pipe._HEAD]
+
+    for i, (name, f) in enumerate(pipe._steps):
+        namespace[f"f{i}"] = f
+        lines.append(pipe._STEPS[name].format(f=f"f{i}"))
+
+    lines.append(pipe._TAIL)
+
+    body = "\n".join(lines).replace("\n", "\n    ")
+    exec(f"def run(x):\n    {body}", namespace)
+
+    return namespace["run"]
+
+
+class OptionPipe(Pipe[Option[Any]]):
+    """A pipe of `Option` combinators, created with `Option.pipe()`"""
+
+    __slots__ = ()
+
+    _HEAD = "cur = x\nok = x.__class__ is Some\nv = x._value if ok else None"
+    _TAIL = "return cur if cur is not None else Some(v)"
+    _STEPS = {
+        "map": _MAP.format(state="ok", f="{f}"),
+        "inspect": _INSPECT.format(state="ok", f="{f}"),
+        "filter": "if ok and not {f}(v):\n    ok = False\n    cur = NONE",
+        "and_then": (
+            "if ok:\n    cur = {f}(v)\n    ok = cur.__class__ is Some\n"
+            "    if ok:\n        v = cur._value"
+        ),
+        "or_else": (
+            "if not ok:\n    cur = {f}()\n    ok = cur.__class__ is Some\n"
+            "    if ok:\n        v = cur._value"
+        ),
+    }
+    _GLOBALS = {"Some": Some, "NONE": NONE}
+
+    def map(self, f: Callable[[Any], Any]) -> OptionPipe:
+        """Adds an `Option.map` step"""
+        return self._then("map", f)
+
+    def inspect(self, f: Callable[[Any], Any]) -> OptionPipe:
+        """Adds an `Option.inspect` step"""
+        return self._then("inspect", f)
+
+    def filter(self, f: Callable[[Any], bool]) -> OptionPipe:
+        """Adds an `Option.filter` step"""
+        return self._then("filter", f)
+
+    def and_then(self, f: Callable[[Any], Option[Any]]) -> OptionPipe:
+        """Adds an `Option.and_then` step"""
+        return self._then("and_then", f)
+
+    def or_else(self, f: Callable[[], Option[Any]]) -> OptionPipe:
+        """Adds an `Option.or_else` step"""
+        return self._then("or_else", f)
+
+
+class ResultPipe(Pipe[Result[Any, Any]]):
+    """A pipe of `Result` combinators, created with `Result.pipe()`"""
+
+    __slots__ = ()
+
+    _HEAD = "cur = x\nok = x.__class__ is Ok\nv = x._value"
+    _TAIL = "if cur is None:\n    return Ok(v) if ok else Err(v)\nreturn cur"
+    _STEPS = {
+        "map": _MAP.format(state="ok", f="{f}"),
+        "map_err": _MAP.format(state="not ok", f="{f}"),
+        "inspect": _INSPECT.format(state="ok", f="{f}"),
+        "inspect_err": _INSPECT.format(state="not ok", f="{f}"),
+        "and_then": "if ok:\n    cur = {f}(v)\n    ok = cur.__class__ is Ok\n    v = cur._value",
+        "or_else": "if not ok:\n    cur = {f}(v)\n    ok = cur.__class__ is Ok\n    v = cur._value",
+    }
+    _GLOBALS = {"Ok": Ok, "Err": Err}
+
+    def map(self, f: Callable[[Any], Any]) -> ResultPipe:
+        """Adds a `Result.map` step"""
+        return self._then("map", f)
+
+    def map_err(self, f: Callable[[Any], Any]) -> ResultPipe:
+        """Adds a `Result.map_err` step"""
+        return self._then("map_err", f)
+
+    def inspect(self, f: Callable[[Any], Any]) -> ResultPipe:
+        """Adds a `Result.inspect` step"""
+        return self._then("inspect", f)
+
+    def inspect_err(self, f: Callable[[Any], Any]) -> ResultPipe:
+        """Adds a `Result.inspect_err` step"""
+        return self._then("inspect_err", f)
+
+    def and_then(self, f: Callable[[Any], Result[Any, Any]]) -> ResultPipe:
+        """Adds a `Result.and_then` step"""
+        return self._then("and_then", f)
+
+    def or_else(self, f: Callable[[Any], Result[Any, Any]]) -> ResultPipe:
+        """Adds a `Result.or_else` step"""
+        return self._then("or_else", f)
+
+
+class EitherPipe(Pipe[Either[Any, Any]]):
+    """A pipe of `Either` combinators, created with `Either.pipe()`"""
+
+    __slots__ = ()
+
+    _HEAD = "cur = x\nok = x.__class__ is Left\nv = x._value"
+    _TAIL = "if cur is None:\n    return Left(v) if ok else Right(v)\nreturn cur"
+    _STEPS = {
+        "left_and_then": _MAP.format(state="ok", f="{f}"),
+        "right_and_then": _MAP.format(state="not ok", f="{f}"),
+    }
+    _GLOBALS = {"Left": Left, "Right": Right}
+
+    def left_and_then(self, f: Callable[[Any], Any]) -> EitherPipe:
+        """Adds an `Either.left_and_then` step"""
+        return self._then("left_and_then", f)
+
+    def right_and_then(self, f: Callable[[Any], Any]) -> EitherPipe:
+        """Adds an `Either.right_and_then` step"""
+        return self._then("right_and_then", f)
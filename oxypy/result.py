@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-import os
-from typing import Callable, Generic, Iterator, TypeVar
+from copyreg import __newobj__  # type: ignore[attr-defined]
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Generic, Iterable, Iterator, Optional, TypeVar,
+)
 
-from .debug import Debug
+from . import origin as _sampling
+from .debug import Debug, _PlainMeta
 from .default import Default
+from .ops import par_ord
 from .panic import panic
-from .utils import NULL
+from .utils import EarlyReturn
 
-__all__ = ["Result"]
+if TYPE_CHECKING:
+    from .aio import AsyncResult
+    from .option import Option
+    from .origin import Frame
+    from .pipe import ResultPipe
+
+__all__ = ["Err", "Ok", "Result"]
 
 E = TypeVar("E")
 F = TypeVar("F")
@@ -18,35 +28,24 @@ U = TypeVar("U")
 R = TypeVar("R")
 
 
-class Result(Debug, Generic[T, E]):
+class Result(Debug, Generic[T, E], metaclass=_PlainMeta):
     """
     Class containing either an `Ok(T)` or `Err(E)` variant
 
     Used for expressing where a process may be erraneous or may fail
+
+    Every instance is either an `Ok` or an `Err`, which implement
+    each method for their variant
+
+    Results are immutable, so a combinator that leaves the value
+    unchanged (`Ok.map_err`, `Err.map`, `inspect`, ...) returns the
+    receiver itself instead of a copy
     """
 
-    vars()["__RAND_LEN"] = 64
-    vars()["__INNER_OK_VAL"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
-    vars()["__INNER_ERR_VAL"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
-    vars()["__IS_OK"] = (
-        os.urandom(vars()["__RAND_LEN"])
-        .decode(errors="ignore")
-        .center(vars()["__RAND_LEN"] + 2)
-    )
+    __slots__ = ("_value",)
 
-    def __repr__(self) -> str:
-        if self.is_ok():
-            return f"Ok({self.unwrap()!r})"
-        else:
-            return f"Err({self.unwrap_err()!r})"
+    _value: Any
+    _rank: int
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -54,6 +53,78 @@ class Result(Debug, Generic[T, E]):
     def __debug_str__(self) -> str:
         return self.__repr__()
 
+    def debug_string(self) -> str:
+        return self.__repr__()
+
+    def __reduce__(self):
+        return (self.__class__, (self._value,))
+
+    # comparison
+
+    def __lt__(self, other: object) -> bool:
+        """`Ok` orders before `Err`, then contained values are compared"""
+        if not isinstance(other, Result):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._value < other._value
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank < other._rank
+
+        return self._value <= other._value
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._value > other._value
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+
+        if self._rank != other._rank:
+            return self._rank > other._rank
+
+        return self._value >= other._value
+
+    def __par_eq__(self, other: object) -> bool:
+        """Implements `PartialEq`, equivalent to `==`"""
+        return self == other
+
+    def __par_ord__(self, other: object) -> Optional[int]:
+        """
+        Implements `PartialOrd`, contained values are ordered with `par_ord`
+        so they may implement `PartialOrd` themselves
+        """
+        if not isinstance(other, Result):
+            return None
+
+        if self._rank != other._rank:
+            return -1 if self._rank < other._rank else 1
+
+        return par_ord(self._value, other._value)
+
+    @staticmethod
+    def sort_key(value: Result[Any, Any]) -> tuple[Any, ...]:
+        """
+        Key function ordering values the same way as `<`
+
+        Keys are plain tuples, so `sorted(results, key=Result.sort_key)` compares them in C
+        instead of calling `__lt__` for every pair
+        """
+        return (1 if value.__class__ is Err else 0, value._value)
+
     def __setattr__(self, _name, _value) -> None:
         pass
 
@@ -61,53 +132,152 @@ class Result(Debug, Generic[T, E]):
 
     @classmethod
     def ok(cls, val: T) -> Result[T, E]:
-        """Creates a new `Ok` variant of `Result`"""
-        r = cls()
+        """
+        Creates a new `Ok` variant of `Result`
+
+        Returns a shared instance if the value has been interned
+        """
+        r = _OK_INTERNED.get(id(val))
 
-        object.__setattr__(r, object.__getattribute__(cls, "__IS_OK"), True)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_OK_VAL"), val)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_ERR_VAL"), NULL)
+        if r is None:
+            return Ok(val)
 
         return r
 
     @classmethod
     def err(cls, val: E) -> Result[T, E]:
-        """Creates a new `Err` variant of `Result`"""
-        r = cls()
+        """
+        Creates a new `Err` variant of `Result`
 
-        object.__setattr__(r, object.__getattribute__(cls, "__IS_OK"), False)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_OK_VAL"), NULL)
-        object.__setattr__(r, object.__getattribute__(cls, "__INNER_ERR_VAL"), val)
+        Returns a shared instance if the value has been interned
+        """
+        r = _ERR_INTERNED.get(id(val))
+
+        if r is None:
+            return Err(val)
 
         return r
 
+    @classmethod
+    def intern_ok(cls, *vals: Any) -> None:
+        """
+        Makes `Result.ok` return a single shared instance for each value
+
+        Values are matched by identity, so this suits singletons such as
+        `None`, `True` and `False`, small ints and interned strings
+        """
+        for val in vals:
+            _OK_INTERNED.setdefault(id(val), Ok(val))
+
+    @classmethod
+    def intern_err(cls, *vals: Any) -> None:
+        """
+        Makes `Result.err` return a single shared instance for each value
+
+        Values are matched by identity, like `Result.intern_ok`
+        """
+        for val in vals:
+            if id(val) not in _ERR_INTERNED:
+                # Built without `__init__`, so a shared value is never sampled
+                r = _new(Err)
+                _set_value(r, val)
+                _ERR_INTERNED[id(val)] = r
+
+    @classmethod
+    def pipe(cls) -> ResultPipe:
+        """
+        Returns an empty pipeline, steps added to it are compiled into a
+        single function that can be applied to many values
+        """
+        from .pipe import ResultPipe
+
+        return ResultPipe()
+
+    @classmethod
+    def from_call(
+        cls,
+        f: Callable[..., T],
+        *args: Any,
+        catch: tuple[type[BaseException], ...] = (Exception,),
+        traceback: bool = True,
+        **kwargs: Any,
+    ) -> Result[T, Any]:
+        """
+        Calls `f` with the arguments, returns `Ok` of its return value or
+        `Err` of an exception of one of the `catch` types
+
+        With `traceback=False` the exception's traceback is dropped, so
+        long-lived errors don't keep the failing frames alive
+        """
+        try:
+            return _new_ok(f(*args, **kwargs))
+        except catch as e:
+            if not traceback:
+                e.__traceback__ = None
+
+            return _new_err(e)
+
+    @classmethod
+    def from_awaitable(
+        cls,
+        aw: Awaitable[T],
+        catch: tuple[type[BaseException], ...] = (Exception,),
+    ) -> AsyncResult[T, Any]:
+        """
+        Wraps an awaitable in an `AsyncResult`, its value becomes `Ok` and
+        an exception of one of the `catch` types becomes `Err`
+        """
+        from .aio import AsyncResult
+
+        return AsyncResult.from_awaitable(aw, catch)
+
+    # collect
+
+    @classmethod
+    def collect(
+        cls,
+        results: Iterable[Result[T, E]],
+        into: Callable[[Iterator[T]], Any] = list,
+    ) -> Result[Any, E]:
+        """
+        If every element is `Ok`, returns `Ok` of the contained values
+        passed to `into`, otherwise returns the first `Err`
+
+        Stops at the first `Err` without consuming the rest of the iterable
+        """
+        from .collect import collect_results
+
+        return collect_results(results, into)
+
+    @classmethod
+    def traverse(
+        cls,
+        f: Callable[[U], Result[T, E]],
+        iterable: Iterable[U],
+        into: Callable[[Iterator[T]], Any] = list,
+    ) -> Result[Any, E]:
+        """Maps `f` over the iterable and collects the results like `Result.collect`"""
+        from .collect import traverse_results
+
+        return traverse_results(f, iterable, into)
+
     # ok or err
 
     def is_ok(self) -> bool:
         """Returns if self is an `Ok` variant"""
-        return not not object.__getattribute__(
-            self, object.__getattribute__(self, "__IS_OK")
-        )
+        raise NotImplementedError
 
     def is_ok_and(self, f: Callable[[T], bool]) -> bool:
         """Returns `True` if self is an `Ok` variant and matches predicate"""
-        if self.is_err():
-            return False
-
-        return f(self.unwrap())
+        raise NotImplementedError
 
     def is_err(self) -> bool:
         """Returns `True` if self is an `Err` variant"""
-        return not object.__getattribute__(
-            self, object.__getattribute__(self, "__IS_OK")
-        )
+        raise NotImplementedError
 
     def is_err_and(self, f: Callable[[E], bool]) -> bool:
         """Returns `False` if self is an `Err` variant and matches predicate"""
-        if self.is_ok():
-            return False
-
-        return f(self.unwrap_err())
+        raise NotImplementedError
 
     # unwrap
 
@@ -117,12 +287,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Err` variant, panics
         """
-        if self.is_err():
-            panic(msg="Called `Result.unwrap` on an `Err` variant")
-        else:
-            return object.__getattribute__(
-                self, object.__getattribute__(self, "__INNER_OK_VAL")
-            )
+        raise NotImplementedError
 
     def unwrap_or(self, val: T) -> T:
         """
@@ -130,10 +295,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Err` variant, returns specified value
         """
-        if self.is_err():
-            return val
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def unwrap_or_else(self, f: Callable[[E], T]) -> T:
         """
@@ -141,10 +303,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Err` variant, returns predicate result, passing it the err
         """
-        if self.is_err():
-            return f(self.unwrap_err())
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def unwrap_or_default(self, default: Default[T]) -> T:
         """
@@ -152,10 +311,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Err` variant, returns default value for type
         """
-        if self.is_err():
-            return default.__default__()
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def unwrap_err(self) -> E:
         """
@@ -163,12 +319,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Ok` variant, panics
         """
-        if self.is_ok():
-            panic(msg="Called `Result.unwrap_err` on an `Ok` variant")
-        else:
-            return object.__getattribute__(
-                self, object.__getattribute__(self, "__INNER_ERR_VAL")
-            )
+        raise NotImplementedError
 
     def expect(self, msg: str) -> T:
         """
@@ -176,10 +327,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Err` variant, panics with the specified error message
         """
-        if self.is_err():
-            panic(msg=msg)
-        else:
-            return self.unwrap()
+        raise NotImplementedError
 
     def expect_err(self, msg: str) -> E:
         """
@@ -187,35 +335,48 @@ class Result(Debug, Generic[T, E]):
 
         If self is `Ok` variant, panics with the specified error message
         """
-        if self.is_ok():
-            panic(msg=msg)
-        else:
-            return self.unwrap_err()
+        raise NotImplementedError
+
+    def unwrap_or_raise(self, exc: Optional[Callable[[E], BaseException]] = None) -> T:
+        """
+        If self is `Ok` variant, returns contained value
+
+        If self is `Err` variant, raises `exc` called with the contained
+        value, or by default the contained value itself if it is an
+        exception and a `ValueError` holding it otherwise
+        """
+        raise NotImplementedError
+
+    def unwrap_or_return(self) -> T:
+        """
+        If self is `Ok` variant, returns contained value
+
+        If self is `Err` variant, makes the enclosing `try_block` return self
+        """
+        raise NotImplementedError
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        """
+        If self is an `Err` sampled by `set_origin_sampling`, returns `Some`
+        of the frames where it was created, innermost first, otherwise `None`
+        """
+        raise NotImplementedError
 
     # contains
 
     def contains(self, val: U) -> bool:
         """Returns whether the contained `Ok` value matches specified value"""
-        if self.is_ok():
-            return self.unwrap() == val
-        else:
-            return False
+        raise NotImplementedError
 
     def contains_err(self, val: F) -> bool:
         """Returns whether the contained `Err` value matches specified value"""
-        if self.is_err():
-            return self.unwrap_err() == val
-        else:
-            return False
+        raise NotImplementedError
 
     # map
 
     def map(self, f: Callable[[T], U]) -> Result[U, E]:
         """If self is an `Ok` variant, transform it with the predicate"""
-        if self.is_ok():
-            return Result.ok(f(self.unwrap()))
-        else:
-            return Result.err(self.unwrap_err())
+        raise NotImplementedError
 
     def map_or(self, default: U, f: Callable[[T], U]) -> U:
         """
@@ -223,10 +384,7 @@ class Result(Debug, Generic[T, E]):
 
         If self is an `Err` variant, replace it with the value
         """
-        if self.is_ok():
-            return f(self.unwrap())
-        else:
-            return default
+        raise NotImplementedError
 
     def map_or_else(self, default: Callable[[E], U], f: Callable[[T], U]) -> U:
         """
@@ -234,50 +392,326 @@ class Result(Debug, Generic[T, E]):
 
         If self is an `Err` variant, replace it with the predicate value
         """
-        if self.is_ok():
-            return f(self.unwrap())
-        else:
-            return default(self.unwrap_err())
+        raise NotImplementedError
 
     def map_err(self, f: Callable[[E], F]) -> Result[T, F]:
         """If self is an `Err` variant, transform it with the predicate f"""
-        if self.is_ok():
-            return Result.ok(self.unwrap())
-        else:
-            return Result.err(f(self.unwrap_err()))
+        raise NotImplementedError
+
+    # and / or
+
+    def and_then(self, f: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        """
+        If self is `Ok` variant, returns result of specified predicate
+
+        If self is `Err` variant, returns self
+        """
+        raise NotImplementedError
+
+    def or_else(self, f: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        """
+        If self is `Ok` variant, returns self
+
+        If self is `Err` variant, returns result of specified predicate
+        """
+        raise NotImplementedError
 
     # inspect
 
     def inspect(self, f: Callable[[T], None]) -> Result[T, E]:
         """Calls a predicate on an `Ok` variant without modifying it"""
-        if self.is_ok():
-            f(self.unwrap())
-
-            return Result.ok(self.unwrap())
-        else:
-            return Result.err(self.unwrap_err())
+        raise NotImplementedError
 
     def inspect_err(self, f: Callable[[E], None]) -> Result[T, E]:
         """Calls a predicate on an `Err` variant without modifying the value"""
-        if self.is_ok():
-            return Result.ok(self.unwrap())
-        else:
-            f(self.unwrap_err())
-
-            return Result.err(self.unwrap_err())
+        raise NotImplementedError
 
     # iter
 
     def iter(self) -> Iterator[T]:
         """Transforms self into an iterator containing the `Ok` variant"""
-        if self.is_ok():
-            yield self.unwrap()
-
-        return
+        raise NotImplementedError
 
     def iter_err(self) -> Iterator[E]:
         """Transforms self into an iterator containing the `Err` variant"""
-        if self.is_err():
-            yield self.unwrap_err()
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the contained value if self is `Ok`, like `iter`"""
+        raise NotImplementedError
+
+
+class Ok(Result[T, E]):
+    """The `Ok(T)` variant of `Result`"""
+
+    __slots__ = ()
+    __match_args__ = ("_value",)
+
+    _rank = 0
+
+    def __init__(self, val: T) -> None:
+        object.__setattr__(self, "_value", val)
+
+    def __repr__(self) -> str:
+        return f"Ok({self._value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Ok:
+            return self._value == other._value  # type: ignore[attr-defined]
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Ok, self._value))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter((self._value,))
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_ok_and(self, f: Callable[[T], bool]) -> bool:
+        return f(self._value)
+
+    def is_err(self) -> bool:
+        return False
+
+    def is_err_and(self, f: Callable[[E], bool]) -> bool:
+        return False
+
+    def unwrap(self) -> T:
+        return self._value
+
+    def unwrap_or(self, val: T) -> T:
+        return self._value
+
+    def unwrap_or_else(self, f: Callable[[E], T]) -> T:
+        return self._value
+
+    def unwrap_or_default(self, default: Default[T]) -> T:
+        return self._value
+
+    def unwrap_err(self) -> E:
+        panic(msg="Called `Result.unwrap_err` on an `Ok` variant")
+
+    def expect(self, msg: str) -> T:
+        return self._value
+
+    def expect_err(self, msg: str) -> E:
+        panic(msg=msg)
+
+    def unwrap_or_raise(self, exc: Optional[Callable[[E], BaseException]] = None) -> T:
+        return self._value
+
+    def unwrap_or_return(self) -> T:
+        return self._value
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        from .option import NONE
+
+        return NONE
+
+    def contains(self, val: U) -> bool:
+        return self._value == val
+
+    def contains_err(self, val: F) -> bool:
+        return False
+
+    def map(self, f: Callable[[T], U]) -> Result[U, E]:
+        return Ok(f(self._value))
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return f(self._value)
+
+    def map_or_else(self, default: Callable[[E], U], f: Callable[[T], U]) -> U:
+        return f(self._value)
+
+    def map_err(self, f: Callable[[E], F]) -> Result[T, F]:
+        return self  # type: ignore[return-value]
+
+    def and_then(self, f: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return f(self._value)
+
+    def or_else(self, f: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        return self  # type: ignore[return-value]
+
+    def inspect(self, f: Callable[[T], None]) -> Result[T, E]:
+        f(self._value)
+
+        return self
+
+    def inspect_err(self, f: Callable[[E], None]) -> Result[T, E]:
+        return self
+
+    def iter(self) -> Iterator[T]:
+        return iter((self._value,))
+
+    def iter_err(self) -> Iterator[E]:
+        return iter(())
+
+
+class Err(Result[T, E]):
+    """The `Err(E)` variant of `Result`"""
+
+    __slots__ = ()
+    __match_args__ = ("_value",)
+
+    _rank = 1
+
+    def __init__(self, val: E) -> None:
+        object.__setattr__(self, "_value", val)
+
+        if _sampling._every and _sampling._due():
+            _sampling._record(self, _sampling._capture())
+
+    def __repr__(self) -> str:
+        origin = _sampling._lookup(self)
+
+        if origin is None:
+            return f"Err({self._value!r})"
+
+        return f"Err({self._value!r}){_sampling._format(origin)}"
+
+    def __reduce__(self):
+        # Rebuilt without `__init__`, so a copy keeps the original origin
+        # instead of being sampled again
+        return (__newobj__, (Err,), (self._value, _sampling._lookup(self)))
+
+    def __setstate__(self, state: tuple[Any, Any]) -> None:
+        val, origin = state
+        object.__setattr__(self, "_value", val)
+
+        if origin is not None:
+            _sampling._record(self, origin)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is Err:
+            return self._value == other._value  # type: ignore[attr-defined]
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Err, self._value))
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(())
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_ok_and(self, f: Callable[[T], bool]) -> bool:
+        return False
+
+    def is_err(self) -> bool:
+        return True
+
+    def is_err_and(self, f: Callable[[E], bool]) -> bool:
+        return f(self._value)
+
+    def unwrap(self) -> T:
+        panic(msg="Called `Result.unwrap` on an `Err` variant")
+
+    def unwrap_or(self, val: T) -> T:
+        return val
+
+    def unwrap_or_else(self, f: Callable[[E], T]) -> T:
+        return f(self._value)
+
+    def unwrap_or_default(self, default: Default[T]) -> T:
+        return default.__default__()
+
+    def unwrap_err(self) -> E:
+        return self._value
+
+    def expect(self, msg: str) -> T:
+        panic(msg=msg)
+
+    def expect_err(self, msg: str) -> E:
+        return self._value
+
+    def unwrap_or_raise(self, exc: Optional[Callable[[E], BaseException]] = None) -> T:
+        if exc is not None:
+            raise exc(self._value)
+
+        if isinstance(self._value, BaseException):
+            raise self._value
+
+        raise ValueError(self._value)
+
+    def unwrap_or_return(self) -> T:
+        raise EarlyReturn(self)
+
+    def origin(self) -> Option[tuple[Frame, ...]]:
+        from .option import NONE, Some
+
+        origin = _sampling._lookup(self)
+
+        return NONE if origin is None else Some(tuple(origin))
+
+    def contains(self, val: U) -> bool:
+        return False
+
+    def contains_err(self, val: F) -> bool:
+        return self._value == val
+
+    def map(self, f: Callable[[T], U]) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else(self, default: Callable[[E], U], f: Callable[[T], U]) -> U:
+        return default(self._value)
+
+    def map_err(self, f: Callable[[E], F]) -> Result[T, F]:
+        return Err(f(self._value))
+
+    def and_then(self, f: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    def or_else(self, f: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        return f(self._value)
+
+    def inspect(self, f: Callable[[T], None]) -> Result[T, E]:
+        return self
+
+    def inspect_err(self, f: Callable[[E], None]) -> Result[T, E]:
+        f(self._value)
+
+        return self
+
+    def iter(self) -> Iterator[T]:
+        return iter(())
+
+    def iter_err(self) -> Iterator[E]:
+        return iter((self._value,))
+
+
+# Build variants without going through `__init__`, for hot paths such as
+# `Result.from_call` where construction dominates the cost
+_new = object.__new__
+_set_value = Result.__dict__["_value"].__set__
+
+
+def _new_ok(val: Any) -> Result[Any, Any]:
+    r = _new(Ok)
+    _set_value(r, val)
+
+    return r
+
+
+def _new_err(val: Any) -> Result[Any, Any]:
+    r = _new(Err)
+    _set_value(r, val)
+
+    if _sampling._every and _sampling._due():
+        _sampling._record(r, _sampling._capture())
+
+    return r
+
+
+# Interned instances keep their payload alive, so its id cannot be reused
+_OK_INTERNED: dict[int, Result[Any, Any]] = {}
+_ERR_INTERNED: dict[int, Result[Any, Any]] = {}
 
-        return
+Result.intern_ok(None, True, False)
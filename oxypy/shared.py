@@ -0,0 +1,229 @@
+"""
+`OptionArray` and `ResultArray` backed by `multiprocessing.shared_memory`
+
+Every column lives in one shared memory block, so pickling an array
+only sends a small `SharedDescriptor` and the receiving process attaches
+to the same memory. Workers can fill disjoint slices in place with
+`fill_some`/`fill_ok`/`fill_err`, and the owner sees the writes without
+any copying
+
+The process that calls `create` owns the block and should `unlink` it
+once every process is done, other processes only `close` it. Attaching
+processes should be started through `multiprocessing` by the owner, so
+they share its resource tracker
+
+Requires NumPy, installed with the `numpy` extra
+"""
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "oxypy.shared requires NumPy, install it with `pip install oxypy[numpy]`"
+    ) from e
+
+from .array import OptionArray, ResultArray
+
+__all__ = ["SharedDescriptor", "SharedOptionArray", "SharedResultArray"]
+
+_ALIGN = 64
+
+
+class SharedDescriptor(NamedTuple):
+    """Identifies a shared array, small enough to send to other processes"""
+    name: str
+    length: int
+    dtypes: tuple[str, ...]
+
+
+def _layout(length: int, dtypes: tuple[Any, ...]) -> tuple[list[int], int]:
+    # Columns start on cache line boundaries, so workers filling
+    # neighbouring columns never write to the same line
+    offsets = []
+    size = 0
+
+    for dtype in dtypes:
+        offsets.append(size)
+        size += -(-length * np.dtype(dtype).itemsize // _ALIGN) * _ALIGN
+
+    return offsets, max(size, 1)
+
+
+def _columns(shm: Any, length: int, dtypes: tuple[Any, ...]) -> list[np.ndarray]:
+    offsets, _ = _layout(length, dtypes)
+
+    return [
+        np.ndarray((length,), dtype=dtype, buffer=shm.buf, offset=offset)
+        for dtype, offset in zip(dtypes, offsets)
+    ]
+
+
+def _create(length: int, dtypes: tuple[Any, ...]) -> tuple[Any, list[np.ndarray]]:
+    _, size = _layout(length, dtypes)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+
+    return shm, _columns(shm, length, dtypes)
+
+
+def _attach(descriptor: SharedDescriptor) -> tuple[Any, list[np.ndarray]]:
+    # Processes started by `multiprocessing` share the owner's resource
+    # tracker, so attaching registers the block a second time harmlessly
+    shm = shared_memory.SharedMemory(name=descriptor.name)
+
+    return shm, _columns(shm, descriptor.length, descriptor.dtypes)
+
+
+class SharedOptionArray(OptionArray):
+    """
+    An `OptionArray` whose values and mask live in shared memory
+
+    Elements start as `None`
+    """
+
+    __slots__ = ("_shm", "_descriptor")
+
+    _shm: Any
+    _descriptor: SharedDescriptor
+
+    def __init__(self, shm: Any, descriptor: SharedDescriptor, columns: list[np.ndarray]) -> None:
+        super().__init__(*columns)
+        self._shm = shm
+        self._descriptor = descriptor
+
+    def __reduce__(self):
+        return (SharedOptionArray.attach, (self._descriptor,))
+
+    def __enter__(self) -> SharedOptionArray:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    @classmethod
+    def create(cls, length: int, dtype: Any = np.float64) -> SharedOptionArray:
+        """Allocates a new shared array of `None` elements"""
+        dtypes = (np.dtype(dtype).str, np.dtype(np.bool_).str)
+        shm, columns = _create(length, dtypes)
+        columns[1][:] = False
+
+        return cls(shm, SharedDescriptor(shm.name, length, dtypes), columns)
+
+    @classmethod
+    def attach(cls, descriptor: SharedDescriptor) -> SharedOptionArray:
+        """Attaches to a shared array created by another process"""
+        shm, columns = _attach(descriptor)
+
+        return cls(shm, descriptor, columns)
+
+    @property
+    def descriptor(self) -> SharedDescriptor:
+        """The descriptor other processes can `attach` with"""
+        return self._descriptor
+
+    def fill_some(self, index: Any, values: Any) -> None:
+        """Writes `Some` values into a slice or index array in place"""
+        self._values[index] = values
+        self._mask[index] = True
+
+    def fill_none(self, index: Any) -> None:
+        """Marks a slice or index array as `None` in place"""
+        self._mask[index] = False
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, the array can't be used afterwards
+
+        Views of the columns taken from this array must be released first
+        """
+        self._values = self._mask = np.empty(0)
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Closes the array and frees the shared memory, called by the owner"""
+        self.close()
+        self._shm.unlink()
+
+
+class SharedResultArray(ResultArray):
+    """
+    A `ResultArray` whose columns and tag mask live in shared memory
+
+    Elements start as `Err` with a zeroed err value
+    """
+
+    __slots__ = ("_shm", "_descriptor")
+
+    _shm: Any
+    _descriptor: SharedDescriptor
+
+    def __init__(self, shm: Any, descriptor: SharedDescriptor, columns: list[np.ndarray]) -> None:
+        super().__init__(*columns)
+        self._shm = shm
+        self._descriptor = descriptor
+
+    def __reduce__(self):
+        return (SharedResultArray.attach, (self._descriptor,))
+
+    def __enter__(self) -> SharedResultArray:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    @classmethod
+    def create(
+        cls,
+        length: int,
+        ok_dtype: Any = np.float64,
+        err_dtype: Any = np.int64,
+    ) -> SharedResultArray:
+        """
+        Allocates a new shared array
+
+        String errors need a fixed width dtype such as `"U32"`
+        """
+        dtypes = (np.dtype(ok_dtype).str, np.dtype(err_dtype).str, np.dtype(np.bool_).str)
+        shm, columns = _create(length, dtypes)
+        columns[2][:] = False
+
+        return cls(shm, SharedDescriptor(shm.name, length, dtypes), columns)
+
+    @classmethod
+    def attach(cls, descriptor: SharedDescriptor) -> SharedResultArray:
+        """Attaches to a shared array created by another process"""
+        shm, columns = _attach(descriptor)
+
+        return cls(shm, descriptor, columns)
+
+    @property
+    def descriptor(self) -> SharedDescriptor:
+        """The descriptor other processes can `attach` with"""
+        return self._descriptor
+
+    def fill_ok(self, index: Any, values: Any) -> None:
+        """Writes `Ok` values into a slice or index array in place"""
+        self._ok[index] = values
+        self._is_ok[index] = True
+
+    def fill_err(self, index: Any, values: Any) -> None:
+        """Writes `Err` values into a slice or index array in place"""
+        self._err[index] = values
+        self._is_ok[index] = False
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, the array can't be used afterwards
+
+        Views of the columns taken from this array must be released first
+        """
+        self._ok = self._err = self._is_ok = np.empty(0)
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Closes the array and frees the shared memory, called by the owner"""
+        self.close()
+        self._shm.unlink()
@@ -1,4 +1,6 @@
-__all__ = ["NULL"]
+from typing import Any
+
+__all__ = ["NULL", "EarlyReturn"]
 
 
 class Null:
@@ -10,3 +12,21 @@ NULL = Null()
 
 Null.__new__ = lambda cls: Exception("Cannot create NULL")  # type: ignore
 del Null
+
+
+class EarlyReturn(BaseException):
+    """
+    Raised by `unwrap_or_return` on an `Err` or `None` and caught by the
+    nearest enclosing `try_block` call, which returns the carried value
+
+    Derives from `BaseException` so `except Exception` doesn't swallow it
+    """
+
+    # No `__init__`, the value is kept in `args`, which is cheaper to raise
+
+    @property
+    def value(self) -> Any:
+        return self.args[0]
+
+    def __str__(self) -> str:
+        return "`unwrap_or_return` called outside of a `try_block`"
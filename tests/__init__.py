@@ -1,3 +1,18 @@
-__all__ = ["test_either", "test_option", "test_result"]
+import sys
 
-from . import test_either, test_option, test_result
+__all__ = [
+    "test_aio", "test_array", "test_cache", "test_codec", "test_collect", "test_diskcache",
+    "test_either", "test_import", "test_instrument", "test_iter", "test_memory", "test_option",
+    "test_origin", "test_panic", "test_parallel", "test_pipe", "test_result", "test_shared",
+]
+
+from . import (
+    test_aio, test_array, test_cache, test_codec, test_collect, test_diskcache,
+    test_either, test_import, test_instrument, test_iter, test_memory, test_option,
+    test_origin, test_panic, test_parallel, test_pipe, test_result, test_shared,
+)
+
+if sys.version_info >= (3, 10):
+    from . import test_match  # noqa: F401
+
+    __all__.append("test_match")
@@ -0,0 +1,157 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from oxypy import (
+    NONE, AsyncOption, AsyncResult, Err, Ok, Option, Result,
+    first_ok, join_all_settled, try_join_all, try_select,
+)
+
+
+async def double(x: int) -> int:
+    await asyncio.sleep(0)
+
+    return x * 2
+
+
+async def fetch(x: int) -> int:
+    if x < 0:
+        raise ValueError(x)
+
+    return x
+
+
+async def check(x: int) -> Result[int, str]:
+    return Ok(x) if x < 10 else Err("too big")
+
+
+def test_async_result() -> None:
+    async def main() -> None:
+        assert await Result.from_awaitable(fetch(2)).map(double).and_then(check) == Ok(4)
+        assert await Result.from_awaitable(fetch(6)).map(double).and_then(check) == Err("too big")
+
+        err = await Result.from_awaitable(fetch(-1)).map(double).map_err(type)
+
+        assert err == Err(ValueError)
+
+        seen = []
+        res = await (
+            AsyncResult(Result.err("bad"))
+            .inspect_err(seen.append)
+            .or_else(lambda e: Ok(len(e)))
+            .map(str)
+        )
+
+        assert res == Ok("3") and seen == ["bad"]
+
+    asyncio.run(main())
+
+
+def test_async_option() -> None:
+    async def main() -> None:
+        opt = await AsyncOption(Option.some(2)).map(double).filter(lambda x: x > 1)
+
+        assert opt == Option.some(4)
+        assert await AsyncOption(Option.some(2)).filter(lambda x: x > 5) is NONE
+
+        async def default() -> Option[int]:
+            return Option.some(0)
+
+        assert await AsyncOption(Option.none()).or_else(default) == Option.some(0)
+
+    asyncio.run(main())
+
+
+async def delayed(value: Result[int, str], delay: float, log: list) -> Result[int, str]:
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        log.append(("cancelled", value))
+        raise
+
+    return value
+
+
+def test_awaitable_returning_steps() -> None:
+    class Checker:
+        async def __call__(self, x: int) -> Result[int, str]:
+            return await check(x)
+
+    async def main() -> None:
+        ok = AsyncResult(Result.ok(2))
+
+        assert await ok.and_then(lambda x: check(x)) == Ok(2)
+        assert await ok.and_then(partial(check)).map(lambda x: double(x)) == Ok(4)
+        assert await ok.and_then(Checker()) == Ok(2)
+        assert await ok.and_then(lambda x: AsyncResult(check(x * 10))) == Err("too big")
+        assert await AsyncOption(Option.some(2)).map(lambda x: double(x)) == Option.some(4)
+
+        with pytest.raises(TypeError, match="Expected a Result"):
+            await ok.and_then(lambda x: x)
+
+        with pytest.raises(TypeError, match="Expected an Option"):
+            await AsyncOption(Option.some(2)).and_then(check)
+
+    asyncio.run(main())
+
+
+def test_try_join_all() -> None:
+    async def main() -> None:
+        log: list = []
+
+        oks = await try_join_all(delayed(Ok(i), 0.01 * (3 - i), log) for i in range(3))
+
+        assert oks == Ok([0, 1, 2])
+
+        res = await try_join_all([
+            delayed(Ok(1), 0.0, log),
+            delayed(Err("bad"), 0.01, log),
+            delayed(Ok(3), 10, log),
+        ])
+
+        assert res == Err("bad")
+        assert log == [("cancelled", Ok(3))]
+
+    asyncio.run(main())
+
+
+def test_limit() -> None:
+    async def main() -> None:
+        running = peak = 0
+
+        async def job(i: int) -> Result[int, str]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+            return Ok(i)
+
+        assert await try_join_all((job(i) for i in range(20)), limit=3) == Ok(list(range(20)))
+        assert peak == 3
+
+    asyncio.run(main())
+
+
+def test_settled_and_select() -> None:
+    async def main() -> None:
+        log: list = []
+
+        settled = await join_all_settled([fetch(1), fetch(-1), check(20)])
+
+        assert settled[0] == Ok(1) and settled[2] == Err("too big")
+        assert isinstance(settled[1].unwrap_err(), ValueError)
+
+        first = await first_ok([delayed(Err("a"), 0.0, log), delayed(Ok(2), 0.01, log)])
+
+        assert first == Ok(2)
+        assert await first_ok([check(10), check(11)]) == Err(["too big", "too big"])
+
+        selected = await try_select([delayed(Err("a"), 0.0, log), delayed(Ok(2), 10, log)])
+
+        assert selected == Err("a")
+        assert log == [("cancelled", Ok(2))]
+
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+import pytest
+
+from oxypy import NONE, Err, Ok, Option, Result
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    from oxypy.array import OptionArray, ResultArray
+
+pytestmark = pytest.mark.skipif(np is None, reason="requires numpy")
+
+
+def test_option_array() -> None:
+    options = [Option.some(1.0), Option.none(), Option.some(4.0)]
+    arr = OptionArray.from_options(options)
+
+    assert arr.to_options() == options
+    assert arr.is_some().tolist() == [True, False, True]
+    assert arr.unwrap_or(-1.0).tolist() == [1.0, -1.0, 4.0]
+    assert arr[1] is NONE and arr[2] == Option.some(4.0)
+
+    assert arr.map(np.sqrt).to_options() == [Option.some(1.0), NONE, Option.some(2.0)]
+    assert arr.map(lambda v: v * 2).unwrap_or(0).tolist() == [2.0, 0.0, 8.0]
+    assert arr.filter(lambda v: v > 2).to_options() == [NONE, NONE, Option.some(4.0)]
+    assert arr.zip_with(arr, np.add).unwrap_or(0).tolist() == [2.0, 0.0, 8.0]
+
+    with pytest.raises(SystemExit):
+        arr.unwrap()
+
+
+def test_result_array() -> None:
+    results: list[Result[int, str]] = [Ok(1), Err("bad"), Ok(3)]
+    arr = ResultArray.from_results(results)
+
+    assert arr.to_results() == results
+    assert arr.is_err().tolist() == [False, True, False]
+    assert arr.map(np.negative).unwrap_or(0).tolist() == [-1, 0, -3]
+    assert arr.map_err(np.char.upper)[1] == Err("BAD")
+
+    ok, err = arr.partition()
+
+    assert ok.tolist() == [1, 3] and err.tolist() == ["bad"]
+    assert arr.ok().to_options() == [Option.some(1), NONE, Option.some(3)]
+    assert OptionArray.from_options(arr.ok()).ok_or("missing")[1] == Err("missing")
+
+
+def test_masked_arrays_share_memory() -> None:
+    values = np.arange(4.0)
+    masked = OptionArray(values, [True, False, True, True]).to_masked()
+
+    assert masked.tolist() == [0.0, None, 2.0, 3.0]
+    assert np.shares_memory(masked, values)
+
+    arr = OptionArray.from_masked(masked)
+
+    assert np.shares_memory(arr.values, values)
+    assert arr.is_none().tolist() == [False, True, False, False]
+
+    res = ResultArray.from_masked(masked, err=-1)
+
+    assert res.to_results() == [Ok(0.0), Err(-1), Ok(2.0), Ok(3.0)]
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+
+from oxypy import NONE, Err, Ok, Option, Result, cache_result
+
+
+def test_cache_result_hits_and_variants() -> None:
+    calls = []
+
+    @cache_result(maxsize=2)
+    def lookup(key: str) -> Result[int, str]:
+        calls.append(key)
+        return Result.ok(len(key)) if key else Result.err("empty")
+
+    assert lookup("ab") == Ok(2) and lookup("ab") == Ok(2)
+    assert lookup("") == Err("empty") and lookup("") == Err("empty")
+    assert calls == ["ab", ""] and lookup.__name__ == "lookup"
+
+    info = lookup.cache_info()
+    assert (info.hits, info.misses, info.ok_size, info.err_size) == (2, 2, 1, 1)
+
+    lookup("a"), lookup("abc")
+    assert lookup.cache_info().evictions == 1 and lookup.cache_info().err_size == 1
+
+    lookup.cache_clear()
+    assert lookup.cache_info() == (0, 0, 0, 0, 0, 0)
+
+
+def test_cache_result_ttl_and_none() -> None:
+    calls = []
+
+    @cache_result(err_ttl=0.05, cache_none=False)
+    def find(key: int) -> Option[int]:
+        calls.append(key)
+        return Option.some(key) if key > 0 else NONE
+
+    assert find(0) is NONE and find(0) is NONE
+    assert calls == [0, 0] and find.cache_info().err_size == 0
+
+    @cache_result(err_ttl=0.05)
+    def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        return Result.err("down")
+
+    calls.clear()
+    fetch(1), fetch(1)
+    time.sleep(0.06)
+    fetch(1)
+    assert calls == [1, 1] and fetch.cache_info().expirations == 1
+
+    # A bounded cache of values with an unbounded negative cache
+    @cache_result(maxsize=1, err_maxsize=None)
+    def parse(key: int) -> Result[int, int]:
+        return Result.ok(key) if key % 2 else Result.err(key)
+
+    for key in range(10):
+        parse(key)
+
+    assert parse.cache_info().ok_size == 1 and parse.cache_info().err_size == 5
+
+    with pytest.raises(ValueError):
+        cache_result(maxsize=-1)
+
+    with pytest.raises(TypeError):
+        cache_result(_async_function)
+
+
+async def _async_function() -> None:
+    pass
+
+
+def test_cache_result_single_flight() -> None:
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @cache_result
+    def slow(key: int) -> Result[int, str]:
+        calls.append(key)
+        started.set()
+        release.wait(5)
+        return Result.ok(key)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(1))) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+
+    for t in threads[1:]:
+        t.start()
+
+    time.sleep(0.05)
+    release.set()
+
+    for t in threads:
+        t.join()
+
+    assert calls == [1] and results == [Ok(1)] * 4
+
+
+def test_cache_result_exceptions_and_methods() -> None:
+    attempts = []
+
+    @cache_result
+    def flaky(key: int) -> Result[int, str]:
+        attempts.append(key)
+
+        if len(attempts) == 1:
+            raise OSError("flaky")
+
+        return Result.ok(key)
+
+    with pytest.raises(OSError):
+        flaky(1)
+
+    assert flaky(1) == Ok(1) and attempts == [1, 1]
+
+    class Store:
+        @cache_result
+        def get(self, key: str) -> Result[str, str]:
+            return Result.ok(key.upper())
+
+    store = Store()
+    assert store.get("a") == Ok("A") and store.get(key="a") == Ok("A")
+    assert Store.get.cache_info().misses == 2
@@ -0,0 +1,85 @@
+import marshal
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from oxypy import NONE, Either, Nothing, Option, Result, set_origin_sampling
+from oxypy import codec
+
+VALUES = [
+    Option.some([1, 2]),
+    Option.none(),
+    Result.ok("ok"),
+    Result.err(ValueError("bad")),
+    Either.left(1.5),
+    Either.right(None),
+]
+
+
+def test_pickle_round_trip() -> None:
+    for value in VALUES:
+        loaded = pickle.loads(pickle.dumps(value))
+
+        assert type(loaded) is type(value)
+        assert repr(loaded) == repr(value)
+
+    assert pickle.loads(pickle.dumps(NONE)) is NONE
+    assert pickle.loads(pickle.dumps(Nothing())) is not NONE
+
+
+def test_pickle_across_processes() -> None:
+    code = "import pickle, sys; from oxypy import Result; " \
+           "sys.stdout.buffer.write(pickle.dumps(Result.ok(42)))"
+    data = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True
+    ).stdout
+
+    loaded = pickle.loads(data)
+
+    assert loaded.is_ok() is True
+    assert loaded.unwrap() == 42
+
+
+def test_dumps_loads() -> None:
+    for value in VALUES:
+        assert repr(codec.loads(codec.dumps(value))) == repr(value)
+
+    assert codec.loads(codec.dumps(Nothing())) is NONE
+    assert codec.dumps(Option.none()) == b"\x00"
+
+
+def test_dumps_many() -> None:
+    loaded = codec.loads_many(codec.dumps_many(VALUES))
+
+    assert list(map(repr, loaded)) == list(map(repr, VALUES))
+    assert loaded[1] is NONE
+    assert codec.loads_many(codec.dumps_many([])) == []
+
+
+def test_dumps_many_serializer() -> None:
+    values = [Option.some(1), Option.none(), Result.err("bad")]
+    loaded = codec.loads_many(codec.dumps_many(values, marshal), marshal)
+
+    assert list(map(repr, loaded)) == list(map(repr, values))
+
+
+def test_invalid() -> None:
+    with pytest.raises(TypeError):
+        codec.dumps(42)  # type: ignore
+
+    with pytest.raises(ValueError):
+        codec.loads(b"\x09")
+
+
+def test_decoding_is_not_sampled() -> None:
+    encoded = codec.dumps(Result.err("bad"))
+    many = codec.dumps_many([Result.err("bad")] * 3)
+    previous = set_origin_sampling(1)
+
+    try:
+        assert codec.loads(encoded).origin() is NONE
+        assert all(r.origin() is NONE for r in codec.loads_many(many))
+    finally:
+        set_origin_sampling(*previous)
@@ -0,0 +1,74 @@
+import operator
+from functools import partial, reduce
+
+import pytest
+
+from oxypy import NONE, Err, Ok, Option, Result, partition_results, traverse
+
+
+def failing_after_err():
+    yield Result.ok(1)
+    yield Result.err("bad")
+    raise AssertionError("consumed past the first Err")
+
+
+def test_collect_results() -> None:
+    assert Result.collect([Ok(1), Ok(2)]) == Ok([1, 2])
+    assert Result.collect(failing_after_err()) == Err("bad")
+    assert Result.collect(failing_after_err(), into=set) == Err("bad")
+    assert Result.collect([Ok(("a", 1)), Ok(("b", 2))], into=dict) == Ok({"a": 1, "b": 2})
+    assert Result.collect(iter([Ok(1), Ok(2)]), into=sum) == Ok(3)
+
+    with pytest.raises(TypeError):
+        Result.collect([Ok(1), 2])
+
+
+def test_collect_options() -> None:
+    assert Option.collect([Option.some(1), Option.some(2)]) == Option.some([1, 2])
+    assert Option.collect([Option.some(1), Option.none()]) is NONE
+    assert Option.collect(Option.some(c) for c in "ab").map("".join) == Option.some("ab")
+    assert Option.collect([Option.some("a"), Option.some("b")], into="".join) == Option.some("ab")
+
+
+def test_collect_reducing_into() -> None:
+    add = partial(reduce, operator.add)
+
+    assert Result.collect([Ok(1), Ok(2)], into=add) == Ok(3)
+    assert Result.collect([Err("x")], into=add) == Err("x")
+    assert Result.collect(failing_after_err(), into=add) == Err("bad")
+    assert Option.collect([NONE], into=max) is NONE
+    assert Option.collect([Option.some(1), NONE], into=max) is NONE
+    assert traverse(lambda x: Err(x), ["x"], into=add) == Err("x")
+
+    # `into` catching errors never sees the short-circuit
+    def total(values):
+        try:
+            return sum(values)
+        except Exception:
+            return -1
+
+    assert Result.collect([Ok(1), Err("x")], into=total) == Err("x")
+
+    # A nested collect over the outer values leaves the outer failure alone
+    def nested(values):
+        return Result.collect((Ok(v) for v in values), into=add).unwrap()
+
+    assert Result.collect([Ok(1), Err("x")], into=nested) == Err("x")
+
+
+def test_traverse() -> None:
+    def parse(s: str) -> Result[int, str]:
+        return Ok(int(s)) if s.isdigit() else Err(s)
+
+    assert Result.traverse(parse, ["1", "2"]) == Ok([1, 2])
+    assert Result.traverse(parse, ["1", "x", "y"]) == Err("x")
+    assert Option.traverse(lambda x: Option.some(x * 2), [1, 2]) == Option.some([2, 4])
+
+    assert traverse(parse, ["1", "x"]) == Err("x")
+    assert traverse(lambda x: Option.some(x), "ab", into="".join) == Option.some("ab")
+    assert traverse(parse, []) == Ok([])
+
+
+def test_partition_results() -> None:
+    assert partition_results([Ok(1), Err("a"), Ok(2)]) == ([1, 2], ["a"])
+    assert partition_results([]) == ([], [])
@@ -0,0 +1,122 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from oxypy import NONE, DiskCache, Err, Ok, Option, Result, disk_cache
+from oxypy.diskcache import stable_key
+
+
+def test_stable_key() -> None:
+    assert stable_key({"a": 1, "b": {2, 3}}) == stable_key({"b": {3, 2}, "a": 1})
+    assert stable_key(1, x=2.5) == stable_key(1, x=2.5)
+    assert stable_key(1) != stable_key(True) != stable_key("1") != stable_key(b"1")
+    assert stable_key((1, 2)) != stable_key([1, 2]) != stable_key(1, 2)
+    assert stable_key(Option.some(1)) != stable_key(Result.ok(1)) != stable_key(NONE)
+    assert len(stable_key()) == 16
+
+    with pytest.raises(TypeError):
+        stable_key(object())
+
+
+def test_disk_cache_get_put(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+
+    with DiskCache(path, err_ttl=0.05) as cache:
+        cache.put(b"a", Ok([1, 2]))
+        cache.put(b"b", Err("down"))
+
+        assert cache.get(b"a") == Option.some(Ok([1, 2]))
+        assert cache.get(b"missing") is NONE
+        assert len(cache) == 2
+
+        time.sleep(0.06)
+
+        assert cache.get(b"b") is NONE
+        assert cache.get_many([b"b", b"a"]) == [NONE, Option.some(Ok([1, 2]))]
+
+        with pytest.raises(TypeError):
+            cache.put(b"c", Option.some(1))  # type: ignore[arg-type]
+
+    with DiskCache(path) as reopened:
+        assert reopened.get(b"a") == Option.some(Ok([1, 2]))
+
+        reopened.clear()
+        assert len(reopened) == 0
+
+
+def test_disk_cache_bulk_and_eviction(tmp_path: Path) -> None:
+    with DiskCache(tmp_path / "cache.db", max_entries=100) as cache:
+        keys = [stable_key(i) for i in range(1500)]
+        cache.put_many((key, Ok(i)) for i, key in enumerate(keys))
+
+        assert len(cache) == 100
+
+        found = cache.get_many(keys)
+
+        assert found[:1400] == [NONE] * 1400
+        assert found[1400:] == [Option.some(Ok(i)) for i in range(1400, 1500)]
+
+
+def slow_square(x: int) -> Result[int, str]:
+    return Ok(x * x) if x >= 0 else Err("negative")
+
+
+def fill(path: Path, start: int) -> None:
+    square = disk_cache(path, namespace="square")(slow_square)
+    square.map(range(start, start + 50))
+
+
+def test_disk_cache_decorator(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    calls = []
+
+    @disk_cache(path)
+    def square(x: int) -> Result[int, str]:
+        calls.append(x)
+        return slow_square(x)
+
+    assert square(3) == Ok(9) and square(3) == Ok(9) and square(-1) == Err("negative")
+    assert calls == [3, -1] and square.__name__ == "square"
+    assert square.map([3, 4, 4, -1]) == [Ok(9), Ok(16), Ok(16), Err("negative")]
+    assert calls == [3, -1, 4, 4]
+
+    @disk_cache(square.cache)
+    def plain(x: int) -> int:
+        return x
+
+    with pytest.raises(TypeError):
+        plain(1)
+
+    cache = square.cache
+
+    class Squares:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        @disk_cache(cache, key=lambda self, x: (self.name, x))
+        def square(self, x: int) -> Result[int, str]:
+            calls.append((self.name, x))
+            return slow_square(x)
+
+        # `stable_key` can't encode `self` without a `key`
+        @disk_cache(cache)
+        def unkeyed(self, x: int) -> Result[int, str]:
+            return slow_square(x)
+
+    calls.clear()
+
+    assert Squares("a").square(5) == Ok(25) and Squares("a").square(5) == Ok(25)
+    assert Squares("b").square(5) == Ok(25) and calls == [("a", 5), ("b", 5)]
+
+    with pytest.raises(TypeError, match="stable key"):
+        Squares("a").unkeyed(5)
+
+    with ProcessPoolExecutor(2) as executor:
+        list(executor.map(fill, [path] * 4, [0, 25, 50, 75]))
+
+    shared = disk_cache(path, namespace="square")(slow_square)
+    found = shared.cache.get_many(shared.key(x) for x in range(125))
+
+    assert found == [Option.some(Ok(x * x)) for x in range(125)]
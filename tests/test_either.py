@@ -1,4 +1,4 @@
-from oxypy import Either
+from oxypy import Either, Left, Right
 
 
 def test_is_left_and_right() -> None:
@@ -18,3 +18,47 @@ def test_unwrap() -> None:
 
     assert left.unwrap_left() == 42
     assert right.unwrap_right() == "Hello World!"
+
+
+def test_immutable() -> None:
+    value = Either.left(1)
+
+    value.inner = 2  # type: ignore
+
+    assert not hasattr(value, "__dict__")
+    assert value.is_left() is True
+
+
+def test_variants() -> None:
+    left: Either[int, str] = Either.left(42)
+    right: Either[int, str] = Either.right("Hello World!")
+
+    assert isinstance(left, Left) and isinstance(left, Either)
+    assert isinstance(right, Right) and isinstance(right, Either)
+
+    assert left.either(str, len) == "42"
+    assert right.either(str, len) == 12
+    assert left.left_and_then(lambda x: x + 1).unwrap_left() == 43
+    assert right.right_and_then(len).unwrap_right() == 12
+
+
+def test_returns_self() -> None:
+    left: Either[int, str] = Either.left(42)
+    right: Either[int, str] = Either.right("Hello World!")
+
+    assert right.left_and_then(str) is right
+    assert left.right_and_then(len) is left
+
+
+def test_eq_hash_and_ordering() -> None:
+    assert Either.left(1) == Left(1)
+    assert Left(1) != Right(1)
+    assert {Left(1): "left", Right(1): "right"}[Left(1)] == "left"
+
+    assert Left(9) < Right(0)
+    assert Right(1) > Right(0)
+
+    eithers = [Right(0), Left(2), Left(1)]
+
+    assert sorted(eithers) == sorted(eithers, key=Either.sort_key)
+    assert sorted(eithers) == [Left(1), Left(2), Right(0)]
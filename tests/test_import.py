@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+
+def loaded_after(statement: str) -> set:
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    return {name for name in output.split() if name.startswith("oxypy")}
+
+
+def test_lazy_import() -> None:
+    assert loaded_after("import oxypy") == {"oxypy"}
+    assert "oxypy.option" not in loaded_after("from oxypy import Result")
+
+
+def test_lazy_attributes() -> None:
+    import oxypy
+    from oxypy.option import Option
+
+    assert oxypy.Option is Option
+    assert "Result" in dir(oxypy)
@@ -0,0 +1,97 @@
+import json
+import sys
+
+import pytest
+
+from oxypy import Either, Nothing, Ok, Option, Panic, Result, set_panic_strategy
+from oxypy import instrument
+
+
+@pytest.fixture
+def counting():
+    instrument.reset()
+    instrument.enable()
+
+    try:
+        yield
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
+def line(offset: int = 0) -> str:
+    frame = sys._getframe(1)
+
+    return f"{frame.f_code.co_filename}:{frame.f_lineno + offset}"
+
+
+def test_disabled_changes_nothing() -> None:
+    unwrap = Ok.unwrap
+    init = Ok.__init__
+    none = vars(Option)["none"]
+    nothing_init = vars(Nothing)["__init__"]
+
+    instrument.enable()
+    instrument.enable()
+    assert instrument.is_enabled() and Ok.unwrap is not unwrap
+
+    instrument.disable()
+    assert not instrument.is_enabled()
+    assert Ok.unwrap is unwrap and Ok.__init__ is init and "__init__" not in vars(Option)
+    assert vars(Option)["none"] is none and Option.none() is Option.none()
+    assert vars(Nothing)["__init__"] is nothing_init
+    assert instrument.snapshot() == {}
+
+
+def test_counts_per_call_site(counting) -> None:
+    here = line(1)
+    values = [Result.ok(i) for i in range(3)]
+    there = line(1)
+    mapped = values[0].map(str)
+
+    assert instrument.snapshot()["Result.Ok.construct"] == {here: 3, there: 1}
+
+    mapped.unwrap(), Result.err("bad").unwrap_or(0), Option.none().unwrap_or(0)
+    Either.left(1).unwrap_left()
+    snap = instrument.snapshot()
+
+    assert list(snap["Result.Ok.unwrap"].values()) == [1]
+    assert list(snap["Result.Err.fallback"].values()) == [1]
+    assert list(snap["Option.Nothing.fallback"].values()) == [1]
+    assert list(snap["Either.Left.unwrap"].values()) == [1]
+    assert json.loads(instrument.to_json()) == snap
+
+
+def test_counts_panics_and_fast_constructors(counting) -> None:
+    previous = set_panic_strategy("raise")
+
+    try:
+        with pytest.raises(Panic):
+            Result.err("bad").unwrap()
+
+        with pytest.raises(Panic):
+            Option.none().expect("missing")
+    finally:
+        set_panic_strategy(previous)
+
+    Result.from_call(int, "x", catch=(ValueError,))
+    snap = instrument.snapshot()
+
+    assert sum(snap["Result.Err.panic"].values()) == 1
+    assert sum(snap["Option.Nothing.panic"].values()) == 1
+    assert sum(snap["Result.Err.construct"].values()) == 2
+    assert all(location.startswith(__file__) for location in snap["Result.Err.panic"])
+
+    instrument.reset()
+    assert instrument.snapshot() == {}
+
+
+def test_counts_shared_instances(counting) -> None:
+    here = line(1)
+    Option.none(), Option.some(1).filter(bool).filter(lambda x: x > 1), Result.ok(True)
+    Result.ok(2), Option.some(1).zip_(Option.some(2)), Option.some(1).filter(bool)
+    snap = instrument.snapshot()
+
+    # A shared `None` or interned `Ok` counts, one built by `__init__` counts once
+    assert snap["Option.Nothing.construct"] == {here: 2}
+    assert sum(snap["Result.Ok.construct"].values()) == 2
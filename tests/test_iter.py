@@ -0,0 +1,73 @@
+import itertools
+
+import pytest
+
+from oxypy import NONE, Err, Iter, Ok, Option, Result
+
+
+def evens() -> Iter[int]:
+    return Iter(itertools.count()).filter(lambda x: x % 2 == 0)
+
+
+def test_option_and_result_iter() -> None:
+    assert list(Option.some(1)) == [1] and list(NONE) == []
+    assert list(Ok(1)) == [1] and list(Err(1)) == []
+    assert list(Err(1).iter_err()) == [1] and list(Ok(1).iter_err()) == []
+    assert [x for o in [Option.some(1), NONE, Option.some(3)] for x in o] == [1, 3]
+
+
+def test_adapters_are_lazy() -> None:
+    assert evens().map(lambda x: x * 10).take(3).collect() == [0, 20, 40]
+    assert evens().step_by(3).take(3).collect() == [0, 6, 12]
+    assert evens().chunks(2).take(2).collect() == [(0, 2), (4, 6)]
+    assert evens().windows(3).take(2).collect() == [(0, 2, 4), (2, 4, 6)]
+    assert evens().take_while(lambda x: x < 6).collect() == [0, 2, 4]
+    assert evens().skip_while(lambda x: x < 6).take(1).collect() == [6]
+    assert evens().skip(2).enumerate().take(1).collect() == [(0, 4)]
+
+    half = Iter(range(7)).filter_map(lambda x: Option.some(x // 2) if x % 2 == 0 else NONE)
+    assert half.collect() == [0, 1, 2, 3]
+
+    assert Iter([1, 2]).flat_map(lambda x: [x] * x).collect() == [1, 2, 2]
+    assert Iter([Ok(1), Err(2), Ok(3)]).flat_map(lambda r: r).collect() == [1, 3]
+    assert Iter(range(5)).chunks(2).collect(into=list) == [(0, 1), (2, 3), (4,)]
+    assert Iter(range(2)).windows(3).collect() == []
+    assert Iter("ab").zip(range(3)).chain([("c", 9)]).collect(into=dict) == {
+        "a": 0, "b": 1, "c": 9,
+    }
+
+    seen = []
+    assert Iter([1, 2]).inspect(seen.append).count() == 2 and seen == [1, 2]
+
+    with pytest.raises(ValueError):
+        Iter([]).chunks(0)
+
+
+def test_consumers() -> None:
+    assert evens().next() == Option.some(0)
+    assert evens().nth(2) == Option.some(4)
+    assert evens().find(lambda x: x > 5) == Option.some(6)
+    assert evens().position(lambda x: x > 5) == Option.some(3)
+    assert evens().find_map(lambda x: Option.some(-x) if x else NONE) == Option.some(-2)
+    assert Iter(range(3)).last() == Option.some(2)
+    assert Iter([]).next() is NONE and Iter([]).last() is NONE and Iter([1]).nth(1) is NONE
+    assert Iter(range(4)).fold(0, lambda a, x: a + x) == 6
+    assert Iter(range(5)).partition(lambda x: x % 2) == ([1, 3], [0, 2, 4])
+    assert Iter(range(3)).any(lambda x: x == 2) and not Iter(range(3)).all(lambda x: x)
+
+
+def test_short_circuiting() -> None:
+    def add_small(acc: int, x: int) -> Result[int, str]:
+        return Ok(acc + x) if x < 3 else Err(f"{x} too big")
+
+    assert Iter(range(3)).try_fold(0, add_small) == Ok(3)
+    assert evens().try_fold(0, add_small) == Err("4 too big")
+
+    seen = []
+
+    def record(x: int) -> Result[None, int]:
+        seen.append(x)
+        return Err(x) if x == 4 else Ok(None)
+
+    assert evens().try_for_each(record) == Err(4) and seen == [0, 2, 4]
+    assert Iter(range(2)).try_for_each(record) == Ok(None)
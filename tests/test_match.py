@@ -0,0 +1,50 @@
+from oxypy import NONE, Either, Err, Nothing, Ok, Option, Result, Some
+from oxypy.either import Left, Right
+
+
+def describe(value: object) -> str:
+    match value:
+        case Ok(v):
+            return f"ok {v}"
+        case Err(e):
+            return f"err {e}"
+        case Some(v):
+            return f"some {v}"
+        case Nothing():
+            return "none"
+        case Left(v):
+            return f"left {v}"
+        case Right(v):
+            return f"right {v}"
+        case _:
+            return "other"
+
+
+def test_match_variants() -> None:
+    assert describe(Result.ok(1)) == "ok 1"
+    assert describe(Result.err("bad")) == "err bad"
+    assert describe(Option.some(2)) == "some 2"
+    assert describe(NONE) == "none"
+    assert describe(Either.left(3)) == "left 3"
+    assert describe(Either.right(4)) == "right 4"
+    assert describe(5) == "other"
+
+
+def test_match_nested() -> None:
+    match Ok(Option.some((1, 2))):
+        case Ok(Some((a, b))):
+            assert (a, b) == (1, 2)
+        case _:
+            raise AssertionError("nested pattern didn't match")
+
+    match Err(NONE):
+        case Err(Nothing()):
+            pass
+        case _:
+            raise AssertionError("nested None didn't match")
+
+
+def test_isinstance_still_works() -> None:
+    assert isinstance(Ok(1), Result) and not isinstance(Ok(1), Err)
+    assert isinstance(NONE, Option) and not isinstance(NONE, Some)
+    assert issubclass(Left, Either) and not issubclass(Left, Result)
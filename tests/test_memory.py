@@ -0,0 +1,16 @@
+from benchmarks import memory
+
+
+def test_within_budget() -> None:
+    report = memory.measure(size=20_000, sample=20_000)
+
+    assert memory.check(report, memory.load_budget()) == []
+
+
+def test_check_flags_growth() -> None:
+    budget = {"bytes_per_instance": {"ok": 40.0}}
+
+    assert memory.check({"bytes_per_instance": {"ok": 42.0}}, budget) == []
+    assert memory.check({"bytes_per_instance": {"ok": 48.0}}, budget) == [
+        ("bytes_per_instance", "ok", 48.0, 40.0)
+    ]
@@ -1,4 +1,6 @@
-from oxypy import Option
+import pytest
+
+from oxypy import NONE, Nothing, Option, Some
 
 
 def test_is_none_and_some() -> None:
@@ -16,3 +18,93 @@ def test_unwrap() -> None:
     some_opt = Option.some(100)
 
     assert some_opt.unwrap() == 100
+
+
+def test_immutable() -> None:
+    value = Option.some(1)
+
+    value.inner = 2  # type: ignore
+
+    assert not hasattr(value, "__dict__")
+    assert value.is_some() is True
+
+
+def test_variants() -> None:
+    some_opt = Option.some(1)
+    none_opt = Option.none()
+
+    assert isinstance(some_opt, Some) and isinstance(some_opt, Option)
+    assert isinstance(none_opt, Nothing) and isinstance(none_opt, Option)
+
+    assert some_opt.map(lambda x: x + 1).filter(lambda x: x > 1).unwrap() == 2
+    assert none_opt.map(lambda x: x + 1).is_none() is True
+    assert some_opt.and_then(lambda _: Option.none()).is_none() is True
+    assert some_opt.ok_or("missing").unwrap() == 1
+    assert none_opt.ok_or("missing").unwrap_err() == "missing"
+    assert list(some_opt.iter()) == [1]
+    assert list(none_opt.iter()) == []
+
+
+def test_take_and_replace() -> None:
+    opt = Option.some(1)
+
+    assert opt.take().unwrap() == 1
+    assert opt.is_none() is True
+
+    assert opt.replace(2).is_none() is True
+    assert opt.unwrap() == 2
+
+    opt = Some(3).take()
+    assert opt.get_or_insert(4) == 3
+
+
+def test_shared_none() -> None:
+    assert Option.none() is NONE
+    assert Option.some(1).filter(lambda x: x > 1) is NONE
+    assert Nothing() is not NONE
+
+    with pytest.raises(TypeError, match="shared `None`"):
+        Option.none().get_or_insert(1)
+
+    with pytest.raises(TypeError, match="shared `None`"):
+        Option.none().replace(1)
+
+    assert NONE.is_none() is True
+
+    # The default is a `None` of its own that can be filled in
+    default = Option.__default__()
+
+    assert default is not NONE and default.get_or_insert(1) == 1 and default == Some(1)
+    assert NONE.is_none() is True
+
+
+def test_returns_self() -> None:
+    some_opt = Option.some(1)
+    none_opt = Nothing()
+
+    assert some_opt.inspect(print) is some_opt
+    assert some_opt.filter(lambda x: x == 1) is some_opt
+    assert some_opt.or_(Option.some(2)) is some_opt
+    assert some_opt.or_else(lambda: Option.some(2)) is some_opt
+    assert none_opt.map(str) is none_opt
+
+
+def test_eq_hash_and_ordering() -> None:
+    assert Option.some(1) == Option.some(1)
+    assert Option.some(1) != Option.some(2)
+    assert Option.none() == Nothing()
+    assert Option.some(None) != Option.none()
+    assert len({Option.some(1), Option.some(1), Option.none(), Nothing()}) == 2
+
+    assert Option.none() < Option.some(0) < Option.some(1)
+    assert Option.some(1) >= Option.some(1) > Option.none()
+    assert Option.none() <= Nothing()
+
+    assert Option.some(1).__par_ord__(Option.none()) == 1
+    assert Option.none().__par_ord__(Nothing()) == 0
+    assert Option.some(1).__par_ord__(Option.some("a")) is None
+
+    options = [Option.some(3), Option.none(), Option.some(1)]
+
+    assert sorted(options) == sorted(options, key=Option.sort_key)
+    assert sorted(options) == [Option.none(), Option.some(1), Option.some(3)]
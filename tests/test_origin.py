@@ -0,0 +1,130 @@
+import copy
+import pickle
+import sys
+
+import pytest
+
+from oxypy import NONE, Err, Nothing, Ok, Option, Result, returns_result, set_origin_sampling
+from oxypy import origin, result
+from oxypy.origin import Frame, get_origin_sampling
+
+
+@pytest.fixture
+def sampling():
+    previous = set_origin_sampling(1, depth=2)
+
+    try:
+        yield
+    finally:
+        set_origin_sampling(*previous)
+
+
+def make_err() -> Result[int, str]:
+    return Result.err("bad")
+
+
+def test_off_by_default() -> None:
+    assert get_origin_sampling() == (0, 1, 1024)
+    assert Err("bad").origin() is NONE and Nothing().origin() is NONE
+    assert repr(Err("bad")) == "Err('bad')" and Option.none() is NONE
+
+
+def test_captures_origin(sampling) -> None:
+    err = make_err()
+    frames = err.origin().unwrap()
+
+    assert len(frames) == 2 and isinstance(frames[0], Frame)
+    assert frames[0].function == "make_err" and frames[1].function == "test_captures_origin"
+    assert frames[0].filename == __file__
+    assert repr(err).startswith("Err('bad') (created at ") and "make_err" in repr(err)
+    assert err == Err("bad") and hash(err) == hash(Err("bad"))
+    assert Ok(1).origin() is NONE and Option.some(1).origin() is NONE
+
+    none = Nothing()
+
+    assert none == NONE and none.is_none()
+    assert none.origin().unwrap()[0].function == "test_captures_origin"
+    assert repr(none).startswith("None (created at ")
+
+    # The shared instance is returned unchanged and never sampled
+    assert Option.none() is NONE and NONE.origin() is NONE
+
+    with pytest.raises(TypeError):
+        Option.none().get_or_insert(5)
+
+    @returns_result
+    def fail() -> int:
+        raise ValueError("failed")
+
+    assert fail().origin().is_some()
+
+
+def test_sampling_rate_and_take(sampling) -> None:
+    set_origin_sampling(3)
+    errs = [Err(i) for i in range(9)]
+
+    assert [e.origin().is_some() for e in errs] == [True, False, False] * 3
+
+    set_origin_sampling(1)
+    opt = Option.some(1)
+    opt.take()
+
+    # A value left over from `take` is not mistaken for an origin
+    assert opt.is_none() and opt.origin() is NONE
+
+    with pytest.raises(ValueError):
+        set_origin_sampling(-1)
+
+
+def test_err_layout(sampling) -> None:
+    # Origins live in a side table, so a sampled `Err` keeps its layout
+    assert Err.__slots__ == () and sys.getsizeof(Err(1)) == sys.getsizeof(Ok(1))
+
+    set_origin_sampling(1, keep=3)
+    errs = [Err(i) for i in range(4)]
+
+    # Only the latest samples are kept
+    assert [e.origin().is_some() for e in errs] == [False, True, True, True]
+
+    set_origin_sampling(1, keep=1)
+
+    assert [e.origin().is_some() for e in errs] == [False, False, False, True]
+
+    set_origin_sampling(1, keep=None)
+    errs = [Err(i) for i in range(2000)]
+
+    assert all(e.origin().is_some() for e in errs)
+
+    # Turning sampling off forgets every origin and releases the values
+    set_origin_sampling(0)
+
+    assert errs[-1].origin() is NONE and not origin._table
+
+    with pytest.raises(ValueError):
+        set_origin_sampling(1, keep=0)
+
+
+def test_copy_and_pickle_keep_origin(sampling) -> None:
+    set_origin_sampling(0)
+    plain_err, plain_none = Err("bad"), Nothing()
+    set_origin_sampling(1)
+    err, none = make_err(), Nothing()
+
+    for copier in (copy.copy, copy.deepcopy, lambda v: pickle.loads(pickle.dumps(v))):
+        before = origin._countdown
+
+        assert copier(err) == err and copier(err).origin() == err.origin()
+        assert copier(none).is_none() and copier(none).origin() == none.origin()
+        # Unsampled values stay unsampled, and copies don't use up samples
+        assert copier(plain_err).origin() is NONE and copier(plain_none).origin() is NONE
+        assert origin._countdown == before
+
+    assert pickle.loads(pickle.dumps(NONE)) is NONE
+
+    value = object()
+    Result.intern_err(value)
+
+    try:
+        assert Result.err(value).origin() is NONE
+    finally:
+        del result._ERR_INTERNED[id(value)]
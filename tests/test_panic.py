@@ -0,0 +1,88 @@
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from oxypy import NONE, Err, Ok, Option, Result
+from oxypy.panic import Panic, catch_panic, get_panic_strategy, set_panic_strategy
+
+
+@pytest.fixture
+def strategy():
+    previous = get_panic_strategy()
+    yield set_panic_strategy
+    set_panic_strategy(previous)
+
+
+def test_exit_by_default() -> None:
+    with pytest.raises(SystemExit):
+        Option.none().unwrap()
+
+
+def test_raise(strategy) -> None:
+    strategy("raise")
+
+    with pytest.raises(Panic, match="on a `None` value"):
+        Option.none().unwrap()
+
+
+def test_log_and_hook(strategy, caplog) -> None:
+    strategy("log")
+
+    with caplog.at_level(logging.ERROR, logger="oxypy"):
+        with pytest.raises(Panic):
+            Result.err("bad").unwrap()
+
+    assert "Panicked" in caplog.text
+
+    seen = []
+    strategy(seen.append)
+
+    with pytest.raises(Panic):
+        Result.ok(1).unwrap_err()
+
+    assert seen == ["Called `Result.unwrap_err` on an `Ok` variant"]
+
+    with pytest.raises(ValueError):
+        strategy("ignore")
+
+
+@pytest.mark.parametrize("continuing", ["log", print])
+def test_continuing_strategies_stop_the_panicking_method(strategy, continuing) -> None:
+    strategy(continuing)
+
+    with pytest.raises(Panic):
+        Option.none().unwrap()
+
+    with pytest.raises(TypeError):
+        Option.none().get_or_insert(5)
+
+    # The shared `None` is never filled in
+    assert Option.none().is_none() and Option.none() is NONE
+
+
+def test_abort() -> None:
+    code = "from oxypy.panic import *; set_panic_strategy('abort'); panic(msg='boom')"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert proc.returncode != 0 and "Panicked: boom" in proc.stderr
+
+
+def test_catch_panic(strategy) -> None:
+    assert catch_panic(lambda: Option.some(1).unwrap()) == Ok(1)
+
+    err = catch_panic(Option.none().expect, "missing")
+
+    assert isinstance(err.unwrap_err(), Panic) and err.unwrap_err().msg == "missing"
+    assert err.unwrap_err().__traceback__ is not None
+    assert get_panic_strategy() == "exit"
+
+    strategy("exit", traceback=False)
+
+    assert catch_panic(Option.none().unwrap).unwrap_err().__traceback__ is None
+
+    with pytest.raises(ZeroDivisionError):
+        catch_panic(lambda: 1 / 0)
+
+    assert isinstance(catch_panic(lambda: Err(1)), Ok)
@@ -0,0 +1,63 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from oxypy import Err, Ok, Option
+from oxypy.panic import Panic
+from oxypy.parallel import par_map
+
+
+def risky(x: int):
+    if x == 3:
+        raise ValueError(x)
+
+    if x == 5:
+        Option.none().unwrap()
+
+    return Ok(x * 2) if x % 2 else x
+
+
+def check(results: list) -> None:
+    assert results[:3] == [Ok(0), Ok(2), Ok(2)]
+    assert isinstance(results[3].unwrap_err(), ValueError)
+    assert isinstance(results[5].unwrap_err(), Panic)
+    assert results[6:] == [Ok(6), Ok(14)]
+
+
+def test_thread_pool() -> None:
+    check(list(par_map(risky, range(8))))
+    check(list(par_map(risky, range(8), chunksize=3)))
+
+    unordered = list(par_map(risky, range(8), ordered=False))
+
+    assert sorted(map(repr, unordered)) == sorted(map(repr, par_map(risky, range(8))))
+
+
+def test_process_pool() -> None:
+    with ProcessPoolExecutor(2) as executor:
+        check(list(par_map(risky, range(8), executor=executor)))
+
+
+def test_unbounded_input() -> None:
+    results = par_map(lambda x: x, itertools.count(), max_pending=2)
+
+    assert list(itertools.islice(results, 5)) == [Ok(0), Ok(1), Ok(2), Ok(3), Ok(4)]
+
+    results.close()
+
+    with pytest.raises(ValueError):
+        par_map(risky, [], chunksize=0)
+
+
+def unpicklable(x: int):
+    return Ok(lambda: x)
+
+
+def test_failing_chunk() -> None:
+    assert list(par_map(Err, [1, 2])) == [Err(1), Err(2)]
+
+    with ProcessPoolExecutor(1) as executor:
+        results = list(par_map(unpicklable, [1, 2], executor=executor, chunksize=2))
+
+    assert [r.is_err() for r in results] == [True, True]
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from oxypy import NONE, Either, Err, Left, Ok, Option, Result, Right
+
+
+def test_option_pipe() -> None:
+    pipe = (
+        Option.pipe()
+        .map(lambda x: x + 1)
+        .filter(lambda x: x % 2 == 0)
+        .and_then(lambda x: Option.some(x // 2))
+    )
+
+    assert pipe(Option.some(3)) == Option.some(2)
+    assert pipe(Option.some(2)) is NONE
+    assert pipe.batch([Option.some(1), Option.none()]) == [Option.some(1), NONE]
+
+    recover = pipe.or_else(lambda: Option.some(0))
+
+    assert recover(Option.some(2)) == Option.some(0)
+    assert pipe.map(str)(Option.some(3)) == Option.some("2")
+
+
+def test_returns_input_when_unchanged() -> None:
+    some = Option.some(4)
+    err: Result[int, str] = Result.err("bad")
+
+    assert Option.pipe().filter(lambda x: x > 0).inspect(print)(some) is some
+    assert Result.pipe().map(str).and_then(Ok)(err) is err
+
+
+def test_result_pipe() -> None:
+    pipe = (
+        Result.pipe()
+        .and_then(lambda x: Ok(x * 2) if x else Err("zero"))
+        .map_err(str.upper)
+        .or_else(lambda e: Ok(len(e)) if e == "ZERO" else Err(e))
+        .map(str)
+    )
+
+    assert pipe(Ok(2)) == Ok("4")
+    assert pipe(Ok(0)) == Ok("4")
+    assert pipe(Err("bad")) == Err("BAD")
+
+
+def test_either_pipe() -> None:
+    pipe = Either.pipe().left_and_then(lambda x: x + 1).right_and_then(len)
+
+    assert pipe(Left(1)) == Left(2)
+    assert pipe(Right("abc")) == Right(3)
+
+
+def test_shared_between_threads() -> None:
+    pipe = Result.pipe().map(lambda x: x + 1)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(pipe, [Ok(i) for i in range(100)]))
+
+    assert results == [Ok(i + 1) for i in range(100)]
@@ -1,4 +1,8 @@
-from oxypy import Result
+import asyncio
+
+import pytest
+
+from oxypy import NONE, Err, Ok, Option, Result, returns_result, try_block
 
 
 def test_is_ok_and_err() -> None:
@@ -18,3 +22,163 @@ def test_unwrap() -> None:
 
     assert ok_res.unwrap() == 42
     assert err_res.unwrap_err() == "Hello World!"
+
+
+def test_immutable() -> None:
+    value = Result.ok(1)
+
+    value.inner = 2  # type: ignore
+
+    assert not hasattr(value, "__dict__")
+    assert value.is_ok() is True
+
+
+def test_variants() -> None:
+    ok_res: Result[int, str] = Result.ok(42)
+    err_res: Result[int, str] = Result.err("Hello World!")
+
+    assert isinstance(ok_res, Ok) and isinstance(ok_res, Result)
+    assert isinstance(err_res, Err) and isinstance(err_res, Result)
+
+    assert ok_res.map(lambda x: x + 1).unwrap() == 43
+    assert ok_res.map_err(len).unwrap() == 42
+    assert err_res.map(lambda x: x + 1) is err_res
+    assert err_res.map_err(len).unwrap_err() == 12
+    assert ok_res.map_or_else(len, str) == "42"
+    assert err_res.map_or_else(len, str) == 12
+
+
+def test_interned() -> None:
+    assert Result.ok(None) is Result.ok(None)
+    assert Result.ok(True) is not Result.ok(1)
+    assert Result.ok(1).unwrap() == 1
+    marker = object()
+
+    assert Result.err(marker) is not Result.err(marker)
+
+    Result.intern_err(marker)
+
+    assert Result.err(marker) is Result.err(marker)
+
+
+def test_returns_self() -> None:
+    ok_res: Result[int, str] = Result.ok(42)
+    err_res: Result[int, str] = Result.err("Hello World!")
+
+    assert ok_res.map_err(len) is ok_res
+    assert ok_res.inspect(print).inspect_err(print) is ok_res
+    assert err_res.inspect(print).inspect_err(len) is err_res
+
+
+def test_eq_hash_and_ordering() -> None:
+    assert Result.ok(1) == Ok(1)
+    assert Result.ok(1) != Result.err(1)
+    assert len({Ok(1), Ok(1), Err(1)}) == 2
+
+    assert Ok(5) < Err(0)
+    assert Err(1) > Err(0) >= Err(0)
+    assert Ok(1).__par_ord__(Ok(1)) == 0
+
+    results = [Err("b"), Ok(2), Err("a"), Ok(1)]
+
+    assert sorted(results) == sorted(results, key=Result.sort_key)
+    assert sorted(results) == [Ok(1), Ok(2), Err("a"), Err("b")]
+
+
+def test_and_then_or_else() -> None:
+    ok_res: Result[int, str] = Result.ok(2)
+    err_res: Result[int, str] = Result.err("bad")
+
+    assert ok_res.and_then(lambda x: Ok(x * 2)) == Ok(4)
+    assert ok_res.or_else(lambda e: Ok(0)) is ok_res
+    assert err_res.and_then(lambda x: Ok(x * 2)) is err_res
+    assert err_res.or_else(lambda e: Err(e.upper())) == Err("BAD")
+
+
+def test_from_call_and_unwrap_or_raise() -> None:
+    ok_res = Result.from_call(int, "42")
+    err_res = Result.from_call(int, "x", catch=(ValueError,), traceback=False)
+
+    assert ok_res == Ok(42) and ok_res.unwrap_or_raise() == 42
+    assert isinstance(err_res.unwrap_err(), ValueError)
+    assert err_res.unwrap_err().__traceback__ is None
+    assert Result.from_call(int, "x").unwrap_err().__traceback__ is not None
+
+    with pytest.raises(ZeroDivisionError):
+        Result.from_call(lambda: 1 / 0, catch=(ValueError,))
+
+    with pytest.raises(ValueError):
+        err_res.unwrap_or_raise()
+
+    with pytest.raises(KeyError):
+        Result.err("missing").unwrap_or_raise(KeyError)
+
+    with pytest.raises(ValueError, match="bad"):
+        Result.err("bad").unwrap_or_raise()
+
+
+def test_returns_result() -> None:
+    @returns_result
+    def parse(s: str) -> int:
+        return int(s)
+
+    @returns_result(catch=(KeyError,), traceback=False)
+    def lookup(key: str) -> int:
+        return {"a": 1}[key]
+
+    assert parse("1") == Ok(1) and parse.__name__ == "parse"
+    assert isinstance(parse("x").unwrap_err(), ValueError)
+    assert lookup("a") == Ok(1)
+    assert lookup("b").unwrap_err().__traceback__ is None
+
+    @returns_result
+    async def fetch(s: str) -> int:
+        return int(s)
+
+    assert asyncio.run(fetch("2")) == Ok(2)
+    assert asyncio.run(fetch("x")).is_err()
+
+
+def test_try_block() -> None:
+    def half(n: int) -> Result[int, str]:
+        return Result.ok(n // 2) if n % 2 == 0 else Result.err(f"{n} is odd")
+
+    @try_block
+    def quarter(n: int) -> Result[int, str]:
+        return half(half(n).unwrap_or_return()).unwrap_or_return()
+
+    assert quarter(8) == Ok(2) and quarter.__name__ == "quarter"
+    assert quarter(6) == Err("3 is odd")
+
+    with pytest.raises(BaseException, match="outside of a `try_block`"):
+        half(3).unwrap_or_return()
+
+    closed = []
+
+    @try_block
+    def gen_quarter(n: int):  # type: ignore[no-untyped-def]
+        try:
+            h = yield half(n)
+            q = yield half(h)
+        finally:
+            closed.append(n)
+
+        return q
+
+    assert gen_quarter(8) == Ok(2)
+    assert gen_quarter(6) == Err("3 is odd") and closed == [8, 6]
+
+    @try_block
+    def first_even(xs: list[int]) -> Option[int]:
+        x = Option.some(xs[0]) if xs else NONE
+
+        return Option.some(x.unwrap_or_return()).filter(lambda x: x % 2 == 0)
+
+    assert first_even([2]) == Option.some(2) and first_even([]) is NONE
+
+    @try_block
+    async def async_quarter(n: int) -> Result[int, str]:
+        return half(half(n).unwrap_or_return()).unwrap_or_return()
+
+    assert asyncio.run(async_quarter(8)) == Ok(2)
+    assert asyncio.run(async_quarter(6)) == Err("3 is odd")
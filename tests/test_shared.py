@@ -0,0 +1,51 @@
+import pickle
+from multiprocessing import get_context
+
+import pytest
+
+from oxypy import Err, Ok, Option
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    from oxypy.shared import SharedOptionArray, SharedResultArray
+
+pytestmark = pytest.mark.skipif(np is None, reason="requires numpy")
+
+
+def fill(args) -> None:
+    arr, start, stop = args
+    idx = np.arange(start, stop)
+
+    arr.fill_ok(idx[idx % 2 == 0], idx[idx % 2 == 0] * 10)
+    arr.fill_err(idx[idx % 2 == 1], -idx[idx % 2 == 1])
+    arr.close()
+
+
+def test_workers_fill_disjoint_slices() -> None:
+    arr = SharedResultArray.create(8, ok_dtype=np.int64)
+
+    try:
+        assert len(pickle.dumps(arr)) < 200
+
+        with get_context().Pool(2) as pool:
+            pool.map(fill, [(arr, 0, 4), (arr, 4, 8)])
+
+        assert arr[:4].to_results() == [Ok(0), Err(-1), Ok(20), Err(-3)]
+        assert arr.partition()[0].tolist() == [0, 20, 40, 60]
+    finally:
+        arr.unlink()
+
+
+def test_attach_sees_writes() -> None:
+    owner = SharedOptionArray.create(3)
+
+    try:
+        with SharedOptionArray.attach(owner.descriptor) as other:
+            other.fill_some(slice(1, 3), [1.5, 2.5])
+
+        assert owner.to_options() == [Option.none(), Option.some(1.5), Option.some(2.5)]
+    finally:
+        owner.unlink()